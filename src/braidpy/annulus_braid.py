@@ -1,3 +1,357 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at https://mozilla.org/MPL/2.0/.
+
+"""
+Filename: annulus_braid.py
+Description: Braids in an annulus, with strands on a circle and a rotation generator
+Authors: Baptiste Labat
+Created: 2026-10-19
+Repository: https://github.com/baptistelabat/braidpy
+License: Mozilla Public License 2.0
+"""
+
 # https://people.math.wisc.edu/~aekent2/annular.pdf
 # https://www.researchgate.net/publication/228456153_Cohomology_of_Artin_groups_of_type_zAn_Bn_and_applications
 # https://math.stackexchange.com/questions/4504420/braid-groups-for-ropes
+
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, Iterable, List, Sequence, Tuple
+
+import numpy as np
+
+from braidpy.braid import Braid
+from braidpy.equality import braids_equal
+from braidpy.random import concatenate_tokens
+from braidpy.utils import StrictlyPositiveInt
+
+
+def _shift(generators: np.ndarray, shift: int, n_strands: int) -> np.ndarray:
+    """Conjugate generators by τᵏ, k being the shift, σᵢ becoming σᵢ₊ₖ with indices modulo n"""
+    return np.sign(generators) * ((np.abs(generators) - 1 + shift) % n_strands + 1)
+
+
+@lru_cache(maxsize=None)
+def _rotation_generators(n_strands: StrictlyPositiveInt) -> Tuple[int, ...]:
+    """Flat word of τ, σ₁²σ₂...σₙ on n + 1 strands, the first one being the core of the annulus"""
+    return (1, 1) + tuple(range(2, n_strands + 1))
+
+
+@lru_cache(maxsize=None)
+def _flat_table(n_strands: StrictlyPositiveInt) -> Tuple[Tuple[int, ...], ...]:
+    """Flat words of σ₁, ..., σₙ, then of their inverses"""
+    rotation = list(_rotation_generators(n_strands))
+    words = [(i + 1,) for i in range(1, n_strands)]
+    # σₙ = τσₙ₋₁τ⁻¹ crosses the strands of the last and first slots
+    words.append(tuple(rotation + [n_strands] + [-g for g in reversed(rotation)]))
+    return tuple(words) + tuple(tuple(-g for g in reversed(w)) for w in words)
+
+
+@dataclass(frozen=True, eq=False)
+class AnnulusBraid:
+    """
+    Braid whose strands are on a circle, as on a kumihimo disk. Positions are numbered from 1 around the circle.
+
+    σᵢ crosses the strands at positions i and i + 1, σₙ crossing the last and the first ones.
+    τ rotates the strands by one slot, the strand at position i + 1 going to position i, and τσᵢτ⁻¹ = σᵢ₊₁.
+    The braid is stored as w.τ^rotation, as every τ can be moved to the end of the word.
+
+    Christopher Kent and David Peifer, "A geometric and algebraic description of annular braid groups",
+    International Journal of Algebra and Computation 12 (2002). https://people.math.wisc.edu/~aekent2/annular.pdf
+
+    Args:
+        generators(np.ndarray): signed indices of the σᵢ, between -n and n, stored as int16
+        n_strands(int): number of strands
+        rotation(Optional(int)): exponent of τ at the end of the word. Default to 0
+    """
+
+    generators: np.ndarray
+    n_strands: int
+    rotation: int = 0
+
+    def __post_init__(self):
+        generators = np.array(self.generators, dtype=np.int16).ravel()
+        if self.n_strands < 2:
+            raise ValueError("An annulus braid needs at least 2 strands")
+        if generators.size and (
+            np.any(generators == 0) or np.abs(generators).max() > self.n_strands
+        ):
+            raise ValueError(
+                f"Generator index out of bounds for {self.n_strands} strands"
+            )
+        generators.flags.writeable = False
+        object.__setattr__(self, "generators", generators)
+        object.__setattr__(self, "rotation", int(self.rotation))
+
+    @classmethod
+    def from_letters(
+        cls, letters: Sequence[int | str], n_strands: StrictlyPositiveInt
+    ) -> "AnnulusBraid":
+        """
+        Build a braid from a word where τ may appear anywhere
+
+        Args:
+            letters(Sequence[int | str]): signed indices of the σᵢ, and "t" or "T" for τ and τ⁻¹
+            n_strands(StrictlyPositiveInt): number of strands
+
+        Returns:
+            AnnulusBraid: the braid
+        """
+        generators, rotation = [], 0
+        for letter in letters:
+            if letter == "t":
+                rotation += 1
+            elif letter == "T":
+                rotation -= 1
+            else:
+                generators.append(int(_shift(np.array(letter), rotation, n_strands)))
+        return cls(generators, n_strands, rotation)
+
+    @classmethod
+    def from_braid(cls, braid: Braid) -> "AnnulusBraid":
+        """
+        Convert a flat braid on n + 1 strands whose first strand is fixed, the core of the annulus, see to_braid
+
+        The core position p is tracked with the word c = σ₁...σₚ₋₁ bringing it from the first position, the braid
+        being P.c. Crossings away from the core are shifted, and crossings with the core add loops around it.
+        The flat σ₁² is τσₙ₋₁⁻¹...σ₁⁻¹ in the annulus, and the flat σᵢ₊₁ is σᵢ.
+
+        Args:
+            braid(Braid): the flat braid
+
+        Returns:
+            AnnulusBraid: the braid on n strands
+        """
+        n = braid.n_strands - 1
+        if n < 2 or braid.perm()[0] != 1:
+            raise ValueError("The first strand of the flat braid should be fixed")
+        # Flat word of the braid with the generators σ₁², σ₂, ..., σₙ, "t" and "T" standing for σ₁^±2
+        flat: List[int | str] = []
+
+        def core_loop(q: int, sign: int) -> List[int | str]:
+            """Loop of the strand at position q + 1 around the core, σ_q⁻¹...σ₂⁻¹σ₁²σ₂...σ_q"""
+            twist = "t" if sign > 0 else "T"
+            return [-g for g in range(q, 1, -1)] + [twist] + list(range(2, q + 1))
+
+        core = 1
+        for g in braid.no_zero().generators:
+            j = abs(g)
+            if j < core - 1:
+                # c.σⱼ = σⱼ₊₁.c
+                flat.append(g + (1 if g > 0 else -1))
+            elif j > core:
+                flat.append(g)
+            elif j == core:
+                if g < 0:
+                    flat.extend(core_loop(core, -1))
+                core += 1
+            else:
+                core -= 1
+                if g > 0:
+                    flat.extend(core_loop(core, 1))
+
+        letters: List[int | str] = []
+        for g in flat:
+            if g == "t":
+                letters += ["t"] + list(range(-(n - 1), 0))
+            elif g == "T":
+                letters += list(range(1, n)) + ["T"]
+            else:
+                letters.append(g - 1 if g > 0 else g + 1)
+        return cls.from_letters(letters, n)
+
+    def __repr__(self) -> str:
+        return f"AnnulusBraid({self.generators.tolist()}, n_strands={self.n_strands}, rotation={self.rotation})"
+
+    def __len__(self) -> int:
+        return len(self.generators) + abs(self.rotation)
+
+    def key(self) -> tuple:
+        """Hashable key of the word"""
+        return self.n_strands, self.rotation, self.generators.tobytes()
+
+    def word_eq(self, other: "AnnulusBraid") -> bool:
+        return self.key() == other.key()
+
+    def __hash__(self):
+        return hash(self.key())
+
+    def __mul__(self, other: "AnnulusBraid") -> "AnnulusBraid":
+        """w₁τᵏ¹.w₂τᵏ² = w₁τᵏ¹(w₂)τᵏ¹⁺ᵏ², shifting the second word at once"""
+        if self.n_strands != other.n_strands:
+            raise ValueError("Braids must have the same number of strands")
+        shifted = _shift(other.generators, self.rotation, self.n_strands)
+        return AnnulusBraid(
+            np.concatenate([self.generators, shifted]),
+            self.n_strands,
+            self.rotation + other.rotation,
+        )
+
+    def inverse(self) -> "AnnulusBraid":
+        reversed_word = -self.generators[::-1]
+        return AnnulusBraid(
+            _shift(reversed_word, -self.rotation, self.n_strands),
+            self.n_strands,
+            -self.rotation,
+        )
+
+    def __pow__(self, power: int) -> "AnnulusBraid":
+        """
+        Power of the braid, the copies of the word being shifted by multiples of the rotation in one array operation
+        """
+        if power < 0:
+            return self.inverse() ** (-power)
+        shifts = np.arange(power) * self.rotation
+        words = _shift(self.generators[None, :], shifts[:, None], self.n_strands)
+        return AnnulusBraid(words.ravel(), self.n_strands, self.rotation * power)
+
+    def rotate(self, shift: int = 1) -> "AnnulusBraid":
+        """
+        Conjugate by τ^shift, the same braid seen after rotating the disk
+
+        Args:
+            shift(Optional(int)): number of slots. Default to 1
+
+        Returns:
+            AnnulusBraid: τ^shift.β.τ^-shift
+        """
+        return AnnulusBraid(
+            _shift(self.generators, shift, self.n_strands),
+            self.n_strands,
+            self.rotation,
+        )
+
+    def rotation_normal_form(self) -> Tuple["AnnulusBraid", int]:
+        """
+        Representative of the braids obtained by rotating the disk, for cheap deduplication of rotated patterns
+
+        All the n rotations of the word are built in one array, and the lexicographically smallest is kept.
+
+        Returns:
+            Tuple[AnnulusBraid, int]: the representative, and the shift s such that it is self.rotate(s)
+        """
+        shifts = np.arange(self.n_strands)
+        words = _shift(self.generators[None, :], shifts[:, None], self.n_strands)
+        if not words.shape[1]:
+            return self, 0
+        # np.lexsort sorts by the last key first
+        best = int(np.lexsort(words.T[::-1])[0])
+        return AnnulusBraid(words[best], self.n_strands, self.rotation), best
+
+    def exponent_sum(self) -> int:
+        """Sum of the exponents of the σᵢ, an invariant of the braid"""
+        return int(np.sign(self.generators).sum())
+
+    def permutation(self, power: int = 1) -> List[int]:
+        """
+        Strand at each final position, strands being numbered from 1 by their starting position as in Braid.perm
+
+        The crossings are applied once, and powers are obtained by composing the permutation with itself.
+
+        Args:
+            power(Optional(int)): power of the braid. Default to 1
+
+        Returns:
+            List[int]: the permutation of the power
+        """
+        n = self.n_strands
+        strands = list(range(1, n + 1))
+        for g in np.abs(self.generators).tolist():
+            i, j = g - 1, g % n
+            strands[i], strands[j] = strands[j], strands[i]
+        # τ brings the strand at position i + 1 to position i
+        single = np.roll(np.array(strands), -self.rotation)
+        result = np.arange(1, n + 1)
+        if power < 0:
+            single = np.argsort(single) + 1
+            power = -power
+        while power:
+            if power & 1:
+                result = result[single - 1]
+            single = single[single - 1]
+            power >>= 1
+        return result.tolist()
+
+    def invariants(self) -> Tuple[int, int, Tuple[int, ...]]:
+        """
+        Cheap conjugacy invariants, also invariant by rotation of the disk
+
+        Returns:
+            Tuple: rotation, exponent sum and sorted cycle lengths of the permutation
+        """
+        perm = self.permutation()
+        seen = [False] * self.n_strands
+        lengths = []
+        for start in range(self.n_strands):
+            length, i = 0, start
+            while not seen[i]:
+                seen[i] = True
+                i = perm[i] - 1
+                length += 1
+            if length:
+                lengths.append(length)
+        return self.rotation, self.exponent_sum(), tuple(sorted(lengths))
+
+    def to_braid(self) -> Braid:
+        """
+        Convert to a flat braid on n + 1 strands, the first strand being the core of the annulus
+
+        σᵢ becomes σᵢ₊₁ for i < n, σₙ becomes τσₙ₋₁τ⁻¹ and τ becomes σ₁²σ₂...σₙ. This is a faithful representation.
+
+        Returns:
+            Braid: the flat braid
+        """
+        n = self.n_strands
+        generators = self.generators.astype(np.int64)
+        tokens = np.where(generators > 0, generators - 1, n - generators - 1)
+        collection = concatenate_tokens(
+            _flat_table(n), tokens, np.array([len(tokens)]), n + 1
+        )
+        rotation = list(_rotation_generators(n))
+        if self.rotation < 0:
+            rotation = [-g for g in reversed(rotation)]
+        return Braid(collection[0].generators + rotation * abs(self.rotation), n + 1)
+
+    def __eq__(self, other) -> bool:
+        """
+        Check if two annulus braids are equivalent
+
+        Rotation and exponent sum are compared first, then the flat braids.
+
+        Args:
+            other(AnnulusBraid): the braid to compare with
+
+        Returns:
+            bool: True if the braid are topologically equivalent
+        """
+        if not isinstance(other, AnnulusBraid) or self.n_strands != other.n_strands:
+            return False
+        if (
+            self.rotation != other.rotation
+            or self.exponent_sum() != other.exponent_sum()
+        ):
+            return False
+        if self.word_eq(other):
+            return True
+        return braids_equal(
+            self.to_braid().generators, other.to_braid().generators, self.n_strands + 1
+        )
+
+
+def deduplicate_rotations(braids: Iterable[AnnulusBraid]) -> List[AnnulusBraid]:
+    """
+    Keep one word among the words equal up to a rotation of the disk
+
+    Args:
+        braids(Iterable[AnnulusBraid]): the braids
+
+    Returns:
+        List[AnnulusBraid]: the first braid of each rotation class, in the input order
+    """
+    seen: Dict[tuple, AnnulusBraid] = {}
+    for braid in braids:
+        key = braid.rotation_normal_form()[0].key()
+        if key not in seen:
+            seen[key] = braid
+    return list(seen.values())
@@ -0,0 +1,246 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at https://mozilla.org/MPL/2.0/.
+
+"""
+Filename: batch_rendering.py
+Description: Offline rendering of the figures of many braids in a process pool
+Authors: Baptiste Labat
+Created: 2026-10-19
+Repository: https://github.com/baptistelabat/braidpy
+License: Mozilla Public License 2.0
+"""
+
+import hashlib
+import json
+import time
+import warnings
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from braidpy.braid import Braid
+from braidpy.utils import PositiveFloat, PositiveInt, StrictlyPositiveInt
+
+MANIFEST_NAME = "manifest.json"
+
+
+@dataclass(frozen=True)
+class RenderOptions:
+    """
+    Options forwarded to braidvisualiser, see Braid.plot
+
+    -style: "comp" or "ext"
+    -line_width: thickness of the strands
+    -gap_size: space shown at crossings for undercrossing strands
+    -color: "rainbow" or a single matplotlib color letter
+    -image_format: file extension, "png" or "svg" (only png can be tiled in a contact sheet)
+    -dpi: resolution of raster images
+    """
+
+    style: str = "ext"
+    line_width: int = 3
+    gap_size: int = 3
+    color: str = "rainbow"
+    image_format: str = "png"
+    dpi: int = 100
+
+
+@dataclass
+class BatchRenderingResults:
+    """
+    -paths: output path of each braid, in the order of the input
+    -n_rendered: number of figures actually drawn
+    -n_skipped: number of figures whose cached output was still valid
+    -elapsed: wall clock time in seconds
+    """
+
+    paths: List[Path] = field(default_factory=list)
+    n_rendered: PositiveInt = 0
+    n_skipped: PositiveInt = 0
+    elapsed: PositiveFloat = 0.0
+
+
+def render_hash(braid: Braid, options: RenderOptions) -> str:
+    """
+    Hash of everything the figure of a braid depends on
+
+    Args:
+        braid(Braid): the braid
+        options(RenderOptions): rendering options
+
+    Returns:
+        str: hexadecimal digest
+    """
+    content = json.dumps(
+        [int(braid.n_strands), [int(g) for g in braid.generators], options.__dict__],
+        sort_keys=True,
+    )
+    return hashlib.sha256(content.encode()).hexdigest()
+
+
+def _render_one(task: Tuple[int, Tuple[int, ...], str, RenderOptions]) -> str:
+    """
+    Draw a single braid and save it, in a worker process
+
+    The non-interactive Agg backend is selected so that no display is needed,
+    and the previous backend is restored afterwards.
+    """
+    import matplotlib.pyplot as plt
+    import braidvisualiser as bv
+
+    n_strands, generators, path, options = task
+    # Neutral elements are not supported by library used
+    b = bv.Braid(n_strands, *[g for g in generators if g != 0])
+    backend = plt.get_backend()
+    plt.switch_backend("Agg")
+    try:
+        with warnings.catch_warnings():
+            # plt.show() is a no-op with Agg, the figure is saved explicitly below
+            warnings.simplefilter("ignore", UserWarning)
+            b.draw(
+                save=False,
+                style=options.style,
+                line_width=options.line_width,
+                gap_size=options.gap_size,
+                color=options.color,
+            )
+        fig = plt.gcf()
+        fig.savefig(path, dpi=options.dpi)
+        plt.close(fig)
+    finally:
+        if backend.lower() != "agg":
+            plt.switch_backend(backend)
+    return path
+
+
+def _load_manifest(out_dir: Path) -> dict:
+    manifest_path = out_dir / MANIFEST_NAME
+    if not manifest_path.exists():
+        return {}
+    try:
+        return json.loads(manifest_path.read_text())
+    except json.JSONDecodeError:
+        # A corrupted manifest only costs a full re-rendering
+        return {}
+
+
+def render_batch(
+    braids: Iterable[Braid],
+    out_dir: str | Path,
+    names: Optional[Sequence[str]] = None,
+    options: Optional[RenderOptions] = None,
+    n_processes: Optional[StrictlyPositiveInt] = None,
+    chunk_size: StrictlyPositiveInt = 16,
+    force: bool = False,
+) -> BatchRenderingResults:
+    """
+    Render the figures of many braids to files, in parallel
+
+    A manifest in out_dir stores the hash of the braid and options of each output file,
+    so that a second call only draws the braids which changed.
+
+    Args:
+        braids(Iterable[Braid]): braids to render
+        out_dir(str | Path): output directory, created if needed
+        names(Optional(Sequence[str])): file name (without extension) of each braid. Default to braid_00000, braid_00001...
+        options(Optional(RenderOptions)): rendering options. Default to RenderOptions()
+        n_processes(Optional(StrictlyPositiveInt)): number of worker processes, 1 renders in the current process.
+            Default to None (number of CPUs)
+        chunk_size(Optional(StrictlyPositiveInt)): number of braids sent to a worker at once. Default to 16
+        force(Optional(bool)): render even if the cached output is valid. Default to False
+
+    Returns:
+        BatchRenderingResults: output paths and statistics
+    """
+    start = time.perf_counter()
+    options = RenderOptions() if options is None else options
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    braids = list(braids)
+    if names is None:
+        names = [f"braid_{k:05d}" for k in range(len(braids))]
+    if len(names) != len(braids):
+        raise ValueError("There should be one name per braid")
+    if len(set(names)) != len(names):
+        raise ValueError("Names should be unique")
+
+    manifest = _load_manifest(out_dir)
+    results = BatchRenderingResults()
+    tasks = []
+    for braid, name in zip(braids, names):
+        path = out_dir / f"{name}.{options.image_format}"
+        results.paths.append(path)
+        digest = render_hash(braid, options)
+        if not force and manifest.get(path.name) == digest and path.exists():
+            results.n_skipped += 1
+            continue
+        manifest[path.name] = digest
+        tasks.append((braid.n_strands, tuple(braid.generators), str(path), options))
+
+    if n_processes == 1 or not tasks:
+        for task in tasks:
+            _render_one(task)
+    else:
+        with ProcessPoolExecutor(max_workers=n_processes) as executor:
+            for _ in executor.map(_render_one, tasks, chunksize=chunk_size):
+                pass
+    results.n_rendered = len(tasks)
+
+    # Written last, so that an interrupted batch is rendered again
+    (out_dir / MANIFEST_NAME).write_text(json.dumps(manifest, indent=0, sort_keys=True))
+    results.elapsed = time.perf_counter() - start
+    return results
+
+
+def contact_sheet(
+    paths: Sequence[str | Path],
+    out_path: str | Path,
+    columns: StrictlyPositiveInt = 8,
+    padding: PositiveInt = 4,
+) -> Path:
+    """
+    Tile raster images in a single image, row by row
+
+    Images are aligned on the top-left corner of cells sized after the largest image,
+    the background being white.
+
+    Args:
+        paths(Sequence[str | Path]): png images to tile
+        out_path(str | Path): path of the contact sheet
+        columns(Optional(StrictlyPositiveInt)): number of images per row. Default to 8
+        padding(Optional(PositiveInt)): pixels between cells. Default to 4
+
+    Returns:
+        Path: path of the contact sheet
+    """
+    import matplotlib.image as mpimg
+
+    if len(paths) == 0:
+        raise ValueError("No image to tile")
+    images = []
+    for path in paths:
+        image = mpimg.imread(str(path))
+        if image.dtype == np.uint8:
+            image = image.astype(np.float32) / 255
+        if image.ndim == 2:
+            image = np.stack([image] * 3, axis=-1)
+        if image.shape[2] == 3:
+            image = np.concatenate([image, np.ones(image.shape[:2] + (1,))], axis=-1)
+        images.append(image)
+
+    cell_h = max(image.shape[0] for image in images) + padding
+    cell_w = max(image.shape[1] for image in images) + padding
+    columns = min(columns, len(images))
+    rows = -(-len(images) // columns)
+    sheet = np.ones((rows * cell_h - padding, columns * cell_w - padding, 4))
+    for k, image in enumerate(images):
+        top, left = (k // columns) * cell_h, (k % columns) * cell_w
+        sheet[top : top + image.shape[0], left : left + image.shape[1]] = image
+
+    out_path = Path(out_path)
+    mpimg.imsave(str(out_path), sheet)
+    return out_path
@@ -11,14 +11,27 @@ Repository: https://github.com/baptistelabat/braidpy
 License: Mozilla Public License 2.0
 """
 
-import enum
-from typing import List, Tuple, Optional, Union
+from typing import Iterator, List, Tuple, Optional, TextIO, Union
 import numpy as np
 
 from sympy import Matrix, eye, symbols
 from dataclasses import dataclass, field
-
-from braidpy.garside_canonical_form import GarsideCanonicalFactors
+from functools import cached_property
+
+from braidpy.braid_formatting import custom_table, notation_table
+
+# Kept importable from braidpy.braid, where it was defined before braid_formatting
+from braidpy.braid_formatting import BraidWordNotation as BraidWordNotation
+from braidpy.closure import ClosureAnalysis, closure_analysis
+from braidpy.dynnikov import dynnikov_coordinates
+from braidpy.equality import EqualityBackend, braids_equal, is_trivial_braid
+from braidpy.fingerprint import batch_burau_fingerprints, burau_fingerprint
+from braidpy.garside_canonical_form import (
+    GarsideCanonicalFactors,
+    GarsideRightCanonicalFactors,
+    SymmetricCanonicalFactors,
+)
+from braidpy.terminal_rendering import TerminalRenderer
 from braidpy.parametric_strand import (
     ParametricStrand,
     make_idle_arc,
@@ -29,7 +42,6 @@ from braidpy.parametric_strand import (
 from braidpy.utils import (
     int_to_superscript,
     int_to_subscript,
-    colorize,
     StrictlyPositiveInt,
     PositiveInt,
 )
@@ -47,12 +59,6 @@ BraidingStep = Union[SignedCrossingIndex, Tuple[SignedCrossingIndex, ...]]
 BraidingProcess = Tuple[BraidingStep, ...]
 
 
-class BraidWordNotation(str, enum.Enum):
-    ARTIN = "ARTIN"
-    ALPHA = "ALPHA"
-    DEFAULT = "DEFAULT"
-
-
 def single_crossing_braiding_process(
     process: BraidingProcess,
 ) -> List[SignedCrossingIndex]:
@@ -148,33 +154,24 @@ class Braid:
         Returns:
             str: the formated braid word
         """
-        match target.upper():
-            case BraidWordNotation.ARTIN.value:
-                if len(self.generators) == 0:
-                    return "e"
-                return " ".join(
-                    "s_{" + str(abs(g)) + "}^{" + str(abs(g) / g) + "}"
-                    if g != 0
-                    else "e"
-                    for g in self.generators
-                )
-            case BraidWordNotation.ALPHA.value:
-                if len(self.generators) == 0:
-                    return "#"
-
-                def alp(g):
-                    return chr(ord("Q") + int(abs(g) / g) * 16 + abs(g) - 1)
-
-                return "".join(alp(g) if g != 0 else "#" for g in self.generators)
-            case BraidWordNotation.DEFAULT.value | "":
-                """
-                This is the syntax used by math-braid and braidlab
-                """
-                return "<" + " : ".join(str(g) for g in self.generators) + ">"
-            case _:
-                raise NotImplementedError(
-                    f"target notation should be among {[notation.value for notation in BraidWordNotation]}"
-                )
+        return notation_table(target, self.n_strands).format(self.generators)
+
+    def iter_format_to_notation(
+        self, target: str = "", chunk_size: StrictlyPositiveInt = 65536
+    ) -> Iterator[str]:
+        """
+        Same as format_to_notation, but by pieces to write very long words to a stream without building the string
+
+        Args:
+            target(str): Among 'alpha', 'artin' and 'default'
+            chunk_size(Optional(StrictlyPositiveInt)): number of generators per piece. Default to 65536
+
+        Returns:
+            Iterator[str]: pieces of the formatted word
+        """
+        return notation_table(target, self.n_strands).chunks(
+            self.generators, chunk_size
+        )
 
     def format(
         self,
@@ -209,17 +206,10 @@ class Braid:
                 for i in range(self.n_strands)
             ]
 
-        word = ""
-        for i, gen in enumerate(self.generators):
-            if gen > 0:
-                word = word + generator_symbols[gen - 1]
-            elif gen < 0:
-                word = word + inverse_generator_symbols[-gen - 1]
-            else:
-                word = word + zero_symbol
-            if i < len(self.generators) - 1:
-                word += separator
-        return f"{word}"
+        table = custom_table(
+            generator_symbols, inverse_generator_symbols, zero_symbol, separator
+        )
+        return table.format(self.generators)
 
     def no_zero(self):
         """
@@ -230,6 +220,25 @@ class Braid:
         """
         return Braid([g for g in self.generators if g != 0], self.n_strands)
 
+    def free_reduce(self) -> "Braid":
+        """
+        Suppress zeros and cancel adjacent pairs σᵢσᵢ⁻¹ or σᵢ⁻¹σᵢ until none remains
+
+        The result is topologically equivalent and never longer.
+
+        Returns:
+            Braid: the freely reduced braid
+        """
+        reduced: List[SignedCrossingIndex] = []
+        for g in self.generators:
+            if g == 0:
+                continue
+            if reduced and reduced[-1] == -g:
+                reduced.pop()
+            else:
+                reduced.append(g)
+        return Braid(reduced, self.n_strands)
+
     def word_length(self):
         """
         Length of the word including neutral element
@@ -262,10 +271,7 @@ class Braid:
         if n == 0:
             return Braid([], self.n_strands)
         elif n > 0:
-            result = self
-            for _ in range(n - 1):
-                result = result * self
-            return result
+            return Braid(self.generators * n, self.n_strands)
         else:
             return (self ** (-n)).inverse()
 
@@ -289,31 +295,43 @@ class Braid:
         Check if two braids are equivalent
         We ask to get the same number of strands
 
-        Relies on math_braid implementation from J. Cha et al, "An Efficient Implementation of Braid Groups",
-        Advances in Cryptology: Proceedings of ASIACRYPT 2001,
-        Lecture Notes in Computer Science (2001), 144--156.
-        https://www.iacr.org/archive/asiacrypt2001/22480144.pdf
+        The algorithm is chosen automatically from the word lengths and number of strands, see braidpy.equality:
+        - Garside normal forms, relying on math_braid implementation from J. Cha et al,
+          "An Efficient Implementation of Braid Groups", Advances in Cryptology: Proceedings of ASIACRYPT 2001,
+          Lecture Notes in Computer Science (2001), 144--156.
+          https://www.iacr.org/archive/asiacrypt2001/22480144.pdf
+          Complexity is in O(l²n.log n) where n is the word size and l correspond roughly to the number of strands.
+        - handle reduction, which is efficient in practice and whose complexity is assumed to be linear in O(n),
+          but without proof and an exponential majorant.
+          ON WORD REVERSING IN BRAID GROUPS PATRICK DEHORNOY AND BERT WIEST
+          https://dehornoy.lmno.cnrs.fr/Papers/Dhg.pdf
+        - Dynnikov coordinates, linear in the word size for a fixed number of strands.
 
-        Complexity is in O(l²n.log n) where n is the word size and l correspond roughly to the number of strands.
+        Args:
+            other(Braid): the braid to compare with
 
-        Might not be the best algorithm compared to handle reduction which is efficient in practice and
-        whose complexity is assumed to be linear in O(n), but without proof and an exponential majorant.
-        ON WORD REVERSING IN BRAID GROUPS PATRICK DEHORNOY AND BERT WIEST
-        https://dehornoy.lmno.cnrs.fr/Papers/Dhg.pdf
+        Returns:
+            bool: True if the braid are topologically equivalent
+        """
+        return self.equals(other)
+
+    def equals(
+        self, other: "Braid", backend: EqualityBackend | str = EqualityBackend.AUTO
+    ) -> bool:
+        """
+        Check if two braids are equivalent with a chosen algorithm
 
         Args:
             other(Braid): the braid to compare with
+            backend(Optional(EqualityBackend | str)): algorithm used, or the name of a registered one.
+                Default to EqualityBackend.AUTO
 
         Returns:
             bool: True if the braid are topologically equivalent
         """
         if self.n_strands != other.n_strands:
             return False
-        if not self.no_zero().generators and not other.no_zero().generators:
-            return True
-        return math_braid.Braid(
-            list(self.generators), self.n_strands
-        ) == math_braid.Braid(list(other.generators), other.n_strands)
+        return braids_equal(self.generators, other.generators, self.n_strands, backend)
 
     def inverse(self) -> "Braid":
         """
@@ -383,15 +401,12 @@ class Braid:
         Returns:
             Braid: the twisted braid
         """
-        b = self
-        for i in range(abs(self.n_strands)):
-            b = b * (
-                slide_strand(
-                    start_index=1, n_slide=self.n_strands - i - 1, sign=np.sign(sign)
-                ).n(self.n_strands)
-            )
-
-        return b
+        # Concatenation of the words of slide_strand(n_slide=n-1), ..., slide_strand(n_slide=0),
+        # built at once to avoid quadratic successive multiplications
+        s = int(np.sign(sign))
+        n = self.n_strands
+        gen = [s * j for i in range(n) for j in range(1, n - i)] if s else []
+        return self * Braid(gen, n)
 
     def full_twist(self, sign: int = +1) -> "Braid":
         """
@@ -444,6 +459,18 @@ class Braid:
         """Calculate the writhe of the braid (sum of generator powers)"""
         return sum(np.sign(self.generators))
 
+    @cached_property
+    def _canonical_factors(self) -> GarsideCanonicalFactors:
+        br = self.no_zero()
+        if br.generators:
+            b = math_braid.Braid(list(self.generators), self.n_strands)
+            b.cleanUpFactors()
+            return GarsideCanonicalFactors(n_half_twist=b.p, n_strands=b.n, Ai=b.a)
+        else:
+            return GarsideCanonicalFactors(
+                n_half_twist=0, n_strands=StrictlyPositiveInt(br.n_strands), Ai=()
+            )
+
     def get_canonical_factors(self) -> GarsideCanonicalFactors:
         """
         Get decomposition in left normal form
@@ -453,18 +480,43 @@ class Braid:
         Lecture Notes in Computer Science (2001), 144--156.
         https://www.iacr.org/archive/asiacrypt2001/22480144.pdf
 
+        The result is computed once and cached on the braid.
+
         Returns:
             GarsideCanonicalFactors: the unique decomposition of the braid according to left convention
         """
-        br = self.no_zero()
-        if br.generators:
-            b = math_braid.Braid(list(self.generators), self.n_strands)
-            b.cleanUpFactors()
-            return GarsideCanonicalFactors(n_half_twist=b.p, n_strands=b.n, Ai=b.a)
-        else:
-            return GarsideCanonicalFactors(
-                n_half_twist=0, n_strands=StrictlyPositiveInt(br.n_strands), Ai=()
-            )
+        return self._canonical_factors
+
+    def get_right_canonical_factors(self) -> GarsideRightCanonicalFactors:
+        """
+        Get decomposition in right normal form B₁...Bₘδ^q
+
+        Returns:
+            GarsideRightCanonicalFactors: the unique decomposition of the braid according to right convention
+        """
+        return self.get_canonical_factors().right_normal_form
+
+    def get_symmetric_canonical_factors(self) -> SymmetricCanonicalFactors:
+        """
+        Get decomposition in symmetric normal form N⁻¹P
+
+        Returns:
+            SymmetricCanonicalFactors: the unique decomposition of the braid as a fraction of positive braids
+        """
+        return self.get_canonical_factors().symmetric_normal_form
+
+    def to_symmetric_normal_form(self) -> "Braid":
+        """
+        Rewrite the braid as N⁻¹P, a negative word followed by a positive word
+
+        For mixed sign braids this word is often much shorter than the one of the left normal form.
+
+        Returns:
+            Braid: an equivalent braid
+        """
+        return Braid(
+            self.get_symmetric_canonical_factors().to_generators(), self.n_strands
+        )
 
     def to_matrix(self) -> Matrix:
         """Convert braid to its (unreduced) Burau matrix representation."""
@@ -488,6 +540,40 @@ class Braid:
             matrix = matrix * mat  # Correct order: left-to-right
         return matrix
 
+    def fingerprint(self) -> int:
+        """
+        Compute a fingerprint of the braid from its Burau matrix evaluated modulo 2⁶¹-1 at fixed values of t.
+
+        Contrary to hash, equivalent braids always get the same fingerprint.
+        Different braids may rarely share a fingerprint, so use it to bucket braids before comparing them with ==.
+
+        Returns:
+            int: a 64 bits fingerprint
+        """
+        return burau_fingerprint(self.generators, self.n_strands)
+
+    def dynnikov_coordinates(self) -> np.ndarray:
+        """
+        Compute the Dynnikov coordinates of the image of a fixed lamination by the braid,
+        an extra puncture being added on the right so that the action is faithful.
+
+        Two braids are equivalent if and only if they have the same coordinates.
+
+        Returns:
+            np.ndarray: 2(n_strands - 1) integers, int64 or object if they do not fit in int64
+        """
+        return dynnikov_coordinates(self.generators, self.n_strands)
+
+    def closure_analysis(self) -> ClosureAnalysis:
+        """
+        Analyse the link obtained by closing the braid: components from the cycles of the permutation,
+        linking numbers between components and number of crossings of each strand
+
+        Returns:
+            ClosureAnalysis: the analysis, computed in O(L + n²)
+        """
+        return closure_analysis(self.generators, self.n_strands)
+
     def to_reduced_matrix(self):
         """
         Return the reduced Burau representation
@@ -506,39 +592,16 @@ class Braid:
 
     def permutations(self, plot=False) -> List[int]:
         """Return the permutations induced by the braid"""
+        if plot:
+            TerminalRenderer(self.n_strands).render(self.generators)
         perms = []
         strands = list(range(1, self.n_strands + 1))
         perms.append(strands.copy())
-        if plot:
-            print(" ".join(colorize(item) for item in strands))
         for gen in self.generators:
             i = abs(gen) - 1
-            if gen > 0:  # Positive crossing (σ_i)
-                if plot:
-                    print(
-                        " ".join(colorize(item) for item in strands[: i + 1])
-                        + colorize(">", strands[i] - 1)
-                        + " ".join(colorize(item) for item in strands[i + 1 :])
-                    )
+            if gen != 0:
                 strands[i], strands[i + 1] = strands[i + 1], strands[i]
-            elif gen < 0:  # Negative crossing (σ_i⁻¹)
-                if plot:
-                    print(
-                        " ".join(colorize(item) for item in strands[: i + 1])
-                        + colorize("<", strands[i + 1] - 1)
-                        + " ".join(colorize(item) for item in strands[i + 1 :])
-                    )
-                strands[i + 1], strands[i] = strands[i], strands[i + 1]
-
-            else:
-                if plot:
-                    print(" ".join(colorize(item) for item in strands))
-                # No crossing
-                strands = strands
-
             perms.append(strands.copy())
-        if plot:
-            print(" ".join(colorize(item) for item in strands))
         return perms
 
     def perm(self) -> list[PositiveInt]:
@@ -556,6 +619,19 @@ class Braid:
         """Check if a braid is pure (permutation is identity)"""
         return self.perm() == list(range(1, self.n_strands + 1))
 
+    def to_pure_braid(self):
+        """
+        Rewrite a pure braid with the generators Aᵢⱼ of the pure braid group, see braidpy.pure_braid
+
+        Returns:
+            PureBraid: the braid, as a freely reduced word in the Aᵢⱼ
+        """
+        from braidpy.pure_braid import PureBraid
+
+        if not self.is_pure():
+            raise ValueError("The braid is not pure")
+        return PureBraid.from_braid(self)
+
     def is_palindromic(self):
         return self.generators == self.generators[::-1]
 
@@ -585,6 +661,85 @@ class Braid:
             range(1, self.n_strands + 1)
         )
 
+    def topological_entropy(
+        self, tolerance: float = 1e-6, max_iterations: int = 100
+    ) -> float:
+        """
+        Estimate the topological entropy of the braid, the growth rate of loops under its repeated action
+
+        See braidpy.entropy.batch_topological_entropy, and collection_topological_entropy for many braids.
+
+        Args:
+            tolerance(Optional(PositiveFloat)): convergence threshold on the change of the estimate. Default to 1e-6
+            max_iterations(Optional(StrictlyPositiveInt)): highest number of applications of the braid. Default to 100
+
+        Returns:
+            float: the entropy estimate
+        """
+        from braidpy.entropy import topological_entropy
+
+        return topological_entropy(self, tolerance, max_iterations).entropy
+
+    def thurston_type(self):
+        """
+        Cheap Nielsen-Thurston classification of the braid, see braidpy.entropy.thurston_type
+
+        Returns:
+            ThurstonType: finite order, reducible or pseudo-Anosov
+        """
+        from braidpy.entropy import thurston_type
+
+        return thurston_type(self)
+
+    def _forget_strands(self, strands: List[int]) -> List["Braid"]:
+        """
+        Remove strands one at a time, all the words being built together with array operations
+
+        The crossings of each generator and the positions of all the strands are read from permutations().
+        Crossings involving the removed strand are dropped, and generators to the right of it are shifted by one.
+        """
+        n = self.n_strands
+        if n < 2:
+            raise ValueError("Removing a strand needs at least 2 strands")
+        strands = np.asarray(strands, dtype=np.int64)
+        if np.any((strands < 1) | (strands > n)):
+            raise ValueError(f"Strands should be between 1 and {n}")
+        generators = np.array(self.generators, dtype=np.int64)
+        # before[t, p]: strand at position p + 1 before generator t
+        before = np.array(self.permutations()[:-1], dtype=np.int64).reshape(-1, n)
+        i = np.abs(generators)
+        rows = np.arange(len(generators))
+        left = before[rows, np.maximum(i - 1, 0)]
+        right = before[rows, np.clip(i, 0, n - 1)]
+        # position[k, t]: position of the k-th removed strand before generator t
+        position = (np.argsort(before, axis=1) + 1)[:, strands - 1].T
+        removed = strands[:, None]
+        keep = ((left != removed) & (right != removed)) | (generators == 0)
+        shifted = np.sign(generators) * (i - (position < i))
+        return [Braid(word[mask].tolist(), n - 1) for word, mask in zip(shifted, keep)]
+
+    def forget_strand(self, k: int) -> "Braid":
+        """
+        Remove a strand from the braid. This is a homomorphism from pure braids on n strands to pure braids on
+        n - 1 strands.
+
+        Args:
+            k(int): strand to remove, numbered from 1 by its starting position as in perm()
+
+        Returns:
+            Braid: the braid on n - 1 strands
+        """
+        return self._forget_strands([k])[0]
+
+    def forget_each_strand(self) -> List["Braid"]:
+        """
+        Remove each strand in turn, see forget_strand. The positions of the strands are tracked once for all.
+
+        Returns:
+            List[Braid]: braids on n - 1 strands, the one without strand k at index k - 1
+        """
+        return self._forget_strands(list(range(1, self.n_strands + 1)))
+
     def is_brunnian(self) -> bool:
         """
         A Brunnian braid is a braid that becomes trivial upon removal of any one of its strings.
@@ -592,20 +747,46 @@ class Braid:
 
         https://en.wikipedia.org/wiki/Brunnian_link#Brunnian_braids
 
+        Brunnian braids are pure, so a braid permuting its strands is rejected first. The n braids obtained by forgetting
+        one strand are then compared with the identity by their Burau fingerprints, all computed at once, so that most
+        non Brunnian braids are rejected without exact check. Triviality is then confirmed one braid at a time.
+
         Returns:
             bool: True if Brunnian
         """
-        raise NotImplementedError()
+        n = self.n_strands
+        if n < 2:
+            return True
+        if not self.is_pure():
+            return False
+        forgotten = self.forget_each_strand()
+        words = np.zeros((n, max(len(b.generators) for b in forgotten)), dtype=np.int64)
+        for k, b in enumerate(forgotten):
+            words[k, : len(b.generators)] = b.generators
+        identity = burau_fingerprint([], n - 1)
+        if np.any(batch_burau_fingerprints(words, n - 1) != identity):
+            return False
+        return all(is_trivial_braid(b.generators, n - 1) for b in forgotten)
 
-    def is_reducible(self) -> bool:
+    def is_reducible(self, max_size: int = 10_000, coarsest: bool = False):
         """
         If a braid is reducible, it means that the strands can be separated into groups of strands
          (less groups than number of strands), such that each group is running inside one tube. The tubes themselves can form a braid
 
+        Reduction curves are searched in the super summit set, see braidpy.reducibility.reducibility_analysis.
+
+        Args:
+            max_size(Optional(StrictlyPositiveInt)): highest number of elements of the super summit set explored.
+                Default to 10 000
+            coarsest(Optional(bool)): if True, return the partition with the fewest tubes. Default to False
+
         Returns:
-            bool
+            ReducibilityAnalysis: truthy if reducible, with the partition of the strands into tubes. Its field
+                reducible is None when no reduction curve was found
         """
-        raise NotImplementedError()
+        from braidpy.reducibility import reducibility_analysis
+
+        return reducibility_analysis(self, max_size, coarsest)
 
     def to_parametric_strands(self, amplitude: float = 0.2) -> List[ParametricStrand]:
         """
@@ -678,18 +859,35 @@ class Braid:
             strand_arc_sequences.append(arcs)
 
         return [
-            ParametricStrand(combine_arcs(strand)) for strand in strand_arc_sequences
+            ParametricStrand(combine_arcs(strand), arcs=strand)
+            for strand in strand_arc_sequences
         ]
 
-    def draw(self):
+    def draw(
+        self,
+        start: PositiveInt = 0,
+        stop: Optional[PositiveInt] = None,
+        step: StrictlyPositiveInt = 1,
+        stream: Optional[TextIO] = None,
+    ):
         """
         Draw the braid in the terminal with arrows allowing
         to better check the differnet operations (with colors !)
 
+        The drawing is streamed, so that a window or a decimated overview of a huge braid can be drawn quickly.
+
+        Args:
+            start(Optional(PositiveInt)): index of the first generator drawn. Default to 0
+            stop(Optional(PositiveInt)): index after the last generator drawn. Default to None (until the end)
+            step(Optional(StrictlyPositiveInt)): draw one generator out of step. Default to 1
+            stream(Optional(TextIO)): where to write. Default to sys.stdout
+
         Returns:
             Braid: return the braid itself to allow to debug in a chain
         """
-        self.permutations(plot=True)
+        TerminalRenderer(self.n_strands, stream=stream).render(
+            self.generators, start=start, stop=stop, step=step
+        )
 
         # Return self to enable to chain the different steps
         return self
@@ -719,6 +917,7 @@ class Braid:
                 'k': black,
                 'w': white}
             save(bool): if True save to file "test.svg"
+                To render many braids to files, see batch_rendering.render_batch
 
         Returns:
             Braid: return the slightly modified braid to allow to debug in a chain
@@ -14,9 +14,321 @@ License: Mozilla Public License 2.0
 from braidpy import Braid
 from braidpy.artin_generators import a
 from braidpy.braid import slide_strand, weave_strand
-from braidpy.utils import StrictlyPositiveInt
+from braidpy.garside_canonical_form import GarsideCanonicalFactors
+from braidpy.utils import FunctionalException, PositiveInt, StrictlyPositiveInt
 import braidpy.braid
-from typing import Tuple
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+
+class UnknownCatalogEntry(FunctionalException):
+    pass
+
+
+@dataclass(frozen=True)
+class CatalogEntry:
+    """
+    Metadata of a braid of the catalog
+
+    -name: key of the entry
+    -pattern: family of the braid, e.g. "flat", "round", "weave" or "twist"
+    -n_strands: number of strands, None if the braid is parametrized by its number of strands
+    -period: number of iterations of the braid to get back to initial order of strands, None if not applicable
+    -builder: function building the braid, taking the number of strands if parametrized
+    -description: short human readable description
+    """
+
+    name: str
+    pattern: str
+    n_strands: Optional[StrictlyPositiveInt]
+    period: Optional[StrictlyPositiveInt]
+    builder: Callable[..., braidpy.braid.Braid]
+    description: str = ""
+
+    @property
+    def parametrized(self) -> bool:
+        return self.n_strands is None
+
+
+@dataclass(frozen=True)
+class CatalogInvariants:
+    """
+    Invariants of a braid of the catalog, computed once
+
+    -permutation: permutation induced by the braid
+    -writhe: sum of the signs of the crossings
+    -is_pure: True if the permutation is the identity
+    -normal_form: left normal form of the braid
+    """
+
+    permutation: Tuple[PositiveInt, ...]
+    writhe: int
+    is_pure: bool
+    normal_form: GarsideCanonicalFactors
+
+
+_CATALOG: Dict[str, CatalogEntry] = {}
+
+
+def register_braid(
+    name: str,
+    pattern: str,
+    n_strands: Optional[StrictlyPositiveInt] = None,
+    period: Optional[StrictlyPositiveInt] = None,
+    description: str = "",
+) -> Callable:
+    """
+    Decorator registering a braid builder in the catalog
+
+    Args:
+        name(str): key of the entry, must be unique
+        pattern(str): family of the braid
+        n_strands(Optional(StrictlyPositiveInt)): number of strands. Default to None (builder parametrized by it)
+        period(Optional(StrictlyPositiveInt)): number of iterations to get back to initial order. Default to None
+        description(Optional(str)): short description. Default to ""
+
+    Returns:
+        Callable: the decorator, returning the builder unchanged
+    """
+
+    def decorator(builder: Callable[..., braidpy.braid.Braid]) -> Callable:
+        if name in _CATALOG:
+            raise ValueError(f"Catalog entry {name} is already registered")
+        _CATALOG[name] = CatalogEntry(
+            name, pattern, n_strands, period, builder, description
+        )
+        return builder
+
+    return decorator
+
+
+def catalog_entry(name: str) -> CatalogEntry:
+    """
+    Get the metadata of a catalog entry
+
+    Args:
+        name(str): key of the entry
+
+    Returns:
+        CatalogEntry: the entry
+    """
+    try:
+        return _CATALOG[name]
+    except KeyError:
+        raise UnknownCatalogEntry(f"No braid named {name} in catalog") from None
+
+
+def catalog_entries(
+    pattern: Optional[str] = None, n_strands: Optional[StrictlyPositiveInt] = None
+) -> List[CatalogEntry]:
+    """
+    List the entries of the catalog, optionally filtered
+
+    Args:
+        pattern(Optional(str)): keep only this family. Default to None (all)
+        n_strands(Optional(StrictlyPositiveInt)): keep only entries with this number of strands,
+            parametrized entries always match. Default to None (all)
+
+    Returns:
+        List[CatalogEntry]: the entries in registration order
+    """
+    return [
+        entry
+        for entry in _CATALOG.values()
+        if (pattern is None or entry.pattern == pattern)
+        and (n_strands is None or entry.n_strands in (None, n_strands))
+    ]
+
+
+@lru_cache(maxsize=None)
+def catalog_braid(name: str, *params) -> braidpy.braid.Braid:
+    """
+    Build a braid of the catalog, once per name and parameters
+
+    The same instance is returned by successive calls, it should not be modified.
+
+    Args:
+        name(str): key of the entry
+        *params: parameters of the builder, e.g. the number of strands of a parametrized entry
+
+    Returns:
+        Braid: the braid
+    """
+    return catalog_entry(name).builder(*params)
+
+
+@lru_cache(maxsize=None)
+def catalog_invariants(name: str, *params) -> CatalogInvariants:
+    """
+    Invariants of a braid of the catalog, computed once per name and parameters
+
+    Args:
+        name(str): key of the entry
+        *params: parameters of the builder, e.g. the number of strands of a parametrized entry
+
+    Returns:
+        CatalogInvariants: the invariants
+    """
+    b = catalog_braid(name, *params)
+    permutation = tuple(b.perm())
+    return CatalogInvariants(
+        permutation=permutation,
+        writhe=int(b.writhe()),
+        is_pure=permutation == tuple(range(1, b.n_strands + 1)),
+        normal_form=b.get_canonical_factors(),
+    )
+
+
+@lru_cache(maxsize=None)
+def invariants_table() -> Dict[str, CatalogInvariants]:
+    """
+    Invariants of all the entries which are not parametrized, computed at first call
+
+    Returns:
+        Dict[str, CatalogInvariants]: invariants by entry name
+    """
+    return {
+        entry.name: catalog_invariants(entry.name)
+        for entry in _CATALOG.values()
+        if not entry.parametrized
+    }
+
+
+@register_braid("garside_half_twist", "twist", description="Garside element ∆n")
+def _garside_half_twist(n_strands: StrictlyPositiveInt) -> braidpy.braid.Braid:
+    return a(0, n_strands).half_twist()
+
+
+@register_braid("full_twist", "twist", description="Full twist ∆n²")
+def _full_twist(n_strands: StrictlyPositiveInt) -> braidpy.braid.Braid:
+    return a(0, n_strands).full_twist()
+
+
+@register_braid("flat3", "flat", 3, 3, "ABOK 2965 flat sinnet")
+def _flat3() -> braidpy.braid.Braid:
+    step = Braid(1, 3)
+    return (step * step.flip()) ** 3
+
+
+@register_braid("inverted_flat3", "flat", 3, 3, "ABOK 2966 inverted flat sinnet")
+def _inverted_flat3() -> braidpy.braid.Braid:
+    step = Braid(-1, 3)
+    return step * step.flip()
+
+
+@register_braid("square4", "round", 4, 4, "Round braid with 4 strands")
+def _square4() -> braidpy.braid.Braid:
+    step = Braid((-1, -2, -2), 4)
+    return step * step.flip()
+
+
+@register_braid("asymmetric_flat4", "flat", 4, 4, "ABOK 2969 asymmetric flat sinnet")
+def _asymmetric_flat4() -> braidpy.braid.Braid:
+    return slide_strand(2).n(4) * a(-3)
+
+
+def _flat6_step() -> braidpy.braid.Braid:
+    """Half step of flat6, repeated flipped"""
+    n = 6
+    step3 = slide_strand(int(n / 2), start_index=2).n(n).flip()
+    step4 = slide_strand(int(n / 2)).n(n)  # "Ramener l'extrème gauche au centre"
+    return step3 * step4
+
+
+@register_braid("flat6", "flat", 6, 6, "Flat braid with 6 strands")
+def _flat6() -> braidpy.braid.Braid:
+    step = _flat6_step()
+    return step * step.flip()
+
+
+def _regular_flat6_steps() -> Tuple[braidpy.braid.Braid, braidpy.braid.Braid]:
+    """The two half steps of regular_flat6"""
+    n = 6
+    step1 = weave_strand(int(n / 2)).n(n)
+    step2 = weave_strand(int(n / 2) - 1, sign=-1).n(n).flip()
+    return step1, step2
+
+
+@register_braid("regular_flat6", "flat", 6, 6, "Regular flat braid with 6 strands")
+def _regular_flat6() -> braidpy.braid.Braid:
+    step1, step2 = _regular_flat6_steps()
+    return step1 * step2
+
+
+@register_braid(
+    "double_flat3", "flat", 6, 3, "ABOK 2971 flat sinnet of doubled strands"
+)
+def _double_flat3() -> braidpy.braid.Braid:
+    n = 3
+    n_multiple = 2
+    step = a(1)
+    for i in range(n_multiple):
+        for j in range(n_multiple):
+            step = step * a(1 + n_multiple - 1 - i + j)
+    step = step.n(n * n_multiple)
+    return (step * step.flip()) ** n
+
+
+@register_braid("weave3", "weave", 3, 3, "ABOK 2973 weaving of 2 parallel strands")
+def _weave3() -> braidpy.braid.Braid:
+    step = a(1) * a(-2).n(3)
+    return (step * step.flip()) ** 3
+
+
+@register_braid("abok_2974", "flat", 4, 2, "ABOK 2974")
+def _abok_2974() -> braidpy.braid.Braid:
+    return Braid([-1, -3, 2, 2], 4)
+
+
+@register_braid("flat5", "flat", 5, 5, "Flat braid with 5 strands")
+def _flat5() -> braidpy.braid.Braid:
+    n = 5
+    step1 = slide_strand(int((n - 1) / 2)).n(n) * a(2)
+    step2 = slide_strand(int((n + 1) / 2)).n(n).flip()
+    return step1 * step2
+
+
+@register_braid("flat_sinnet5", "flat", 5, 5, "ABOK 2967 flat sinnet")
+def _flat_sinnet5() -> braidpy.braid.Braid:
+    step = slide_strand(2).n(5)
+    return (step * step.flip()) ** 5
+
+
+@register_braid("flat_sinnet7", "flat", 7, 7, "ABOK 2968 flat sinnet")
+def _flat_sinnet7() -> braidpy.braid.Braid:
+    step = slide_strand(3).n(7)
+    return (step * step.flip()) ** 7
+
+
+def _draw_entry(
+    name: str,
+    iterated: bool = False,
+    steps: Optional[Sequence[braidpy.braid.Braid]] = None,
+    separator: bool = False,
+) -> Tuple[braidpy.braid.Braid, int]:
+    """
+    Draw a braid of the catalog and return it with its period
+
+    Args:
+        name(str): key of the entry
+        iterated(Optional(bool)): also draw the braid repeated period times. Default to False
+        steps(Optional(Sequence[Braid])): braids drawn first instead of the braid of the entry. Default to None
+        separator(Optional(bool)): print a blank line before the iterated braid. Default to False
+
+    Returns:
+        Braid: the braid of the entry
+        n: the number of iterations to get back to initial order of strands
+    """
+    b = catalog_braid(name)
+    n = catalog_entry(name).period
+    for step in [b] if steps is None else steps:
+        step.draw()
+    if iterated:
+        if separator:
+            print(" ")
+        (b**n).draw()
+    return b, n
 
 
 def garside_half_twist_braid(n_strands: StrictlyPositiveInt) -> braidpy.braid.Braid:
@@ -39,9 +351,7 @@ def garside_half_twist_braid(n_strands: StrictlyPositiveInt) -> braidpy.braid.Br
     Returns:
         Braid
     """
-
-    b = a(0, n_strands)
-    return b.half_twist()
+    return catalog_braid("garside_half_twist", n_strands)
 
 
 def full_twist_braid(n_strands: StrictlyPositiveInt) -> braidpy.braid.Braid:
@@ -60,9 +370,7 @@ def full_twist_braid(n_strands: StrictlyPositiveInt) -> braidpy.braid.Braid:
     Returns:
         Braid
     """
-
-    b = a(0, n_strands)
-    return b.full_twist()
+    return catalog_braid("full_twist", n_strands)
 
 
 def flat3() -> Tuple[braidpy.braid.Braid, int]:
@@ -83,11 +391,7 @@ def flat3() -> Tuple[braidpy.braid.Braid, int]:
         Braid: the braid object describing the single step to realize the braid
         n: the number of iterations to get back to initial order of strands
     """
-    n = 3
-    step = Braid(1, n)
-    b = (step * step.flip()) ** n
-    b.draw()
-    return b, n
+    return _draw_entry("flat3")
 
 
 def inverted_flat3() -> Tuple[braidpy.braid.Braid, int]:
@@ -102,12 +406,7 @@ def inverted_flat3() -> Tuple[braidpy.braid.Braid, int]:
         Braid: the braid object describing the single step to realize the braid
         n: the number of iterations to get back to initial order of strands
     """
-    n = 3
-    step = Braid(-1, n)
-    b = step * step.flip()
-    b.draw()
-    (b**n).draw()
-    return b, n
+    return _draw_entry("inverted_flat3", iterated=True)
 
 
 def square4() -> Tuple[braidpy.braid.Braid, int]:
@@ -118,13 +417,7 @@ def square4() -> Tuple[braidpy.braid.Braid, int]:
         Braid: the braid object describing the single step to realize the braid
         n: the number of iterations to get back to initial order of strands
     """
-    n = 4
-    step = Braid((-1, -2, -2), n)
-    b = step * step.flip()
-    b.draw()
-    print(" ")
-    (b**n).draw()
-    return b, n
+    return _draw_entry("square4", iterated=True, separator=True)
 
 
 def asymmetric_flat4() -> Tuple[braidpy.braid.Braid, int]:
@@ -144,12 +437,7 @@ def asymmetric_flat4() -> Tuple[braidpy.braid.Braid, int]:
         Braid: the braid object describing the single step to realize the braid
         n: the number of iterations to get back to initial order of strands
     """
-    n = 4
-    step = slide_strand(2).n(4) * a(-3)
-    b = step
-    b.draw()
-    (b**n).draw()
-    return b, n
+    return _draw_entry("asymmetric_flat4", iterated=True)
 
 
 def flat6() -> Tuple[braidpy.braid.Braid, int]:
@@ -162,25 +450,7 @@ def flat6() -> Tuple[braidpy.braid.Braid, int]:
         Braid: the braid object describing the single step to realize the braid
         n: the number of iterations to get back to initial order of strands
     """
-    n = 6
-    # Initialisation in video ?
-    # step1 = slide_strand(5).n(n).flip()
-    # step2 = slide_strand(4, start_index=2).n(n)
-
-    # Now loop
-    step3 = slide_strand(int(n / 2), start_index=2).n(n).flip()
-    step4 = slide_strand(int(n / 2)).n(n)  # "Ramener l'extrème gauche au centre"
-    # step5 = slide_strand(int(n / 2), start_index=2).n(n)
-    # step6 = slide_strand(int(n / 2)).flip().n(n)  # "Ramener l'extrème droite au centre"
-    # step7 = slide_strand(int(n / 2), start_index=2).n(n).flip()
-    # step8 = slide_strand(int(n / 2)).n(n)
-    # step2 = slide_strand(int(n / 2), start_index=2).n(n)
-
-    step = step3 * step4
-    step.draw()
-    b = step * step.flip()
-    (b**n).draw()
-    return b, n
+    return _draw_entry("flat6", iterated=True, steps=[_flat6_step()])
 
 
 def regular_flat6() -> Tuple[braidpy.braid.Braid, int]:
@@ -191,15 +461,7 @@ def regular_flat6() -> Tuple[braidpy.braid.Braid, int]:
         Braid: the braid object describing the single step to realize the braid
         n: the number of iterations to get back to initial order of strands
     """
-    n = 6
-    step1 = weave_strand(int(n / 2)).n(n)
-    step2 = weave_strand(int(n / 2) - 1, sign=-1).n(n).flip()
-
-    step1.draw()
-    step2.draw()
-    b = step1 * step2
-    (b**n).draw()
-    return b, n
+    return _draw_entry("regular_flat6", iterated=True, steps=_regular_flat6_steps())
 
 
 def double_flat3(parallel: bool = True):
@@ -217,20 +479,7 @@ def double_flat3(parallel: bool = True):
         Braid: the braid object describing the single step to realize the braid
         n: the number of iterations to get back to initial order of strands
     """
-    parallel = False
-    n = 3
-    n_multiple = 2
-    if parallel:
-        step = a(0)
-    else:
-        step = a(1)
-    for i in range(n_multiple):
-        for j in range(n_multiple):
-            step = step * a(1 + n_multiple - 1 - i + j)
-    step = step.n(n * n_multiple)
-    b = (step * step.flip()) ** n
-    b.draw()
-    return b, n
+    return _draw_entry("double_flat3")
 
 
 def weave3():
@@ -244,12 +493,7 @@ def weave3():
         Braid: the braid object describing the single step to realize the braid
         n: the number of iterations to get back to initial order of strands
     """
-
-    n = 3
-    step = a(1) * a(-2).n(n)
-    b = (step * step.flip()) ** n
-    b.draw()
-    return b, n
+    return _draw_entry("weave3")
 
 
 def abok_2974():
@@ -259,11 +503,7 @@ def abok_2974():
     Returns:
 
     """
-    n = 2
-    step = Braid([-1, -3, 2, 2], 4)
-    step.draw()
-    (step**n).draw()
-    return step, n
+    return _draw_entry("abok_2974", iterated=True)
 
 
 def flat5() -> Tuple[braidpy.braid.Braid, int]:
@@ -274,13 +514,7 @@ def flat5() -> Tuple[braidpy.braid.Braid, int]:
         Braid: the braid object describing the single step to realize the braid
         n: the number of iterations to get back to initial order of strands
     """
-    n = 5
-    step1 = slide_strand(int((n - 1) / 2)).n(n) * a(2)
-    step2 = slide_strand(int((n + 1) / 2)).n(n).flip()
-    step = step1 * step2
-    step.draw()
-    (step**n).draw()
-    return step, n
+    return _draw_entry("flat5", iterated=True)
 
 
 def flat_sinnet5():
@@ -296,11 +530,7 @@ def flat_sinnet5():
         Braid: the braid object describing the single step to realize the braid
         n: the number of iterations to get back to initial order of strands
     """
-    n = 5
-    step = slide_strand(int((n - 1) / 2)).n(n)
-    b = (step * step.flip()) ** n
-    b.draw()
-    return b, n
+    return _draw_entry("flat_sinnet5")
 
 
 def flat_sinnet7():
@@ -314,8 +544,4 @@ def flat_sinnet7():
         Braid: the braid object describing the single step to realize the braid
         n: the number of iterations to get back to initial order of strands
     """
-    n = 7
-    step = slide_strand(int((n - 1) / 2)).n(n)
-    b = (step * step.flip()) ** n
-    b.draw()
-    return b, n
+    return _draw_entry("flat_sinnet7")
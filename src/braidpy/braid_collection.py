@@ -0,0 +1,279 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at https://mozilla.org/MPL/2.0/.
+
+"""
+Filename: braid_collection.py
+Description: Compact storage of many braid words sharing the same number of strands
+Authors: Baptiste Labat
+Created: 2026-10-19
+Repository: https://github.com/baptistelabat/braidpy
+License: Mozilla Public License 2.0
+"""
+
+from collections.abc import Iterable, Iterator
+from typing import Optional
+
+import numpy as np
+
+from braidpy.braid import Braid
+from braidpy.braid_formatting import format_words, notation_table
+from braidpy.closure import ClosureAnalysis, batch_closure_analysis
+from braidpy.dynnikov import batch_dynnikov_coordinates
+from braidpy.fingerprint import batch_burau_fingerprints
+from braidpy.utils import StrictlyPositiveInt
+
+
+class BraidCollection:
+    def __init__(
+        self,
+        generators: np.ndarray,
+        offsets: np.ndarray,
+        n_strands: StrictlyPositiveInt,
+    ) -> None:
+        """
+        All words are concatenated in a single array of generators.
+        Word k is generators[offsets[k]:offsets[k + 1]]
+
+        Args:
+            generators(np.ndarray): concatenation of the signed Artin generators of all the words
+            offsets(np.ndarray): array of size len(collection) + 1, starting at 0 and ending at len(generators)
+            n_strands(StrictlyPositiveInt): number of strands shared by all braids
+        """
+        self.generators = np.asarray(generators, dtype=np.int16)
+        self.offsets = np.asarray(offsets, dtype=np.int64)
+        self.n_strands = StrictlyPositiveInt(n_strands)
+
+        if self.offsets.ndim != 1 or self.offsets.size == 0 or self.offsets[0] != 0:
+            raise ValueError("Offsets should be a 1D array starting at 0")
+        if self.offsets[-1] != self.generators.size or np.any(
+            np.diff(self.offsets) < 0
+        ):
+            raise ValueError("Offsets should be increasing up to number of generators")
+        if self.generators.size and np.abs(self.generators).max() >= self.n_strands:
+            raise ValueError(
+                f"Generator index out of bounds for {self.n_strands} strands"
+            )
+
+    @classmethod
+    def from_braids(
+        cls, braids: Iterable[Braid], n_strands: Optional[int] = None
+    ) -> "BraidCollection":
+        """
+        Pack braids in a collection
+
+        Args:
+            braids(Iterable[Braid]): the braids to pack
+            n_strands(Optional(int)): number of strands. Default to the one of the braids, which should all be the same
+
+        Returns:
+            BraidCollection
+        """
+        braids = list(braids)
+        if n_strands is None:
+            n_strands = braids[0].n_strands if braids else 1
+        if any(b.n_strands != n_strands for b in braids):
+            raise ValueError("Braids must have the same number of strands")
+        lengths = [len(b) for b in braids]
+        offsets = np.zeros(len(braids) + 1, dtype=np.int64)
+        np.cumsum(lengths, out=offsets[1:])
+        generators = np.fromiter(
+            (g for b in braids for g in b.generators),
+            dtype=np.int16,
+            count=int(offsets[-1]),
+        )
+        return cls(generators, offsets, n_strands)
+
+    @classmethod
+    def from_padded(
+        cls, words: np.ndarray, n_strands: StrictlyPositiveInt
+    ) -> "BraidCollection":
+        """
+        Pack words stored as rows of a 2D array, trailing zeros being considered as padding
+
+        Args:
+            words(np.ndarray): array of shape (B, L)
+            n_strands(StrictlyPositiveInt): number of strands
+
+        Returns:
+            BraidCollection
+        """
+        words = np.atleast_2d(np.asarray(words))
+        nonzero = words != 0
+        # Length is the index of the last non zero generator + 1
+        lengths = np.where(
+            nonzero.any(axis=1),
+            words.shape[1] - np.argmax(nonzero[:, ::-1], axis=1),
+            0,
+        )
+        mask = np.arange(words.shape[1]) < lengths[:, None]
+        offsets = np.zeros(words.shape[0] + 1, dtype=np.int64)
+        np.cumsum(lengths, out=offsets[1:])
+        return cls(words[mask], offsets, n_strands)
+
+    @property
+    def lengths(self) -> np.ndarray:
+        """
+        Returns:
+            np.ndarray: the length of each word
+        """
+        return np.diff(self.offsets)
+
+    def __len__(self) -> int:
+        return self.offsets.size - 1
+
+    def word(self, k: int) -> np.ndarray:
+        """
+        Args:
+            k(int): index of the word
+
+        Returns:
+            np.ndarray: a view on the generators of word k
+        """
+        return self.generators[self.offsets[k] : self.offsets[k + 1]]
+
+    def __getitem__(self, k: int) -> Braid:
+        if k < 0:
+            k += len(self)
+        if not 0 <= k < len(self):
+            raise IndexError("BraidCollection index out of range")
+        return Braid(self.word(k).tolist(), self.n_strands)
+
+    def __iter__(self) -> Iterator[Braid]:
+        for k in range(len(self)):
+            yield self[k]
+
+    def __repr__(self) -> str:
+        return f"BraidCollection({len(self)} braids, n_strands={self.n_strands})"
+
+    def padded(self, start: int = 0, stop: Optional[int] = None) -> np.ndarray:
+        """
+        Unpack some words in a 2D array, padding with neutral element 0
+
+        Args:
+            start(Optional(int)): first word. Default to 0
+            stop(Optional(int)): word after the last one. Default to len(collection)
+
+        Returns:
+            np.ndarray: array of shape (stop - start, max length)
+        """
+        stop = len(self) if stop is None else stop
+        lengths = self.lengths[start:stop]
+        width = int(lengths.max()) if lengths.size else 0
+        words = np.zeros((lengths.size, width), dtype=np.int16)
+        mask = np.arange(width) < lengths[:, None]
+        words[mask] = self.generators[self.offsets[start] : self.offsets[stop]]
+        return words
+
+    def format_to_notation(self, target: str = "") -> list[str]:
+        """
+        Format all the words, with a single symbol lookup over the concatenated generators
+
+        Args:
+            target(str): Among 'alpha', 'artin' and 'default', see Braid.format_to_notation
+
+        Returns:
+            list[str]: the formatted words, identical to Braid.format_to_notation
+        """
+        return format_words(
+            self.generators, self.offsets, notation_table(target, self.n_strands)
+        )
+
+    def fingerprints(self, chunk_size: int = 65536) -> np.ndarray:
+        """
+        Compute the Burau fingerprint of every braid of the collection
+
+        Words are sorted by length before being processed by chunks, to limit padding.
+
+        Args:
+            chunk_size(Optional(int)): number of words processed together. Default to 65536
+
+        Returns:
+            np.ndarray: uint64 array, with the same values as Braid.fingerprint
+        """
+        fingerprints = np.empty(len(self), dtype=np.uint64)
+        for idx, words in self._sorted_chunks(chunk_size):
+            fingerprints[idx] = batch_burau_fingerprints(
+                words, self.n_strands, chunk_size=chunk_size
+            )
+        return fingerprints
+
+    def _sorted_chunks(
+        self, chunk_size: int
+    ) -> Iterator[tuple[np.ndarray, np.ndarray]]:
+        """
+        Words sorted by length, padded with zeros by chunks
+
+        Args:
+            chunk_size(int): number of words per chunk
+
+        Returns:
+            Iterator[tuple[np.ndarray, np.ndarray]]: indices of the words and padded words of each chunk
+        """
+        order = np.argsort(self.lengths, kind="stable")
+        for start in range(0, len(self), chunk_size):
+            idx = order[start : start + chunk_size]
+            lengths = self.lengths[idx]
+            width = int(lengths.max()) if lengths.size else 0
+            words = np.zeros((idx.size, width), dtype=np.int16)
+            positions = self.offsets[idx, None] + np.arange(width)
+            mask = np.arange(width) < lengths[:, None]
+            words[mask] = self.generators[positions[mask]]
+            yield idx, words
+
+    def dynnikov_coordinates(self, chunk_size: int = 65536) -> np.ndarray:
+        """
+        Compute the Dynnikov coordinates of every braid of the collection, with one NumPy update per generator
+        position for a whole chunk
+
+        Args:
+            chunk_size(Optional(int)): number of words processed together. Default to 65536
+
+        Returns:
+            np.ndarray: array of shape (len(collection), 2(n_strands - 1)), with the same values as
+            Braid.dynnikov_coordinates, int64 or object if some coordinates do not fit in int64
+        """
+        coordinates = np.empty((len(self), 2 * (self.n_strands - 1)), dtype=np.int64)
+        for idx, words in self._sorted_chunks(chunk_size):
+            chunk = batch_dynnikov_coordinates(words, self.n_strands)
+            if chunk.dtype == object and coordinates.dtype != object:
+                coordinates = coordinates.astype(object)
+            coordinates[idx] = chunk
+        return coordinates
+
+    def closure_analysis(self, chunk_size: int = 65536) -> list[ClosureAnalysis]:
+        """
+        Analyse the closure of every braid of the collection, with one NumPy update per generator position
+        for a whole chunk
+
+        Args:
+            chunk_size(Optional(int)): number of words processed together. Default to 65536
+
+        Returns:
+            list[ClosureAnalysis]: the same analyses as Braid.closure_analysis, in the order of the collection
+        """
+        analyses: list[Optional[ClosureAnalysis]] = [None] * len(self)
+        for idx, words in self._sorted_chunks(chunk_size):
+            for k, analysis in zip(idx, batch_closure_analysis(words, self.n_strands)):
+                analyses[k] = analysis
+        return analyses
+
+    def fingerprint_buckets(self) -> dict[int, list[int]]:
+        """
+        Group the indices of the braids by fingerprint.
+
+        Braids in different buckets are not equivalent.
+        Braids in the same bucket are very likely equivalent, which can be confirmed with ==
+
+        Returns:
+            dict[int, list[int]]: indices of the braids for each fingerprint
+        """
+        fingerprints = self.fingerprints()
+        order = np.argsort(fingerprints, kind="stable")
+        sorted_fingerprints = fingerprints[order]
+        boundaries = np.flatnonzero(np.diff(sorted_fingerprints)) + 1
+        return {
+            int(sorted_fingerprints[group[0]]): order[group].tolist()
+            for group in np.split(np.arange(order.size), boundaries)
+            if group.size
+        }
@@ -0,0 +1,368 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at https://mozilla.org/MPL/2.0/.
+
+"""
+Filename: braid_enumeration.py
+Description: Breadth-first enumeration of all the distinct braids up to a given word length
+Authors: Baptiste Labat
+Created: 2026-10-19
+Repository: https://github.com/baptistelabat/braidpy
+License: Mozilla Public License 2.0
+"""
+
+import os
+import pickle
+from dataclasses import dataclass, field
+from functools import lru_cache
+from itertools import permutations
+from pathlib import Path
+from typing import Iterator, List, Optional, Set, Tuple
+
+from braidpy.braid import Braid
+from braidpy.utils import PositiveInt, StrictlyPositiveInt
+
+# A braid Δᵖ A₁...Aₖ in classical left normal form is packed in a single integer (see PermutationBraidTables.pack),
+# which is several times lighter than a tuple when millions of them are kept in a set
+NormalFormKey = int
+
+
+class PermutationBraidTables:
+    def __init__(self, n_strands: StrictlyPositiveInt) -> None:
+        """
+        Lookup tables on the n! positive permutation braids (simple elements of the classical Garside structure)
+
+        A permutation π is written in one line notation, σᵢ being the transposition of positions i and i+1.
+        Right multiplication by σᵢ swaps positions i and i+1, left multiplication swaps values i and i+1.
+
+        Args:
+            n_strands(StrictlyPositiveInt): number of strands
+        """
+        self.n_strands = StrictlyPositiveInt(n_strands)
+        n = self.n_strands
+        self.permutations: List[Tuple[int, ...]] = list(permutations(range(n)))
+        index = {perm: k for k, perm in enumerate(self.permutations)}
+        self.identity = index[tuple(range(n))]
+        self.delta = index[tuple(range(n - 1, -1, -1))]
+
+        # Bit i-1 set for σᵢ
+        self.finishing: List[int] = []  # right descents: A = A'σᵢ
+        self.starting: List[int] = []  # left descents: A = σᵢA'
+        self.times_right: List[List[int]] = []  # index of Aσᵢ, A without descent i
+        self.strip_left: List[List[int]] = []  # index of A' with A = σᵢA'
+        self.tau: List[int] = []  # index of ΔAΔ⁻¹
+        for perm in self.permutations:
+            inverse = [0] * n
+            for position, value in enumerate(perm):
+                inverse[value] = position
+            finishing = starting = 0
+            times_right, strip_left = [], []
+            for i in range(n - 1):
+                if perm[i] > perm[i + 1]:
+                    finishing |= 1 << i
+                if inverse[i] > inverse[i + 1]:
+                    starting |= 1 << i
+                swapped = list(perm)
+                swapped[i], swapped[i + 1] = swapped[i + 1], swapped[i]
+                times_right.append(index[tuple(swapped)])
+                relabeled = [i + 1 if v == i else i if v == i + 1 else v for v in perm]
+                strip_left.append(index[tuple(relabeled)])
+            self.finishing.append(finishing)
+            self.starting.append(starting)
+            self.times_right.append(times_right)
+            self.strip_left.append(strip_left)
+            self.tau.append(index[tuple(n - 1 - perm[n - 1 - x] for x in range(n))])
+        # Δσᵢ⁻¹ is simple, obtained by removing σᵢ at the end of Δ
+        self.delta_over: List[int] = [
+            self.times_right[self.delta][i] for i in range(n - 1)
+        ]
+
+    def pack(self, p: int, factors: List[int]) -> NormalFormKey:
+        """
+        Pack a normal form in an integer: the factors are the digits in base n! above the 32 low bits holding p
+
+        Factors are never the identity, whose index is 0, so the number of factors is the number of digits.
+
+        Args:
+            p(int): exponent of Δ
+            factors(List[int]): indices of the permutations of A₁...Aₖ
+
+        Returns:
+            NormalFormKey: the packed normal form
+        """
+        code = 0
+        base = len(self.permutations)
+        for a in reversed(factors):
+            code = code * base + a
+        # Zigzag encoding of the sign of p
+        return (code << 32) | (2 * p if p >= 0 else -2 * p - 1)
+
+    def unpack(self, key: NormalFormKey) -> Tuple[int, List[int]]:
+        """
+        Args:
+            key(NormalFormKey): the packed normal form
+
+        Returns:
+            Tuple[int, List[int]]: exponent of Δ and indices of the factors
+        """
+        zigzag = key & 0xFFFFFFFF
+        p = zigzag // 2 if zigzag % 2 == 0 else -(zigzag + 1) // 2
+        code = key >> 32
+        base = len(self.permutations)
+        factors = []
+        while code:
+            code, a = divmod(code, base)
+            factors.append(a)
+        return p, factors
+
+    def word(self, a: int) -> List[int]:
+        """
+        Positive Artin word of a permutation braid
+
+        Args:
+            a(int): index of the permutation
+
+        Returns:
+            List[int]: the generators
+        """
+        word: List[int] = []
+        while self.finishing[a]:
+            i = (self.finishing[a] & -self.finishing[a]).bit_length() - 1
+            a = self.times_right[a][i]
+            word.append(i + 1)
+        return word[::-1]
+
+    def times_simple(
+        self, p: int, factors: List[int], simple: int
+    ) -> Tuple[int, List[int]]:
+        """
+        Left normal form of Δᵖ A₁...Aₖ X, from the left normal form Δᵖ A₁...Aₖ and a simple element X
+
+        A single right to left pass making each pair left weighted is enough.
+
+        Args:
+            p(int): exponent of Δ
+            factors(List[int]): indices of A₁...Aₖ, modified in place
+            simple(int): index of X
+
+        Returns:
+            Tuple[int, List[int]]: the new exponent and factors
+        """
+        factors.append(simple)
+        finishing, starting = self.finishing, self.starting
+        times_right, strip_left = self.times_right, self.strip_left
+        for j in range(len(factors) - 1, 0, -1):
+            a, b = factors[j - 1], factors[j]
+            moved = starting[b] & ~finishing[a]
+            if not moved:
+                break
+            while moved:
+                i = (moved & -moved).bit_length() - 1
+                a = times_right[a][i]
+                b = strip_left[b][i]
+                moved = starting[b] & ~finishing[a]
+            factors[j - 1], factors[j] = a, b
+        while factors and factors[-1] == self.identity:
+            factors.pop()
+        n_delta = 0
+        while n_delta < len(factors) and factors[n_delta] == self.delta:
+            n_delta += 1
+        return p + n_delta, factors[n_delta:]
+
+    def times_generator(self, key: NormalFormKey, generator: int) -> NormalFormKey:
+        """
+        Normal form of the braid times σᵢ^±1
+
+        σᵢ⁻¹ is written Δ⁻¹(Δσᵢ⁻¹), and Δ⁻¹ is moved to the front with τ.
+
+        Args:
+            key(NormalFormKey): packed normal form
+            generator(int): signed Artin generator
+
+        Returns:
+            NormalFormKey: the packed normal form of the product
+        """
+        p, factors = self.unpack(key)
+        if generator > 0:
+            p, factors = self.times_simple(
+                p, factors, self.times_right[self.identity][generator - 1]
+            )
+        else:
+            tau = self.tau
+            p, factors = self.times_simple(
+                p - 1, [tau[a] for a in factors], self.delta_over[-generator - 1]
+            )
+        return self.pack(p, factors)
+
+    def to_braid(self, key: NormalFormKey) -> Braid:
+        """
+        Braid written as Δᵖ followed by the permutation braids
+
+        Args:
+            key(NormalFormKey): packed normal form
+
+        Returns:
+            Braid: the braid
+        """
+        delta = self.word(self.delta)
+        p, factors = self.unpack(key)
+        gens = delta * p if p >= 0 else [-g for g in reversed(delta)] * -p
+        for a in factors:
+            gens += self.word(a)
+        return Braid(gens, self.n_strands)
+
+
+@lru_cache(maxsize=None)
+def permutation_braid_tables(n_strands: StrictlyPositiveInt) -> PermutationBraidTables:
+    """
+    Tables computed once per number of strands
+
+    Args:
+        n_strands(StrictlyPositiveInt): number of strands
+
+    Returns:
+        PermutationBraidTables: the tables
+    """
+    return PermutationBraidTables(n_strands)
+
+
+def classical_normal_form(braid: Braid) -> NormalFormKey:
+    """
+    Left normal form of a braid in the classical Garside structure, as a hashable key
+
+    Args:
+        braid(Braid): the braid
+
+    Returns:
+        NormalFormKey: packed normal form, equal for two braids if and only if they are equivalent
+    """
+    tables = permutation_braid_tables(braid.n_strands)
+    key: NormalFormKey = 0
+    for g in braid.generators:
+        if g != 0:
+            key = tables.times_generator(key, g)
+    return key
+
+
+@dataclass
+class EnumerationState:
+    """
+    State of a breadth-first enumeration, saved in checkpoints
+
+    -n_strands: number of strands
+    -length: word length of the current sphere
+    -previous: normal forms of the braids of length length - 1
+    -current: normal forms of the braids of length length
+    -counts: number of braids of each length from 0 to length
+    """
+
+    n_strands: StrictlyPositiveInt
+    length: PositiveInt = 0
+    previous: Set[NormalFormKey] = field(default_factory=set)
+    current: Set[NormalFormKey] = field(default_factory=lambda: {0})
+    counts: List[PositiveInt] = field(default_factory=lambda: [1])
+
+
+class BraidEnumerator:
+    def __init__(
+        self,
+        n_strands: StrictlyPositiveInt,
+        max_length: PositiveInt,
+        checkpoint_path: Optional[str | Path] = None,
+    ) -> None:
+        """
+        Enumerate all the distinct braids whose shortest word has a given length, by increasing length
+
+        Each sphere (braids of length exactly l) is obtained by multiplying the braids of the previous sphere by
+        each σᵢ^±1, the products being deduplicated with a hash set of their left normal form.
+        As word length and exponent sum have the same parity, a product is either in the sphere l - 1 or in the
+        new sphere l + 1: only two spheres are kept in memory.
+
+        The classical Garside structure (n! permutation braids) is used, for which multiplying by a generator is
+        a single right to left pass on lookup tables.
+
+        Args:
+            n_strands(StrictlyPositiveInt): number of strands
+            max_length(PositiveInt): maximal word length
+            checkpoint_path(Optional(str | Path)): file where the state is saved after each sphere, and resumed from
+                if it exists. Default to None (no checkpoint)
+        """
+        self.n_strands = StrictlyPositiveInt(n_strands)
+        self.max_length = PositiveInt(max_length)
+        self.checkpoint_path = (
+            None if checkpoint_path is None else Path(checkpoint_path)
+        )
+        self.tables = permutation_braid_tables(self.n_strands)
+        self.state = self._load() or EnumerationState(self.n_strands)
+
+    def _load(self) -> Optional[EnumerationState]:
+        if self.checkpoint_path is None or not self.checkpoint_path.exists():
+            return None
+        with open(self.checkpoint_path, "rb") as f:
+            state = pickle.load(f)
+        if state.n_strands != self.n_strands:
+            raise ValueError(
+                f"Checkpoint is for {state.n_strands} strands, not {self.n_strands}"
+            )
+        return state
+
+    def _save(self) -> None:
+        if self.checkpoint_path is None:
+            return
+        # Written aside then renamed, so that an interruption never leaves a truncated checkpoint
+        tmp_path = self.checkpoint_path.with_name(self.checkpoint_path.name + ".tmp")
+        with open(tmp_path, "wb") as f:
+            pickle.dump(self.state, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, self.checkpoint_path)
+
+    def _next_sphere(self) -> Set[NormalFormKey]:
+        times_generator = self.tables.times_generator
+        previous = self.state.previous
+        generators = [s * g for g in range(1, self.n_strands) for s in (1, -1)]
+        sphere: Set[NormalFormKey] = set()
+        for key in self.state.current:
+            for g in generators:
+                product = times_generator(key, g)
+                if product not in previous:
+                    sphere.add(product)
+        return sphere
+
+    def spheres(self) -> Iterator[Tuple[PositiveInt, Set[NormalFormKey]]]:
+        """
+        Generate the spheres, starting after the one reached by a resumed checkpoint
+
+        Returns:
+            Iterator[Tuple[PositiveInt, Set[NormalFormKey]]]: length and normal forms of the braids of this length
+        """
+        if self.state.length == 0:
+            yield 0, self.state.current
+        while self.state.length < self.max_length and self.n_strands > 1:
+            sphere = self._next_sphere()
+            self.state.previous, self.state.current = self.state.current, sphere
+            self.state.length += 1
+            self.state.counts.append(len(sphere))
+            self._save()
+            yield self.state.length, sphere
+
+    def count(self) -> List[PositiveInt]:
+        """
+        Count the braids of each length without keeping them
+
+        Returns:
+            List[PositiveInt]: number of distinct braids of length 0, 1, ..., max_length
+        """
+        for _ in self.spheres():
+            pass
+        return list(self.state.counts[: self.max_length + 1])
+
+    def __iter__(self) -> Iterator[Braid]:
+        """
+        Generate one word of each distinct braid, by increasing length
+
+        Returns:
+            Iterator[Braid]: braids written in left normal form
+        """
+        to_braid = self.tables.to_braid
+        for _, sphere in self.spheres():
+            for key in sphere:
+                yield to_braid(key)
@@ -0,0 +1,201 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at https://mozilla.org/MPL/2.0/.
+
+"""
+Filename: braid_formatting.py
+Description: Formatting of braid words with precomputed symbol tables
+Authors: Baptiste Labat
+Created: 2026-10-19
+Repository: https://github.com/baptistelabat/braidpy
+License: Mozilla Public License 2.0
+"""
+
+import enum
+from functools import lru_cache
+from typing import Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from braidpy.utils import StrictlyPositiveInt
+
+
+class BraidWordNotation(str, enum.Enum):
+    ARTIN = "ARTIN"
+    ALPHA = "ALPHA"
+    DEFAULT = "DEFAULT"
+
+
+class SymbolTable:
+    def __init__(
+        self,
+        symbols: Sequence[str],
+        offset: int,
+        separator: str = "",
+        prefix: str = "",
+        suffix: str = "",
+        empty: Optional[str] = None,
+    ) -> None:
+        """
+        Symbols of the signed generators, generator g being written symbols[g + offset]
+
+        Args:
+            symbols(Sequence[str]): symbols of -offset, ..., -1, 0, 1, ...
+            offset(int): index of the neutral element in symbols
+            separator(Optional(str)): inserted between symbols. Default to ""
+            prefix(Optional(str)): written before the word. Default to ""
+            suffix(Optional(str)): written after the word. Default to ""
+            empty(Optional(str)): whole word written for the empty braid. Default to prefix + suffix
+        """
+        self.symbols = tuple(symbols)
+        self.offset = offset
+        self.separator = separator
+        self.prefix = prefix
+        self.suffix = suffix
+        self.empty = prefix + suffix if empty is None else empty
+        self._array = np.array(self.symbols, dtype=object)
+
+    def _lookup(self, generators: Sequence[int] | np.ndarray) -> List[str]:
+        if isinstance(generators, np.ndarray):
+            indices = generators.astype(np.int64) + self.offset
+            if indices.size and indices.min() < 0:
+                raise IndexError("No symbol for generator {}".format(generators.min()))
+            return self._array[indices].tolist()
+        symbols, offset = self.symbols, self.offset
+        if generators and min(generators) < -offset:
+            raise IndexError("No symbol for generator {}".format(min(generators)))
+        return [symbols[g + offset] for g in generators]
+
+    def format(self, generators: Sequence[int] | np.ndarray) -> str:
+        """
+        Format a whole word at once
+
+        Args:
+            generators(Sequence[int] | np.ndarray): signed Artin generators
+
+        Returns:
+            str: the formatted word
+        """
+        if len(generators) == 0:
+            return self.empty
+        return self.prefix + self.separator.join(self._lookup(generators)) + self.suffix
+
+    def chunks(
+        self,
+        generators: Sequence[int] | np.ndarray,
+        chunk_size: StrictlyPositiveInt = 65536,
+    ) -> Iterator[str]:
+        """
+        Format a word by pieces, whose concatenation is the same as format(generators)
+
+        Args:
+            generators(Sequence[int] | np.ndarray): signed Artin generators
+            chunk_size(Optional(StrictlyPositiveInt)): number of generators per piece. Default to 65536
+
+        Returns:
+            Iterator[str]: pieces of the formatted word
+        """
+        if len(generators) == 0:
+            yield self.empty
+            return
+        yield self.prefix
+        for start in range(0, len(generators), chunk_size):
+            if start:
+                yield self.separator
+            yield self.separator.join(
+                self._lookup(generators[start : start + chunk_size])
+            )
+        yield self.suffix
+
+
+@lru_cache(maxsize=None)
+def notation_table(
+    target: BraidWordNotation | str, n_strands: StrictlyPositiveInt
+) -> SymbolTable:
+    """
+    Symbol table of a predefined notation, computed once per notation and number of strands
+
+    Args:
+        target(BraidWordNotation | str): among 'alpha', 'artin' and 'default' (also '')
+        n_strands(StrictlyPositiveInt): number of strands
+
+    Returns:
+        SymbolTable: the table
+    """
+    gens = range(-(n_strands - 1), n_strands)
+    match target.upper():
+        case BraidWordNotation.ARTIN.value:
+            symbols = [
+                "s_{" + str(abs(g)) + "}^{" + str(abs(g) / g) + "}" if g != 0 else "e"
+                for g in gens
+            ]
+            return SymbolTable(symbols, n_strands - 1, separator=" ", empty="e")
+        case BraidWordNotation.ALPHA.value:
+            symbols = [
+                chr(ord("Q") + int(abs(g) / g) * 16 + abs(g) - 1) if g != 0 else "#"
+                for g in gens
+            ]
+            return SymbolTable(symbols, n_strands - 1, empty="#")
+        case BraidWordNotation.DEFAULT.value | "":
+            # This is the syntax used by math-braid and braidlab
+            return SymbolTable(
+                [str(g) for g in gens],
+                n_strands - 1,
+                separator=" : ",
+                prefix="<",
+                suffix=">",
+            )
+        case _:
+            raise NotImplementedError(
+                f"target notation should be among {[notation.value for notation in BraidWordNotation]}"
+            )
+
+
+def custom_table(
+    generator_symbols: Sequence[str],
+    inverse_generator_symbols: Sequence[str],
+    zero_symbol: str,
+    separator: str,
+) -> SymbolTable:
+    """
+    Symbol table from the symbols of each generator and of its inverse
+
+    Args:
+        generator_symbols(Sequence[str]): symbols of σ₁, σ₂...
+        inverse_generator_symbols(Sequence[str]): symbols of σ₁⁻¹, σ₂⁻¹...
+        zero_symbol(str): symbol of the neutral element
+        separator(str): inserted between symbols
+
+    Returns:
+        SymbolTable: the table
+    """
+    symbols: List[str] = list(reversed(inverse_generator_symbols))
+    symbols += [zero_symbol] + list(generator_symbols)
+    return SymbolTable(symbols, len(inverse_generator_symbols), separator=separator)
+
+
+def format_words(
+    generators: np.ndarray, offsets: np.ndarray, table: SymbolTable
+) -> List[str]:
+    """
+    Format many words stored in a flat array, with a single table lookup
+
+    Args:
+        generators(np.ndarray): concatenation of the signed Artin generators of all the words
+        offsets(np.ndarray): word k is generators[offsets[k]:offsets[k + 1]]
+        table(SymbolTable): the symbols
+
+    Returns:
+        List[str]: the formatted words
+    """
+    symbols = table._lookup(np.asarray(generators))
+    bounds: List[Tuple[int, int]] = list(
+        zip(offsets[:-1].tolist(), offsets[1:].tolist())
+    )
+    join = table.separator.join
+    return [
+        table.prefix + join(symbols[start:stop]) + table.suffix
+        if stop > start
+        else table.empty
+        for start, stop in bounds
+    ]
@@ -0,0 +1,160 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at https://mozilla.org/MPL/2.0/.
+
+"""
+Filename: closure.py
+Description: Components, linking numbers and crossing counts of the closure of braids
+Authors: Baptiste Labat
+Created: 2026-10-19
+Repository: https://github.com/baptistelabat/braidpy
+License: Mozilla Public License 2.0
+"""
+
+from dataclasses import dataclass
+from typing import List, Sequence, Tuple
+
+import numpy as np
+
+from braidpy.utils import StrictlyPositiveInt
+
+
+@dataclass
+class ClosureAnalysis:
+    """
+    Strands are numbered from 1 by their starting position, as in Braid.perm
+
+    -components: strands of each component of the closure, components being sorted by their smallest strand
+    -linking_matrix: symmetric matrix of the linking numbers between components, with zero diagonal
+    -self_writhe: sum of the signs of the crossings of each component with itself
+    -crossing_counts: number of crossings of each strand, index 0 being strand 1
+    """
+
+    components: List[Tuple[int, ...]]
+    linking_matrix: np.ndarray
+    self_writhe: np.ndarray
+    crossing_counts: np.ndarray
+
+    @property
+    def n_components(self) -> int:
+        return len(self.components)
+
+
+def _component_labels(final: np.ndarray) -> np.ndarray:
+    """
+    Label each strand by the smallest strand of its cycle, for permutations of shape (B, n)
+
+    final[b, p] is the strand ending at position p, which the closure connects to the strand starting at p.
+    Labels are propagated along the cycles by n - 1 vectorized steps.
+    """
+    n_words, n_strands = final.shape
+    # next_strand[b, s]: strand following s in the closure
+    next_strand = np.empty_like(final)
+    np.put_along_axis(next_strand, final, np.arange(n_strands)[None, :], axis=1)
+    labels = np.broadcast_to(np.arange(n_strands), (n_words, n_strands)).copy()
+    successor = next_strand.copy()
+    for _ in range(n_strands - 1):
+        labels = np.minimum(labels, np.take_along_axis(labels, successor, axis=1))
+        successor = np.take_along_axis(next_strand, successor, axis=1)
+    return labels
+
+
+def _analysis(
+    labels: np.ndarray,
+    pair_signs: np.ndarray,
+    crossing_counts: np.ndarray,
+) -> ClosureAnalysis:
+    """Compress the matrices indexed by component labels to the components of one braid"""
+    roots = np.flatnonzero(labels == np.arange(labels.size))
+    components = [tuple((np.flatnonzero(labels == r) + 1).tolist()) for r in roots]
+    signs = pair_signs[np.ix_(roots, roots)]
+    self_writhe = np.diag(signs).copy()
+    linking = signs + signs.T
+    np.fill_diagonal(linking, 0)
+    # Crossings between two components always come in pairs of equal total sign
+    return ClosureAnalysis(components, linking // 2, self_writhe, crossing_counts)
+
+
+def batch_closure_analysis(
+    words: np.ndarray, n_strands: StrictlyPositiveInt
+) -> List[ClosureAnalysis]:
+    """
+    Analyse the closures of braids, in a single pass over the generators
+
+    The strands at each position are tracked for all the braids at once. The strands of each crossing are recorded,
+    and once components are known from the final permutation, signs are accumulated per pair of components
+    and crossings per strand. Cost is O(L + n²) per braid, with one NumPy update per generator position.
+
+    Args:
+        words(np.ndarray): padded words of shape (B, L), zeros being ignored
+        n_strands(StrictlyPositiveInt): number of strands
+
+    Returns:
+        List[ClosureAnalysis]: analysis of each braid
+    """
+    words = np.atleast_2d(np.asarray(words)).astype(np.int64)
+    n_words, length = words.shape
+    if words.size and np.abs(words).max() >= n_strands:
+        raise ValueError(f"Generator index out of bounds for {n_strands} strands")
+    rows = np.arange(n_words)
+    strands = np.broadcast_to(np.arange(n_strands), (n_words, n_strands)).copy()
+    left = np.zeros((n_words, length), dtype=np.int64)
+    right = np.zeros((n_words, length), dtype=np.int64)
+    for step in range(length):
+        i = np.maximum(np.abs(words[:, step]) - 1, 0)
+        left[:, step] = strands[rows, i]
+        right[:, step] = strands[rows, i + 1] if n_strands > 1 else left[:, step]
+        active = words[:, step] != 0
+        strands[rows[active], i[active]] = right[active, step]
+        strands[rows[active], i[active] + 1] = left[active, step]
+
+    labels = _component_labels(strands)
+    active = words != 0
+    word_index = np.broadcast_to(rows[:, None], words.shape)[active]
+    left_label = np.take_along_axis(labels, left, axis=1)[active]
+    right_label = np.take_along_axis(labels, right, axis=1)[active]
+    pair_signs = np.zeros((n_words, n_strands, n_strands), dtype=np.int64)
+    np.add.at(pair_signs, (word_index, left_label, right_label), np.sign(words[active]))
+    crossing_counts = np.zeros((n_words, n_strands), dtype=np.int64)
+    np.add.at(crossing_counts, (word_index, left[active]), 1)
+    np.add.at(crossing_counts, (word_index, right[active]), 1)
+    return [
+        _analysis(labels[b], pair_signs[b], crossing_counts[b]) for b in range(n_words)
+    ]
+
+
+def closure_analysis(
+    generators: Sequence[int], n_strands: StrictlyPositiveInt
+) -> ClosureAnalysis:
+    """
+    Analyse the closure of a braid, see batch_closure_analysis
+
+    Per generator NumPy calls would dominate for a single word, so strands are tracked with Python lists.
+
+    Args:
+        generators(Sequence[int]): signed Artin generators
+        n_strands(StrictlyPositiveInt): number of strands
+
+    Returns:
+        ClosureAnalysis: the analysis
+    """
+    strands = list(range(n_strands))
+    crossings = []
+    for g in generators:
+        if g == 0:
+            continue
+        i = abs(g) - 1
+        if i + 1 >= n_strands:
+            raise ValueError(f"Generator index out of bounds for {n_strands} strands")
+        a, b = strands[i], strands[i + 1]
+        crossings.append((a, b, 1 if g > 0 else -1))
+        strands[i], strands[i + 1] = b, a
+
+    labels = _component_labels(np.array([strands]))[0]
+    pair_signs = np.zeros((n_strands, n_strands), dtype=np.int64)
+    crossing_counts = np.zeros(n_strands, dtype=np.int64)
+    for a, b, sign in crossings:
+        pair_signs[labels[a], labels[b]] += sign
+        crossing_counts[a] += 1
+        crossing_counts[b] += 1
+    return _analysis(labels, pair_signs, crossing_counts)
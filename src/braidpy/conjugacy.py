@@ -0,0 +1,459 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at https://mozilla.org/MPL/2.0/.
+
+"""
+Filename: conjugacy.py
+Description: Exploration of conjugacy classes of braids
+Authors: Baptiste Labat
+Created: 2026-10-19
+Repository: https://github.com/baptistelabat/braidpy
+License: Mozilla Public License 2.0
+"""
+
+import time
+from collections.abc import Hashable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from enum import Enum
+from typing import Dict, List, Optional, Tuple
+
+from braidpy.braid import Braid, SignedCrossingIndex
+from braidpy.garside_canonical_form import GarsideCanonicalFactors, simple_elements
+from braidpy.utils import FunctionalException, PositiveInt, StrictlyPositiveInt
+
+
+class ConjugateDeduplication(str, Enum):
+    """
+    Define how conjugates are identified
+        -normal_form: exact, two conjugates are the same if they have the same Garside normal form
+        -fingerprint: faster, two conjugates are the same if they have the same Burau fingerprint (rare false merges)
+    """
+
+    NORMAL_FORM = "NORMAL_FORM"
+    FINGERPRINT = "FINGERPRINT"
+
+
+def _dedup_key(braid: Braid, dedup: ConjugateDeduplication) -> Hashable:
+    if dedup == ConjugateDeduplication.FINGERPRINT:
+        return braid.fingerprint()
+    return braid.get_canonical_factors().key
+
+
+def _expand(
+    words: List[List[SignedCrossingIndex]],
+    n_strands: StrictlyPositiveInt,
+    conjugators: List[List[SignedCrossingIndex]],
+    dedup: ConjugateDeduplication,
+) -> List[tuple[List[SignedCrossingIndex], Hashable]]:
+    """
+    Conjugate each word by each conjugator, and compute the deduplication keys.
+
+    This is a module level function so that it can be sent to worker processes.
+
+    Args:
+        words(List[List[SignedCrossingIndex]]): words to conjugate
+        n_strands(StrictlyPositiveInt): number of strands
+        conjugators(List[List[SignedCrossingIndex]]): words of the conjugating braids
+        dedup(ConjugateDeduplication): how to compute keys
+
+    Returns:
+        List[tuple[List[SignedCrossingIndex], Hashable]]: the freely reduced conjugates with their key
+    """
+    results = []
+    for word in words:
+        for c in conjugators:
+            conj = Braid(c + word + [-g for g in reversed(c)], n_strands).free_reduce()
+            results.append((conj.generators, _dedup_key(conj, dedup)))
+    return results
+
+
+class ConjugacyExplorer:
+    def __init__(
+        self,
+        braid: Braid,
+        conjugators: Optional[List[Braid]] = None,
+        max_depth: PositiveInt = 3,
+        max_size: StrictlyPositiveInt = 10_000,
+        dedup: ConjugateDeduplication | str = ConjugateDeduplication.NORMAL_FORM,
+        n_processes: Optional[StrictlyPositiveInt] = None,
+        min_parallel_level_size: StrictlyPositiveInt = 256,
+    ) -> None:
+        """
+        Breadth first exploration of the conjugacy class of a braid.
+
+        Level k contains the conjugates c₁...cₖ β cₖ⁻¹...c₁⁻¹ which were not found at a previous level.
+        Contrary to properties.conjugacy_class, equivalent words are kept only once.
+
+        Args:
+            braid(Braid): the braid whose conjugacy class is explored
+            conjugators(Optional(List[Braid])): conjugating braids at each step. Default to all σᵢ and σᵢ⁻¹
+            max_depth(Optional(PositiveInt)): maximum number of successive conjugations. Default to 3
+            max_size(Optional(StrictlyPositiveInt)): maximum number of distinct conjugates. Default to 10 000
+            dedup(Optional(ConjugateDeduplication|str)): how conjugates are identified. Default to normal form
+            n_processes(Optional(StrictlyPositiveInt)): number of worker processes to expand each level. Default to None (no pool)
+            min_parallel_level_size(Optional(StrictlyPositiveInt)): smaller levels are expanded in process. Default to 256
+        """
+        self.braid = braid
+        if conjugators is None:
+            conjugators = [
+                Braid([i], braid.n_strands) for i in range(1, braid.n_strands)
+            ] + [Braid([-i], braid.n_strands) for i in range(1, braid.n_strands)]
+        if any(c.n_strands != braid.n_strands for c in conjugators):
+            raise ValueError("Braids must have the same number of strands")
+        self.conjugators = conjugators
+        self.max_depth = PositiveInt(max_depth)
+        self.max_size = StrictlyPositiveInt(max_size)
+        self.dedup = ConjugateDeduplication(
+            dedup.upper() if isinstance(dedup, str) else dedup
+        )
+        self.n_processes = n_processes
+        self.min_parallel_level_size = min_parallel_level_size
+
+        self.shortest: Optional[Braid] = None
+        self.depth_reached: PositiveInt = PositiveInt(0)
+        self.n_visited: PositiveInt = PositiveInt(0)
+        self.exhausted = False
+
+    def _record(self, conj: Braid) -> None:
+        self.n_visited += 1
+        if self.shortest is None or len(conj) < len(self.shortest):
+            self.shortest = conj
+
+    def __iter__(self) -> Iterator[Braid]:
+        """
+        Stream the distinct conjugates, in breadth first order, starting with the braid itself
+
+        Returns:
+            Iterator[Braid]: the freely reduced conjugates
+        """
+        self.shortest = None
+        self.depth_reached = PositiveInt(0)
+        self.n_visited = PositiveInt(0)
+        self.exhausted = False
+
+        n = self.braid.n_strands
+        conjugator_words = [c.generators for c in self.conjugators]
+        start = self.braid.free_reduce()
+        # Shortest word found so far for each distinct conjugate
+        best = {_dedup_key(start, self.dedup): start.generators}
+        self._record(start)
+        yield start
+
+        frontier = list(best)
+        executor = (
+            ProcessPoolExecutor(max_workers=self.n_processes)
+            if self.n_processes
+            else None
+        )
+        try:
+            for depth in range(1, self.max_depth + 1):
+                if not frontier:
+                    self.exhausted = True
+                    return
+                words = [best[key] for key in frontier]
+                if executor is not None and len(words) >= max(
+                    self.min_parallel_level_size, 2 * self.n_processes
+                ):
+                    chunk = -(-len(words) // (4 * self.n_processes))
+                    chunks = [words[i : i + chunk] for i in range(0, len(words), chunk)]
+                    expanded = executor.map(
+                        _expand,
+                        chunks,
+                        [n] * len(chunks),
+                        [conjugator_words] * len(chunks),
+                        [self.dedup] * len(chunks),
+                    )
+                    candidates = (item for part in expanded for item in part)
+                else:
+                    candidates = iter(_expand(words, n, conjugator_words, self.dedup))
+
+                self.depth_reached = PositiveInt(depth)
+                next_frontier = []
+                for word, key in candidates:
+                    if key in best:
+                        # Same conjugate, but maybe with a shorter word to expand later
+                        if len(word) < len(best[key]):
+                            best[key] = word
+                            if len(word) < len(self.shortest):
+                                self.shortest = Braid(word, n)
+                        continue
+                    best[key] = word
+                    conj = Braid(word, n)
+                    self._record(conj)
+                    next_frontier.append(key)
+                    yield conj
+                    if self.n_visited >= self.max_size:
+                        return
+                frontier = next_frontier
+            self.exhausted = not frontier
+        finally:
+            if executor is not None:
+                executor.shutdown(cancel_futures=True)
+
+    def run(self) -> List[Braid]:
+        """
+        Explore the conjugacy class up to the configured bounds
+
+        Returns:
+            List[Braid]: the distinct conjugates found
+        """
+        return list(self)
+
+
+def shortest_conjugate(braid: Braid, **kwargs) -> Braid:
+    """
+    Search for a short representative of the conjugacy class of a braid
+
+    Args:
+        braid(Braid): the braid
+        **kwargs: options of ConjugacyExplorer
+
+    Returns:
+        Braid: the shortest conjugate found, which is not longer than the freely reduced braid
+    """
+    explorer = ConjugacyExplorer(braid, **kwargs)
+    for _ in explorer:
+        pass
+    return explorer.shortest
+
+
+class SummitSetTooLarge(FunctionalException):
+    """
+    Exception to be raised if a super summit set exceeds the allowed size before a conclusion is reached
+    """
+
+    pass
+
+
+@dataclass
+class SummitSetStatistics:
+    """
+    Counters collected while computing a super summit set
+
+    Attributes:
+        n_cycling (int): number of cyclings to reach maximal inf
+        n_decycling (int): number of decyclings to reach minimal sup
+        n_conjugations (int): number of conjugations by simple elements while closing the set
+        size (int): number of elements of the set found so far
+        max_worklist_size (int): largest number of elements waiting to be conjugated
+        complete (bool): True if the whole set was computed
+        elapsed (float): computation time in seconds
+    """
+
+    n_cycling: int = 0
+    n_decycling: int = 0
+    n_conjugations: int = 0
+    size: int = 0
+    max_worklist_size: int = 0
+    complete: bool = False
+    elapsed: float = 0.0
+
+
+@dataclass(frozen=True)
+class SuperSummitSet:
+    """
+    Conjugates of a braid with maximal inf and minimal sup
+
+    The super summit set is finite and is a complete invariant of the conjugacy class:
+    two braids are conjugate if and only if their super summit sets are equal.
+
+    Attributes:
+        elements (Tuple[GarsideCanonicalFactors, ...]): normal forms of the elements, in discovery order
+        inf (int): maximal inf in the conjugacy class
+        sup (int): minimal sup in the conjugacy class
+        statistics (SummitSetStatistics): counters of the computation
+    """
+
+    elements: Tuple[GarsideCanonicalFactors, ...]
+    inf: int
+    sup: int
+    statistics: SummitSetStatistics
+
+    def __len__(self) -> int:
+        return len(self.elements)
+
+    def __contains__(self, braid: Braid) -> bool:
+        key = braid.get_canonical_factors().key
+        return any(e.key == key for e in self.elements)
+
+
+def summit_representative(
+    factors: GarsideCanonicalFactors,
+    statistics: Optional[SummitSetStatistics] = None,
+) -> GarsideCanonicalFactors:
+    """
+    Find an element of the super summit set by iterated cycling and decycling
+
+    inf is maximal once n-1 successive cyclings (the length of δ) do not increase it,
+    and sup is then minimal once n-1 successive decyclings do not decrease it.
+
+    Args:
+        factors(GarsideCanonicalFactors): normal form of the braid
+        statistics(Optional(SummitSetStatistics)): counters to update. Default to None
+
+    Returns:
+        GarsideCanonicalFactors: a conjugate with maximal inf and minimal sup
+    """
+    statistics = statistics if statistics is not None else SummitSetStatistics()
+    bound = factors.n_strands - 1
+
+    best, tries = factors, 0
+    while best.Ai and tries < bound:
+        factors = factors.cycling()
+        statistics.n_cycling += 1
+        tries += 1
+        if factors.inf > best.inf:
+            best, tries = factors, 0
+
+    factors, tries = best, 0
+    while best.Ai and tries < bound:
+        factors = factors.decycling()
+        statistics.n_decycling += 1
+        tries += 1
+        if factors.sup < best.sup:
+            best, tries = factors, 0
+    return best
+
+
+def _close_summit_set(
+    representative: GarsideCanonicalFactors,
+    max_size: StrictlyPositiveInt,
+    statistics: SummitSetStatistics,
+    target: Optional[tuple] = None,
+) -> Dict[tuple, GarsideCanonicalFactors]:
+    """
+    Conjugate by all simple elements until no new element of the super summit set appears
+
+    The super summit set is connected under conjugation by simple elements,
+    so the worklist closure from any of its elements gives the whole set.
+
+    Args:
+        representative(GarsideCanonicalFactors): an element of the super summit set
+        max_size(StrictlyPositiveInt): stop once this number of elements is reached
+        statistics(SummitSetStatistics): counters to update
+        target(Optional(tuple)): normal form key ending the search as soon as it is found. Default to None
+
+    Returns:
+        Dict[tuple, GarsideCanonicalFactors]: the elements found, by normal form key
+    """
+    inf, sup = representative.inf, representative.sup
+    simples = [s for s in simple_elements(representative.n_strands) if s]
+    elements = {representative.key: representative}
+    worklist = [representative]
+    statistics.complete = False
+    while worklist:
+        statistics.max_worklist_size = max(statistics.max_worklist_size, len(worklist))
+        current = worklist.pop()
+        for s in simples:
+            conj = current.conjugate(s)
+            statistics.n_conjugations += 1
+            if conj.inf != inf or conj.sup != sup:
+                continue
+            key = conj.key
+            if key in elements:
+                continue
+            elements[key] = conj
+            worklist.append(conj)
+            statistics.size = len(elements)
+            if key == target or len(elements) >= max_size:
+                return elements
+    statistics.size = len(elements)
+    statistics.complete = True
+    return elements
+
+
+def super_summit_set(
+    braid: Braid, max_size: StrictlyPositiveInt = 10_000
+) -> SuperSummitSet:
+    """
+    Compute the super summit set of a braid
+
+    The size of the set, and not the length of the braid, drives the computation time:
+    each element is conjugated by the Catalan(n) simple elements.
+    If the set has more than max_size elements, the computation stops and statistics.complete is False.
+
+    Args:
+        braid(Braid): the braid
+        max_size(Optional(StrictlyPositiveInt)): maximum number of elements. Default to 10 000
+
+    Returns:
+        SuperSummitSet: the elements with their statistics
+    """
+    start = time.perf_counter()
+    statistics = SummitSetStatistics()
+    representative = summit_representative(braid.get_canonical_factors(), statistics)
+    elements = _close_summit_set(
+        representative, StrictlyPositiveInt(max_size), statistics
+    )
+    statistics.elapsed = time.perf_counter() - start
+    return SuperSummitSet(
+        elements=tuple(elements.values()),
+        inf=representative.inf,
+        sup=representative.sup,
+        statistics=statistics,
+    )
+
+
+def _cycle_type(braid: Braid) -> List[int]:
+    perm = [p - 1 for p in braid.perm()]
+    seen = [False] * len(perm)
+    lengths = []
+    for i in range(len(perm)):
+        length = 0
+        while not seen[i]:
+            seen[i] = True
+            i = perm[i]
+            length += 1
+        if length:
+            lengths.append(length)
+    return sorted(lengths)
+
+
+def is_conjugate(
+    a: Braid,
+    b: Braid,
+    max_size: StrictlyPositiveInt = 10_000,
+    statistics: Optional[SummitSetStatistics] = None,
+) -> bool:
+    """
+    Check if two braids are conjugate, ie if there is a braid c such that b = c * a * c⁻¹
+
+    Cheap invariants (writhe, cycle type of the permutation, inf and sup of summit representatives) are compared first,
+    then the super summit set of a is explored until the summit representative of b is found.
+
+    Args:
+        a(Braid): first braid
+        b(Braid): second braid
+        max_size(Optional(StrictlyPositiveInt)): maximum size of the super summit set. Default to 10 000
+        statistics(Optional(SummitSetStatistics)): counters to update. Default to None
+
+    Returns:
+        bool: True if the braids are conjugate
+
+    Raises:
+        SummitSetTooLarge: if the super summit set exceeds max_size before the answer is known
+    """
+    if a.n_strands != b.n_strands:
+        raise ValueError("Braids must have the same number of strands")
+    start = time.perf_counter()
+    statistics = statistics if statistics is not None else SummitSetStatistics()
+    try:
+        if a.writhe() != b.writhe() or _cycle_type(a) != _cycle_type(b):
+            return False
+        ra = summit_representative(a.get_canonical_factors(), statistics)
+        rb = summit_representative(b.get_canonical_factors(), statistics)
+        if (ra.inf, ra.sup) != (rb.inf, rb.sup):
+            return False
+        if ra.key == rb.key:
+            return True
+        elements = _close_summit_set(ra, max_size, statistics, target=rb.key)
+        if rb.key in elements:
+            return True
+        if not statistics.complete:
+            raise SummitSetTooLarge(
+                f"Super summit set has more than {max_size} elements"
+            )
+        return False
+    finally:
+        statistics.elapsed = time.perf_counter() - start
@@ -0,0 +1,380 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at https://mozilla.org/MPL/2.0/.
+
+"""
+Filename: dynnikov.py
+Description: Action of braids on Dynnikov coordinates of integral laminations
+Authors: Baptiste Labat
+Created: 2026-10-19
+Repository: https://github.com/baptistelabat/braidpy
+License: Mozilla Public License 2.0
+"""
+
+from typing import Optional, Sequence
+
+import numpy as np
+
+from braidpy.utils import StrictlyPositiveInt
+
+# Updates add at most 7 values, so int64 cannot overflow while all coordinates stay below 2⁶⁰
+DYNNIKOV_INT64_BOUND = 1 << 60
+
+
+def initial_coordinates(n_punctures: StrictlyPositiveInt) -> np.ndarray:
+    """
+    Dynnikov coordinates (a₁...aₙ₋₂, b₁...bₙ₋₂) of the lamination made of the curves around each pair of
+    consecutive punctures, aᵢ = 0 and bᵢ = -1
+
+    Args:
+        n_punctures(StrictlyPositiveInt): number of punctures of the disk, at least 2
+
+    Returns:
+        np.ndarray: int64 array of size 2(n_punctures - 2)
+    """
+    if n_punctures < 2:
+        raise ValueError("Dynnikov coordinates need at least 2 punctures")
+    m = n_punctures - 2
+    return np.concatenate([np.zeros(m, dtype=np.int64), -np.ones(m, dtype=np.int64)])
+
+
+def _pos(x: np.ndarray) -> np.ndarray:
+    return np.maximum(x, 0)
+
+
+def _neg(x: np.ndarray) -> np.ndarray:
+    return np.minimum(x, 0)
+
+
+def batch_dynnikov_action(
+    words: np.ndarray,
+    n_punctures: StrictlyPositiveInt,
+    coordinates: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    """
+    Apply braids to laminations with the piecewise linear update rules of Dynnikov coordinates
+
+    The loop is on the generators, all the braids being updated at once. Generator σᵢ exchanges punctures i and
+    i+1 and changes only the coordinates of index i-1 and i (σ₁ and σₙ₋₁ having their own rules).
+    Computation is done in int64 while coordinates stay small enough, and continues with Python integers
+    (object arrays) if they get larger, so that the result is always exact. Float coordinates, which describe
+    measured foliations, are kept in float64 since the rules are positively homogeneous.
+
+    Args:
+        words(np.ndarray): padded words of shape (B, L), zeros being ignored
+        n_punctures(StrictlyPositiveInt): number of punctures, at least 2 and larger than the highest generator
+        coordinates(Optional(np.ndarray)): initial coordinates of shape (2(n_punctures - 2),) shared by all braids,
+            or (B, 2(n_punctures - 2)). Default to initial_coordinates(n_punctures)
+
+    Returns:
+        np.ndarray: coordinates of shape (B, 2(n_punctures - 2)), float64 for float coordinates,
+        otherwise int64 or object if int64 was not enough
+    """
+    words = np.atleast_2d(np.asarray(words))
+    n_words = words.shape[0]
+    m = n_punctures - 2
+    if coordinates is None:
+        coordinates = initial_coordinates(n_punctures)
+    coordinates = np.broadcast_to(coordinates, (n_words, 2 * m))
+    if words.size and np.abs(words).max() >= n_punctures:
+        raise ValueError(f"Generator index out of bounds for {n_punctures} punctures")
+
+    # Rows 0 and n_punctures - 1 are padding, so that σᵢ always reads rows i - 1 and i
+    if coordinates.dtype == object:
+        dtype = object
+    elif np.issubdtype(coordinates.dtype, np.floating):
+        dtype = np.float64
+    else:
+        dtype = np.int64
+    a = np.zeros((n_punctures, n_words), dtype=dtype)
+    b = np.zeros((n_punctures, n_words), dtype=dtype)
+    a[1:-1] = coordinates[:, :m].T
+    b[1:-1] = coordinates[:, m:].T
+    if dtype == np.int64 and np.abs(coordinates).max(initial=0) >= DYNNIKOV_INT64_BOUND:
+        a, b = a.astype(object), b.astype(object)
+
+    cols = np.arange(n_words)
+    for step in range(words.shape[1]):
+        g = words[:, step].astype(np.int64)
+        active = g != 0
+        if not active.any():
+            continue
+        i = np.where(active, np.abs(g), 1)
+        pos = g > 0
+        first = i == 1
+        last = i == n_punctures - 1
+        x0, x1 = a[i - 1, cols], a[i, cols]
+        y0, y1 = b[i - 1, cols], b[i, cols]
+
+        # Interior rule
+        c = x0 - x1 - _pos(y1) + _neg(y0)
+        d = x0 - x1 + _pos(y1) - _neg(y0)
+        new_x0 = np.where(
+            pos, x0 - _pos(y0) - _pos(_pos(y1) + c), x0 + _pos(y0) + _pos(_pos(y1) - d)
+        )
+        new_y0 = np.where(pos, y1 + _neg(c), y1 - _pos(d))
+        new_x1 = np.where(
+            pos, x1 - _neg(y1) - _neg(_neg(y0) - c), x1 + _neg(y1) + _neg(_neg(y0) + d)
+        )
+        new_y1 = np.where(pos, y0 - _neg(c), y0 + _pos(d))
+
+        # σ₁ only changes (a₁, b₁), read in row i
+        first_x1 = np.where(pos, -y1 + _pos(x1 + _pos(y1)), y1 - _pos(_pos(y1) - x1))
+        first_y1 = np.where(pos, x1 + _pos(y1), -x1 + _pos(y1))
+        # σₙ₋₁ only changes (aₙ₋₂, bₙ₋₂), read in row i - 1
+        last_x0 = np.where(pos, -y0 + _neg(x0 + _neg(y0)), y0 + _pos(x0 - _neg(y0)))
+        last_y0 = np.where(pos, x0 + _neg(y0), -x0 + _neg(y0))
+
+        new_x0 = np.where(first, x0, np.where(last, last_x0, new_x0))
+        new_y0 = np.where(first, y0, np.where(last, last_y0, new_y0))
+        new_x1 = np.where(last, x1, np.where(first, first_x1, new_x1))
+        new_y1 = np.where(last, y1, np.where(first, first_y1, new_y1))
+
+        new_x0 = np.where(active, new_x0, x0)
+        new_y0 = np.where(active, new_y0, y0)
+        new_x1 = np.where(active, new_x1, x1)
+        new_y1 = np.where(active, new_y1, y1)
+        a[i - 1, cols], b[i - 1, cols] = new_x0, new_y0
+        a[i, cols], b[i, cols] = new_x1, new_y1
+
+        if a.dtype == np.int64:
+            largest = max(
+                np.abs(new_x0).max(),
+                np.abs(new_y0).max(),
+                np.abs(new_x1).max(),
+                np.abs(new_y1).max(),
+            )
+            if largest >= DYNNIKOV_INT64_BOUND:
+                a, b = a.astype(object), b.astype(object)
+
+    return np.concatenate([a[1:-1].T, b[1:-1].T], axis=1)
+
+
+def dynnikov_action(
+    generators: Sequence[int],
+    n_punctures: StrictlyPositiveInt,
+    coordinates: Optional[Sequence[int]] = None,
+) -> np.ndarray:
+    """
+    Apply a single braid to a lamination, with the same rules as batch_dynnikov_action
+
+    Per generator NumPy calls would dominate for a single word, so coordinates are updated as Python integers,
+    which are also exact whatever their size.
+
+    Args:
+        generators(Sequence[int]): signed Artin generators, zeros being ignored
+        n_punctures(StrictlyPositiveInt): number of punctures, at least 2 and larger than the highest generator
+        coordinates(Optional(Sequence[int])): initial coordinates of size 2(n_punctures - 2).
+            Default to initial_coordinates(n_punctures)
+
+    Returns:
+        np.ndarray: coordinates of size 2(n_punctures - 2), int64 or object if int64 is not enough
+    """
+    m = n_punctures - 2
+    if coordinates is None:
+        coordinates = initial_coordinates(n_punctures)
+    coordinates = [int(x) for x in coordinates]
+    a = [0] + coordinates[:m] + [0]
+    b = [0] + coordinates[m:] + [0]
+    last_index = n_punctures - 1
+    for g in generators:
+        if g == 0:
+            continue
+        i = abs(g)
+        if i > last_index:
+            raise ValueError(
+                f"Generator index out of bounds for {n_punctures} punctures"
+            )
+        if i == 1:
+            x, y = a[1], b[1]
+            yp = y if y > 0 else 0
+            if g > 0:
+                t = x + yp
+                a[1], b[1] = -y + (t if t > 0 else 0), t
+            else:
+                t = yp - x
+                a[1], b[1] = y - (t if t > 0 else 0), -x + yp
+        elif i == last_index:
+            x, y = a[i - 1], b[i - 1]
+            yn = y if y < 0 else 0
+            if g > 0:
+                t = x + yn
+                a[i - 1], b[i - 1] = -y + (t if t < 0 else 0), t
+            else:
+                t = x - yn
+                a[i - 1], b[i - 1] = y + (t if t > 0 else 0), -x + yn
+        else:
+            x0, x1, y0, y1 = a[i - 1], a[i], b[i - 1], b[i]
+            y0p, y0n = (y0, 0) if y0 > 0 else (0, y0)
+            y1p, y1n = (y1, 0) if y1 > 0 else (0, y1)
+            if g > 0:
+                c = x0 - x1 - y1p + y0n
+                cn = c if c < 0 else 0
+                t0, t1 = y1p + c, y0n - c
+                a[i - 1] = x0 - y0p - (t0 if t0 > 0 else 0)
+                b[i - 1] = y1 + cn
+                a[i] = x1 - y1n - (t1 if t1 < 0 else 0)
+                b[i] = y0 - cn
+            else:
+                d = x0 - x1 + y1p - y0n
+                dp = d if d > 0 else 0
+                t0, t1 = y1p - d, y0n + d
+                a[i - 1] = x0 + y0p + (t0 if t0 > 0 else 0)
+                b[i - 1] = y1 - dp
+                a[i] = x1 + y1n + (t1 if t1 < 0 else 0)
+                b[i] = y0 + dp
+    result = a[1:-1] + b[1:-1]
+    if max((abs(x) for x in result), default=0) < DYNNIKOV_INT64_BOUND:
+        return np.array(result, dtype=np.int64)
+    return np.array(result, dtype=object)
+
+
+def batch_lamination_action(
+    generators: Sequence[int],
+    n_punctures: StrictlyPositiveInt,
+    coordinates: np.ndarray,
+) -> np.ndarray:
+    """
+    Apply a single braid to several integral laminations, with the same rules as dynnikov_action
+
+    The generator being shared, each step updates two rows of coordinates for all the laminations at once, without
+    the masks of batch_dynnikov_action. Coordinates are only checked for int64 overflow when a running bound,
+    multiplied by 7 at each generator, reaches DYNNIKOV_INT64_BOUND.
+
+    Args:
+        generators(Sequence[int]): signed Artin generators, zeros being ignored
+        n_punctures(StrictlyPositiveInt): number of punctures, at least 2 and larger than the highest generator
+        coordinates(np.ndarray): integer coordinates of shape (B, 2(n_punctures - 2))
+
+    Returns:
+        np.ndarray: coordinates of shape (B, 2(n_punctures - 2)), int64 or object if int64 is not enough
+    """
+    m = n_punctures - 2
+    coordinates = np.asarray(coordinates).reshape(-1, 2 * m)
+    bound = int(np.abs(coordinates).max(initial=0))
+    dtype = (
+        object
+        if coordinates.dtype == object or bound >= DYNNIKOV_INT64_BOUND
+        else np.int64
+    )
+    # Rows 0 and n_punctures - 1 are padding, as in batch_dynnikov_action
+    a = np.zeros((n_punctures, len(coordinates)), dtype=dtype)
+    b = np.zeros((n_punctures, len(coordinates)), dtype=dtype)
+    a[1:-1] = coordinates[:, :m].T
+    b[1:-1] = coordinates[:, m:].T
+    last_index = n_punctures - 1
+    for g in generators:
+        if g == 0:
+            continue
+        i = abs(g)
+        if i > last_index:
+            raise ValueError(
+                f"Generator index out of bounds for {n_punctures} punctures"
+            )
+        if a.dtype == np.int64:
+            bound = 7 * max(bound, 1)
+            if bound >= DYNNIKOV_INT64_BOUND:
+                bound = int(max(np.abs(a).max(initial=0), np.abs(b).max(initial=0)))
+                if bound >= DYNNIKOV_INT64_BOUND:
+                    a, b = a.astype(object), b.astype(object)
+        if i == 1:
+            x, y = a[1], b[1]
+            yp = _pos(y)
+            if g > 0:
+                t = x + yp
+                a[1], b[1] = -y + _pos(t), t
+            else:
+                t = yp - x
+                a[1], b[1] = y - _pos(t), -x + yp
+        elif i == last_index:
+            x, y = a[i - 1], b[i - 1]
+            yn = _neg(y)
+            if g > 0:
+                t = x + yn
+                a[i - 1], b[i - 1] = -y + _neg(t), t
+            else:
+                t = x - yn
+                a[i - 1], b[i - 1] = y + _pos(t), -x + yn
+        else:
+            x0, x1, y0, y1 = a[i - 1], a[i], b[i - 1], b[i]
+            y0p, y0n, y1p, y1n = _pos(y0), _neg(y0), _pos(y1), _neg(y1)
+            if g > 0:
+                c = x0 - x1 - y1p + y0n
+                cn = _neg(c)
+                a[i - 1], b[i - 1], a[i], b[i] = (
+                    x0 - y0p - _pos(y1p + c),
+                    y1 + cn,
+                    x1 - y1n - _neg(y0n - c),
+                    y0 - cn,
+                )
+            else:
+                d = x0 - x1 + y1p - y0n
+                dp = _pos(d)
+                a[i - 1], b[i - 1], a[i], b[i] = (
+                    x0 + y0p + _pos(y1p - d),
+                    y1 - dp,
+                    x1 + y1n + _neg(y0n + d),
+                    y0 + dp,
+                )
+    return np.concatenate([a[1:-1].T, b[1:-1].T], axis=1)
+
+
+def batch_dynnikov_coordinates(
+    words: np.ndarray, n_strands: StrictlyPositiveInt
+) -> np.ndarray:
+    """
+    Dynnikov coordinates of braids, obtained by acting on the initial lamination of a disk with one more puncture
+    than strands
+
+    The extra puncture is never moved, which makes the action faithful: two braids are equivalent if and only if
+    they have the same coordinates. Cost is linear in the word length for a fixed number of strands, as long as
+    coordinates fit in int64.
+
+    Args:
+        words(np.ndarray): padded words of shape (B, L), zeros being ignored
+        n_strands(StrictlyPositiveInt): number of strands
+
+    Returns:
+        np.ndarray: coordinates of shape (B, 2(n_strands - 1)), int64 or object for huge coordinates
+    """
+    return batch_dynnikov_action(words, n_strands + 1)
+
+
+def dynnikov_coordinates(
+    generators: Sequence[int], n_strands: StrictlyPositiveInt
+) -> np.ndarray:
+    """
+    Dynnikov coordinates of a braid, see batch_dynnikov_coordinates
+
+    Args:
+        generators(Sequence[int]): signed Artin generators
+        n_strands(StrictlyPositiveInt): number of strands
+
+    Returns:
+        np.ndarray: coordinates of size 2(n_strands - 1)
+    """
+    return dynnikov_action(generators, n_strands + 1)
+
+
+def dynnikov_equal(
+    generators_a: Sequence[int],
+    generators_b: Sequence[int],
+    n_strands: StrictlyPositiveInt,
+) -> bool:
+    """
+    Decide if two braids are equivalent by comparing their Dynnikov coordinates
+
+    Args:
+        generators_a(Sequence[int]): signed Artin generators of the first braid
+        generators_b(Sequence[int]): signed Artin generators of the second braid
+        n_strands(StrictlyPositiveInt): number of strands
+
+    Returns:
+        bool: True if the braids are equivalent
+    """
+    return bool(
+        np.all(
+            dynnikov_coordinates(generators_a, n_strands)
+            == dynnikov_coordinates(generators_b, n_strands)
+        )
+    )
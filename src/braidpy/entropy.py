@@ -0,0 +1,307 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at https://mozilla.org/MPL/2.0/.
+
+"""
+Filename: entropy.py
+Description: Topological entropy of braids from the growth of loops under the Dynnikov action
+Authors: Baptiste Labat
+Created: 2026-10-19
+Repository: https://github.com/baptistelabat/braidpy
+License: Mozilla Public License 2.0
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from enum import Enum
+from typing import List, Optional, Sequence
+
+import numpy as np
+
+from braidpy.braid import Braid
+from braidpy.braid_collection import BraidCollection
+from braidpy.dynnikov import batch_dynnikov_action, dynnikov_coordinates
+from braidpy.utils import PositiveFloat, PositiveInt, StrictlyPositiveInt
+
+
+class ThurstonType(str, Enum):
+    """
+    Nielsen-Thurston type of a braid, as a mapping class of the punctured disk
+
+    -finite_order: some power is a power of the full twist, entropy is zero
+    -reducible: not finite order and zero entropy, the braid preserves a family of curves
+    -pseudo_anosov: positive entropy
+    """
+
+    FINITE_ORDER = "finite_order"
+    REDUCIBLE = "reducible"
+    PSEUDO_ANOSOV = "pseudo_anosov"
+
+
+@dataclass
+class EntropyEstimate:
+    """
+    -entropy: estimated topological entropy, logarithm of the growth rate of loops per application of the braid
+    -converged: True if the estimate changed by less than the tolerance between the last two iterations
+    -n_iterations: number of applications of the braid
+    """
+
+    entropy: PositiveFloat
+    converged: bool
+    n_iterations: PositiveInt
+
+
+def initial_loops(
+    n_punctures: StrictlyPositiveInt, n_loops: StrictlyPositiveInt, seed: int = 0
+) -> np.ndarray:
+    """
+    Dynnikov coordinates of the loops iterated to estimate entropy
+
+    The first one is the lamination of initial_coordinates, the others are random measured foliations,
+    so that the growth of a braid reducing the first one is still seen.
+
+    Args:
+        n_punctures(StrictlyPositiveInt): number of punctures, at least 3
+        n_loops(StrictlyPositiveInt): number of loops
+        seed(Optional(int)): seed of the random loops. Default to 0
+
+    Returns:
+        np.ndarray: float64 array of shape (n_loops, 2(n_punctures - 2))
+    """
+    m = n_punctures - 2
+    rng = np.random.default_rng(seed)
+    loops = rng.uniform(-1.0, 1.0, size=(n_loops, 2 * m))
+    loops[0, :m] = 0.0
+    loops[0, m:] = -1.0
+    return loops
+
+
+def batch_topological_entropy(
+    words: np.ndarray,
+    n_strands: StrictlyPositiveInt,
+    tolerance: PositiveFloat = 1e-6,
+    max_iterations: StrictlyPositiveInt = 100,
+    n_loops: StrictlyPositiveInt = 4,
+) -> List[EntropyEstimate]:
+    """
+    Estimate the topological entropy of braids from the growth rate of loops under their repeated action
+
+    All loops of all braids are iterated together, one NumPy update per generator position.
+    Coordinates are renormalized after each application of the braids. After k applications, the estimate is the
+    mean logarithmic growth of the L1 norm over the last k/2 ones, whose maximum over the loops is kept. Braids whose estimate is stable within the tolerance leave
+    the batch, so that the remaining iterations only cost for the slowly converging ones.
+
+    Pseudo-Anosov braids converge geometrically. Loops grow at most polynomially for the other braids,
+    so that their estimate decreases to zero like 1/k.
+
+    Args:
+        words(np.ndarray): padded words of shape (B, L), zeros being ignored
+        n_strands(StrictlyPositiveInt): number of strands
+        tolerance(Optional(PositiveFloat)): convergence threshold on the change of the estimate. Default to 1e-6
+        max_iterations(Optional(StrictlyPositiveInt)): highest number of applications of each braid. Default to 100
+        n_loops(Optional(StrictlyPositiveInt)): number of initial loops per braid. Default to 4
+
+    Returns:
+        List[EntropyEstimate]: estimate of each braid
+    """
+    words = np.atleast_2d(np.asarray(words))
+    n_words = words.shape[0]
+    if n_strands <= 2:
+        # Braids on 2 strands are all finite order
+        return [EntropyEstimate(0.0, True, 0) for _ in range(n_words)]
+
+    loops = initial_loops(n_strands, n_loops)
+    coordinates = np.tile(loops, (n_words, 1))
+    # log_norms[k]: logarithm of the L1 norm of each loop after k applications, the initial norm being 1
+    log_norms = np.zeros((max_iterations + 1, n_words * n_loops))
+    coordinates /= np.abs(coordinates).sum(axis=1)[:, None]
+    estimates = np.zeros(n_words)
+    # Trivial braids have no iteration to do
+    converged = ~words.any(axis=1)
+    iterations = np.zeros(n_words, dtype=np.int64)
+    active = np.flatnonzero(~converged)
+    for k in range(1, max_iterations + 1):
+        if not active.size:
+            break
+        rows = (active[:, None] * n_loops + np.arange(n_loops)).ravel()
+        coordinates[rows] = batch_dynnikov_action(
+            np.repeat(words[active], n_loops, axis=0), n_strands, coordinates[rows]
+        )
+        norms = np.abs(coordinates[rows]).sum(axis=1)
+        coordinates[rows] /= norms[:, None]
+        log_norms[k, rows] = log_norms[k - 1, rows] + np.log(norms)
+
+        # Growth over the second half of the run, which cancels the constant offset of the first iterations
+        j = k // 2
+        growth = (log_norms[k, rows] - log_norms[j, rows]) / (k - j)
+        growth = growth.reshape(-1, n_loops).max(axis=1)
+        iterations[active] = k
+        done = np.abs(growth - estimates[active]) < tolerance
+        if k > 1:
+            converged[active[done]] = True
+        estimates[active] = growth
+        if k > 1:
+            active = active[~done]
+
+    return [
+        EntropyEstimate(max(float(e), 0.0), bool(c), int(k))
+        for e, c, k in zip(estimates, converged, iterations)
+    ]
+
+
+def topological_entropy(
+    braid: Braid,
+    tolerance: PositiveFloat = 1e-6,
+    max_iterations: StrictlyPositiveInt = 100,
+    n_loops: StrictlyPositiveInt = 4,
+) -> EntropyEstimate:
+    """
+    Estimate the topological entropy of a braid, see batch_topological_entropy
+
+    Args:
+        braid(Braid): the braid
+        tolerance(Optional(PositiveFloat)): convergence threshold on the change of the estimate. Default to 1e-6
+        max_iterations(Optional(StrictlyPositiveInt)): highest number of applications of the braid. Default to 100
+        n_loops(Optional(StrictlyPositiveInt)): number of initial loops. Default to 4
+
+    Returns:
+        EntropyEstimate: the estimate
+    """
+    words = np.array([braid.no_zero().generators], dtype=np.int64)
+    return batch_topological_entropy(
+        words, braid.n_strands, tolerance, max_iterations, n_loops
+    )[0]
+
+
+def _collection_entropy(task) -> List[EntropyEstimate]:
+    words, n_strands, tolerance, max_iterations, n_loops = task
+    return batch_topological_entropy(
+        words, n_strands, tolerance, max_iterations, n_loops
+    )
+
+
+def collection_topological_entropy(
+    collection: BraidCollection,
+    tolerance: PositiveFloat = 1e-6,
+    max_iterations: StrictlyPositiveInt = 100,
+    n_loops: StrictlyPositiveInt = 4,
+    chunk_size: StrictlyPositiveInt = 4096,
+    n_processes: Optional[StrictlyPositiveInt] = 1,
+) -> List[EntropyEstimate]:
+    """
+    Estimate the topological entropy of every braid of a collection
+
+    Words are sorted by length and processed by chunks, in worker processes if asked.
+
+    Args:
+        collection(BraidCollection): the braids
+        tolerance(Optional(PositiveFloat)): convergence threshold on the change of the estimate. Default to 1e-6
+        max_iterations(Optional(StrictlyPositiveInt)): highest number of applications of each braid. Default to 100
+        n_loops(Optional(StrictlyPositiveInt)): number of initial loops per braid. Default to 4
+        chunk_size(Optional(StrictlyPositiveInt)): number of braids processed together. Default to 4096
+        n_processes(Optional(StrictlyPositiveInt)): number of worker processes, None for the number of CPUs.
+            Default to 1, the current process
+
+    Returns:
+        List[EntropyEstimate]: estimate of each braid, in the order of the collection
+    """
+    chunks = list(collection._sorted_chunks(chunk_size))
+    tasks = [
+        (words, collection.n_strands, tolerance, max_iterations, n_loops)
+        for _, words in chunks
+    ]
+    if n_processes == 1 or len(tasks) <= 1:
+        results = [_collection_entropy(task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=n_processes) as executor:
+            results = list(executor.map(_collection_entropy, tasks))
+
+    estimates: List[Optional[EntropyEstimate]] = [None] * len(collection)
+    for (idx, _), chunk_estimates in zip(chunks, results):
+        for k, estimate in zip(idx, chunk_estimates):
+            estimates[k] = estimate
+    return estimates
+
+
+def _is_central(generators: Sequence[int], n_strands: StrictlyPositiveInt) -> bool:
+    """Check if a braid is a power of the full twist, comparing exact Dynnikov coordinates"""
+    writhe = sum(1 if g > 0 else -1 for g in generators if g != 0)
+    twist_writhe = n_strands * (n_strands - 1)
+    if writhe % twist_writhe:
+        return False
+    twist = Braid([], n_strands).full_twist() ** (writhe // twist_writhe)
+    return bool(
+        np.all(
+            dynnikov_coordinates(generators, n_strands)
+            == dynnikov_coordinates(twist.generators, n_strands)
+        )
+    )
+
+
+def is_finite_order(braid: Braid) -> bool:
+    """
+    Check if a braid is finite order (periodic) as a mapping class, ie its nth or (n-1)th power is a power of
+    the full twist ∆²
+
+    The powers are compared exactly with Dynnikov coordinates, in a time linear in the word length.
+
+    Args:
+        braid(Braid): the braid
+
+    Returns:
+        bool: True if finite order
+    """
+    n = braid.n_strands
+    if n <= 2:
+        return True
+    generators = braid.no_zero().generators
+    return any(_is_central(generators * k, n) for k in (n, n - 1))
+
+
+def pseudo_anosov_entropy_bound(n_strands: StrictlyPositiveInt) -> PositiveFloat:
+    """
+    Lower bound on the entropy of pseudo-Anosov braids, log(2)/(4n - 8) from Penner's bound for the sphere with
+    n + 1 punctures
+
+    R. C. Penner, "Bounds on least dilatations", Proceedings of the AMS 113 (1991), 443-450.
+
+    Args:
+        n_strands(StrictlyPositiveInt): number of strands, at least 3
+
+    Returns:
+        PositiveFloat: the bound
+    """
+    return float(np.log(2) / (4 * n_strands - 8))
+
+
+def thurston_type(
+    braid: Braid,
+    max_iterations: Optional[StrictlyPositiveInt] = None,
+) -> ThurstonType:
+    """
+    Cheap Nielsen-Thurston classification of a braid
+
+    Finite order is decided exactly. Otherwise the braid is pseudo-Anosov if its entropy estimate is above
+    half of pseudo_anosov_entropy_bound, reducible if not. Reducible braids with a pseudo-Anosov component have
+    positive entropy, so they are reported as pseudo-Anosov.
+
+    Polynomial growth of degree d gives an estimate about 2d.log(2)/k after k iterations, so the default number
+    of iterations keeps the estimate of reducible braids below the threshold for d up to n.
+
+    Args:
+        braid(Braid): the braid
+        max_iterations(Optional(StrictlyPositiveInt)): highest number of applications of the braid.
+            Default to None, 32n(n - 2)
+
+    Returns:
+        ThurstonType: the type
+    """
+    if is_finite_order(braid):
+        return ThurstonType.FINITE_ORDER
+    n = braid.n_strands
+    if max_iterations is None:
+        max_iterations = 32 * n * (n - 2)
+    estimate = topological_entropy(braid, max_iterations=max_iterations)
+    if estimate.entropy > pseudo_anosov_entropy_bound(n) / 2:
+        return ThurstonType.PSEUDO_ANOSOV
+    return ThurstonType.REDUCIBLE
@@ -0,0 +1,520 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at https://mozilla.org/MPL/2.0/.
+
+"""
+Filename: equality.py
+Description: Pluggable algorithms deciding if braids are equivalent, with automatic choice and timings
+Authors: Baptiste Labat
+Created: 2026-10-19
+Repository: https://github.com/baptistelabat/braidpy
+License: Mozilla Public License 2.0
+"""
+
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, replace
+from enum import Enum
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+import math_braid
+import numpy as np
+
+from braidpy.dynnikov import dynnikov_equal
+from braidpy.fingerprint import burau_fingerprint
+from braidpy.utils import (
+    FunctionalException,
+    PositiveFloat,
+    PositiveInt,
+    StrictlyPositiveInt,
+)
+
+# Handle reduction has no proven bound, words not reduced in this time are decided with Dynnikov coordinates
+HANDLE_REDUCTION_TIMEOUT_S = 1.0
+
+
+class UnknownEqualityBackend(FunctionalException):
+    """
+    Exception raised when an equality backend is not registered
+    """
+
+    pass
+
+
+class EqualityBackend(str, Enum):
+    """
+    Algorithm used to decide if two braids are equivalent
+
+    -AUTO: cheap prefilters, then the fastest exact backend for the word length and number of strands
+    -GARSIDE: compare normal forms computed by math_braid, in O(l²n.log n)
+    -HANDLE_REDUCTION: Dehornoy handle reduction of a⁻¹b, fast in practice on short words but without proven bound
+    -DYNNIKOV: compare Dynnikov coordinates, linear in word length for a fixed number of strands
+    -INVARIANTS: prefilter comparing exponent sums and permutations, only able to tell braids differ
+    -FINGERPRINT: prefilter comparing Burau fingerprints, only able to tell braids differ
+    """
+
+    AUTO = "AUTO"
+    GARSIDE = "GARSIDE"
+    HANDLE_REDUCTION = "HANDLE_REDUCTION"
+    DYNNIKOV = "DYNNIKOV"
+    INVARIANTS = "INVARIANTS"
+    FINGERPRINT = "FINGERPRINT"
+
+
+@dataclass(frozen=True)
+class EqualityBackendEntry:
+    """
+    -name: key of the backend
+    -decide: function of (generators_a, generators_b, n_strands), returning True or False if equivalence is decided,
+        None if not (prefilters only)
+    -exact: True if the backend always decides, False for prefilters which can only tell that braids differ
+    -description: short description
+    """
+
+    name: str
+    decide: Callable[[Sequence[int], Sequence[int], int], Optional[bool]]
+    exact: bool = True
+    description: str = ""
+
+
+@dataclass
+class EqualityTimings:
+    """
+    -n_calls: number of calls to the backend
+    -elapsed: total time spent in the backend, in seconds
+    -max_elapsed: longest call, in seconds
+    """
+
+    n_calls: PositiveInt = 0
+    elapsed: PositiveFloat = 0.0
+    max_elapsed: PositiveFloat = 0.0
+
+    @property
+    def mean_elapsed(self) -> PositiveFloat:
+        return self.elapsed / self.n_calls if self.n_calls else 0.0
+
+
+@dataclass(frozen=True)
+class EqualityThresholds:
+    """
+    Rule of the automatic choice of backend, obtained from a benchmark on a grid
+
+    -n_strands: increasing numbers of strands of the grid
+    -lengths: increasing total word lengths of the grid
+    -backends: backends[i][j] is used up to n_strands[i] strands and lengths[j] generators
+        (the last row and column are used beyond the grid)
+    -prefilters: prefilters tried in order before the exact backend
+    """
+
+    n_strands: Tuple[StrictlyPositiveInt, ...]
+    lengths: Tuple[PositiveInt, ...]
+    backends: Tuple[Tuple[str, ...], ...]
+    prefilters: Tuple[str, ...] = (EqualityBackend.INVARIANTS.value,)
+
+
+# Measured with calibrate_equality_thresholds on equivalent pairs: handle reduction is only competitive on the
+# shortest words with many strands, Dynnikov coordinates are the fastest elsewhere, Garside normal forms never are.
+# Burau fingerprints cost more than deciding with Dynnikov coordinates, so they are not used as prefilter.
+DEFAULT_EQUALITY_THRESHOLDS = EqualityThresholds(
+    n_strands=(3, 5, 8, 12),
+    lengths=(4, 16, 64, 256),
+    backends=(
+        ("DYNNIKOV", "DYNNIKOV", "DYNNIKOV", "DYNNIKOV"),
+        ("DYNNIKOV", "DYNNIKOV", "DYNNIKOV", "DYNNIKOV"),
+        ("DYNNIKOV", "DYNNIKOV", "DYNNIKOV", "DYNNIKOV"),
+        ("HANDLE_REDUCTION", "DYNNIKOV", "DYNNIKOV", "DYNNIKOV"),
+    ),
+)
+
+_BACKENDS: Dict[str, EqualityBackendEntry] = {}
+_TIMINGS: Dict[str, EqualityTimings] = {}
+_STATE = {"thresholds": DEFAULT_EQUALITY_THRESHOLDS, "pinned": None}
+
+
+def _backend_name(backend: EqualityBackend | str) -> str:
+    return backend.value if isinstance(backend, EqualityBackend) else str(backend)
+
+
+def register_equality_backend(
+    name: EqualityBackend | str, exact: bool = True, description: str = ""
+) -> Callable:
+    """
+    Decorator registering an equality backend
+
+    Args:
+        name(EqualityBackend | str): key of the backend, must be unique
+        exact(Optional(bool)): False for prefilters, which return None when they cannot decide. Default to True
+        description(Optional(str)): short description. Default to ""
+
+    Returns:
+        Callable: the decorator, returning the function unchanged
+    """
+    name = _backend_name(name)
+
+    def decorator(decide: Callable) -> Callable:
+        if name in _BACKENDS or name == EqualityBackend.AUTO.value:
+            raise ValueError(f"Equality backend {name} is already registered")
+        _BACKENDS[name] = EqualityBackendEntry(name, decide, exact, description)
+        return decide
+
+    return decorator
+
+
+def unregister_equality_backend(name: EqualityBackend | str) -> None:
+    """
+    Remove a registered equality backend, and its timings
+
+    Args:
+        name(EqualityBackend | str): key of the backend, which should not be pinned nor used by the thresholds
+    """
+    name = _backend_name(name)
+    equality_backend(name)
+    thresholds = get_equality_thresholds()
+    used = set(thresholds.prefilters) | {b for row in thresholds.backends for b in row}
+    if name == _STATE["pinned"] or name in used:
+        raise ValueError(f"Equality backend {name} is in use")
+    del _BACKENDS[name]
+    _TIMINGS.pop(name, None)
+
+
+def equality_backend(name: EqualityBackend | str) -> EqualityBackendEntry:
+    """
+    Get a registered equality backend
+
+    Args:
+        name(EqualityBackend | str): key of the backend
+
+    Returns:
+        EqualityBackendEntry: the backend
+    """
+    try:
+        return _BACKENDS[_backend_name(name)]
+    except KeyError:
+        raise UnknownEqualityBackend(
+            f"No equality backend named {_backend_name(name)}"
+        ) from None
+
+
+def equality_backends(exact: Optional[bool] = None) -> List[EqualityBackendEntry]:
+    """
+    List the registered equality backends
+
+    Args:
+        exact(Optional(bool)): keep only exact backends (True) or prefilters (False). Default to None (all)
+
+    Returns:
+        List[EqualityBackendEntry]: the backends, in registration order
+    """
+    return [b for b in _BACKENDS.values() if exact is None or b.exact == exact]
+
+
+@register_equality_backend(
+    EqualityBackend.GARSIDE, description="Garside normal forms from math_braid"
+)
+def _garside_equal(
+    generators_a: Sequence[int], generators_b: Sequence[int], n_strands: int
+) -> bool:
+    # math_braid fails on empty words, which are replaced by an equivalent one
+    a = list(generators_a) or [1, -1]
+    b = list(generators_b) or [1, -1]
+    return math_braid.Braid(a, n_strands) == math_braid.Braid(b, n_strands)
+
+
+@register_equality_backend(
+    EqualityBackend.HANDLE_REDUCTION, description="Dehornoy handle reduction of a⁻¹b"
+)
+def _handle_reduction_equal(
+    generators_a: Sequence[int], generators_b: Sequence[int], n_strands: int
+) -> bool:
+    from braidpy.handles_reduction import (
+        HandleReducedButUnexpectedResult,
+        HandleReductionMode,
+        dehornoy_reduce_core,
+    )
+
+    word = [-g for g in reversed(generators_a)] + list(generators_b)
+    try:
+        results = dehornoy_reduce_core(
+            word, HandleReductionMode.COMPARE, HANDLE_REDUCTION_TIMEOUT_S
+        )
+    except HandleReducedButUnexpectedResult:
+        return dynnikov_equal(generators_a, generators_b, n_strands)
+    # Words with handles left but a sign are σ-positive or σ-negative, so not trivial
+    return results.sign == 0
+
+
+@register_equality_backend(
+    EqualityBackend.DYNNIKOV, description="Dynnikov coordinates of a lamination"
+)
+def _dynnikov_equal(
+    generators_a: Sequence[int], generators_b: Sequence[int], n_strands: int
+) -> bool:
+    return dynnikov_equal(generators_a, generators_b, n_strands)
+
+
+def _exponent_sum(generators: Sequence[int]) -> int:
+    return sum(1 if g > 0 else -1 for g in generators)
+
+
+def _permutation(generators: Sequence[int], n_strands: int) -> List[int]:
+    strands = list(range(n_strands))
+    for g in generators:
+        i = abs(g) - 1
+        strands[i], strands[i + 1] = strands[i + 1], strands[i]
+    return strands
+
+
+@register_equality_backend(
+    EqualityBackend.INVARIANTS,
+    exact=False,
+    description="exponent sums and permutations",
+)
+def _invariants_differ(
+    generators_a: Sequence[int], generators_b: Sequence[int], n_strands: int
+) -> Optional[bool]:
+    if _exponent_sum(generators_a) != _exponent_sum(generators_b):
+        return False
+    if _permutation(generators_a, n_strands) != _permutation(generators_b, n_strands):
+        return False
+    return None
+
+
+@register_equality_backend(
+    EqualityBackend.FINGERPRINT, exact=False, description="Burau fingerprints"
+)
+def _fingerprints_differ(
+    generators_a: Sequence[int], generators_b: Sequence[int], n_strands: int
+) -> Optional[bool]:
+    if burau_fingerprint(generators_a, n_strands) != burau_fingerprint(
+        generators_b, n_strands
+    ):
+        return False
+    return None
+
+
+def _timed(
+    entry: EqualityBackendEntry,
+    generators_a: Sequence[int],
+    generators_b: Sequence[int],
+    n_strands: int,
+) -> Optional[bool]:
+    start = time.perf_counter()
+    result = entry.decide(generators_a, generators_b, n_strands)
+    elapsed = time.perf_counter() - start
+    timings = _TIMINGS.setdefault(entry.name, EqualityTimings())
+    timings.n_calls += 1
+    timings.elapsed += elapsed
+    timings.max_elapsed = max(timings.max_elapsed, elapsed)
+    return result
+
+
+def equality_timings() -> Dict[str, EqualityTimings]:
+    """
+    Time spent in each backend since the last reset, in this process
+
+    Returns:
+        Dict[str, EqualityTimings]: copy of the timings of each backend called at least once
+    """
+    return {name: replace(timings) for name, timings in _TIMINGS.items()}
+
+
+def reset_equality_timings() -> None:
+    """Forget the timings of all backends"""
+    _TIMINGS.clear()
+
+
+def get_equality_thresholds() -> EqualityThresholds:
+    """
+    Returns:
+        EqualityThresholds: rule currently used by the automatic choice of backend
+    """
+    return _STATE["thresholds"]
+
+
+def set_equality_thresholds(thresholds: EqualityThresholds) -> None:
+    """
+    Change the rule of the automatic choice of backend
+
+    Args:
+        thresholds(EqualityThresholds): the rule, see calibrate_equality_thresholds
+    """
+    if len(thresholds.backends) != len(thresholds.n_strands) or any(
+        len(row) != len(thresholds.lengths) for row in thresholds.backends
+    ):
+        raise ValueError("There should be one backend per point of the grid")
+    for name in thresholds.prefilters:
+        if equality_backend(name).exact:
+            raise ValueError(f"{name} is not a prefilter")
+    for row in thresholds.backends:
+        for name in row:
+            if not equality_backend(name).exact:
+                raise ValueError(f"{name} is a prefilter and cannot decide equality")
+    _STATE["thresholds"] = thresholds
+
+
+def choose_equality_backend(length: PositiveInt, n_strands: StrictlyPositiveInt) -> str:
+    """
+    Exact backend used by the automatic choice
+
+    Args:
+        length(PositiveInt): total length of the two words
+        n_strands(StrictlyPositiveInt): number of strands
+
+    Returns:
+        str: name of the backend
+    """
+    thresholds = get_equality_thresholds()
+    i = int(np.searchsorted(thresholds.n_strands, n_strands))
+    j = int(np.searchsorted(thresholds.lengths, length))
+    i = min(i, len(thresholds.n_strands) - 1)
+    j = min(j, len(thresholds.lengths) - 1)
+    return thresholds.backends[i][j]
+
+
+def pin_equality_backend(backend: Optional[EqualityBackend | str]) -> None:
+    """
+    Use a single exact backend instead of the automatic choice, for a predictable latency
+
+    Args:
+        backend(Optional(EqualityBackend | str)): the backend, None to restore the automatic choice
+    """
+    if backend is not None:
+        backend = _backend_name(backend)
+        if not equality_backend(backend).exact:
+            raise ValueError(f"{backend} is a prefilter and cannot decide equality")
+    _STATE["pinned"] = backend
+
+
+@contextmanager
+def pinned_equality_backend(backend: EqualityBackend | str) -> Iterator[None]:
+    """
+    Context manager pinning a backend, the previous one being restored at exit
+
+    Args:
+        backend(EqualityBackend | str): the backend
+    """
+    previous = _STATE["pinned"]
+    pin_equality_backend(backend)
+    try:
+        yield
+    finally:
+        _STATE["pinned"] = previous
+
+
+def braids_equal(
+    generators_a: Sequence[int],
+    generators_b: Sequence[int],
+    n_strands: StrictlyPositiveInt,
+    backend: EqualityBackend | str = EqualityBackend.AUTO,
+) -> bool:
+    """
+    Decide if two braids on the same number of strands are equivalent
+
+    With EqualityBackend.AUTO, the pinned backend is used if any. Otherwise the prefilters of the thresholds
+    are tried, and the exact backend is chosen with choose_equality_backend.
+
+    Args:
+        generators_a(Sequence[int]): signed Artin generators of the first braid
+        generators_b(Sequence[int]): signed Artin generators of the second braid
+        n_strands(StrictlyPositiveInt): number of strands
+        backend(Optional(EqualityBackend | str)): backend to use. Default to EqualityBackend.AUTO
+
+    Returns:
+        bool: True if the braids are equivalent
+    """
+    a = [int(g) for g in generators_a if g != 0]
+    b = [int(g) for g in generators_b if g != 0]
+    if a == b:
+        return True
+    name = _backend_name(backend)
+    if name == EqualityBackend.AUTO.value:
+        name = _STATE["pinned"]
+        if name is None:
+            thresholds = get_equality_thresholds()
+            for prefilter in thresholds.prefilters:
+                if _timed(equality_backend(prefilter), a, b, n_strands) is False:
+                    return False
+            name = choose_equality_backend(len(a) + len(b), n_strands)
+    entry = equality_backend(name)
+    if not entry.exact:
+        raise ValueError(f"{name} is a prefilter and cannot decide equality")
+    return bool(_timed(entry, a, b, n_strands))
+
+
+def is_trivial_braid(
+    generators: Sequence[int],
+    n_strands: StrictlyPositiveInt,
+    backend: EqualityBackend | str = EqualityBackend.AUTO,
+) -> bool:
+    """
+    Decide if a braid is equivalent to the identity, see braids_equal
+
+    Args:
+        generators(Sequence[int]): signed Artin generators
+        n_strands(StrictlyPositiveInt): number of strands
+        backend(Optional(EqualityBackend | str)): backend to use. Default to EqualityBackend.AUTO
+
+    Returns:
+        bool: True if the braid is trivial
+    """
+    return braids_equal(generators, [], n_strands, backend)
+
+
+def calibrate_equality_thresholds(
+    n_strands: Sequence[StrictlyPositiveInt] = (3, 5, 8, 12),
+    lengths: Sequence[PositiveInt] = (4, 16, 64, 256),
+    n_samples: StrictlyPositiveInt = 3,
+    backends: Optional[Sequence[EqualityBackend | str]] = None,
+    seed: Optional[int] = None,
+    apply: bool = False,
+) -> EqualityThresholds:
+    """
+    Benchmark the exact backends on a grid, to learn which one is the fastest for each size
+
+    Pairs of equivalent random words are used, since equivalence is the slowest answer for all backends:
+    the second word is the first one with a random word and its inverse inserted.
+
+    Args:
+        n_strands(Optional(Sequence[StrictlyPositiveInt])): numbers of strands of the grid. Default to (3, 5, 8, 12)
+        lengths(Optional(Sequence[PositiveInt])): total word lengths of the grid. Default to (4, 16, 64, 256)
+        n_samples(Optional(StrictlyPositiveInt)): number of pairs per grid point. Default to 3
+        backends(Optional(Sequence[EqualityBackend | str])): candidates. Default to None (all exact backends)
+        seed(Optional(int)): seed of the random words. Default to None
+        apply(Optional(bool)): use the result for the automatic choice. Default to False
+
+    Returns:
+        EqualityThresholds: fastest backend of each grid point, with the current prefilters
+    """
+    rng = np.random.default_rng(seed)
+    if backends is None:
+        candidates = equality_backends(exact=True)
+    else:
+        candidates = [equality_backend(b) for b in backends]
+    n_strands = tuple(sorted(n_strands))
+    lengths = tuple(sorted(lengths))
+
+    table = []
+    for n in n_strands:
+        row = []
+        for length in lengths:
+            elapsed = dict.fromkeys([c.name for c in candidates], 0.0)
+            for _ in range(n_samples):
+                half = max(length // 2, 1)
+                a = rng.integers(1, n, size=half) * rng.choice([-1, 1], size=half)
+                w = rng.integers(1, n, size=max(half // 2, 1))
+                position = int(rng.integers(0, half + 1))
+                a = a.tolist()
+                b = a[:position] + w.tolist() + [-g for g in w[::-1]] + a[position:]
+                for candidate in candidates:
+                    start = time.perf_counter()
+                    candidate.decide(a, b, n)
+                    elapsed[candidate.name] += time.perf_counter() - start
+            row.append(min(elapsed, key=elapsed.get))
+        table.append(tuple(row))
+
+    thresholds = EqualityThresholds(
+        n_strands, lengths, tuple(table), get_equality_thresholds().prefilters
+    )
+    if apply:
+        set_equality_thresholds(thresholds)
+    return thresholds
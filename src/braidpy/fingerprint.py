@@ -0,0 +1,265 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at https://mozilla.org/MPL/2.0/.
+
+"""
+Filename: fingerprint.py
+Description: Modular Burau fingerprints to bucket equivalent braids
+Authors: Baptiste Labat
+Created: 2026-10-19
+Repository: https://github.com/baptistelabat/braidpy
+License: Mozilla Public License 2.0
+"""
+
+import hashlib
+from typing import Sequence
+
+import numpy as np
+
+from braidpy.utils import StrictlyPositiveInt
+
+# Mersenne prime 2⁶¹-1, allowing cheap modular reduction with shifts and masks
+MERSENNE_PRIME_61 = (1 << 61) - 1
+
+# Fixed values of t at which the Burau matrix is evaluated.
+# They were drawn at random once and must never change, otherwise stored fingerprints become meaningless.
+FINGERPRINT_T_VALUES = (
+    2285868250904003018,
+    1857335252486900430,
+    1735155404871897427,
+)
+
+_P = np.uint64(MERSENNE_PRIME_61)
+_MASK_32 = np.uint64((1 << 32) - 1)
+_MASK_29 = np.uint64((1 << 29) - 1)
+
+
+def _fold(x: np.ndarray) -> np.ndarray:
+    """
+    Reduce values lower than 2⁶³ modulo 2⁶¹-1
+
+    Args:
+        x(np.ndarray): uint64 values
+
+    Returns:
+        np.ndarray: the values reduced in [0, 2⁶¹-1[
+    """
+    x = (x & _P) + (x >> np.uint64(61))
+    return np.where(x >= _P, x - _P, x)
+
+
+def addmod(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """
+    Modular addition for values already reduced modulo 2⁶¹-1
+
+    Args:
+        a(np.ndarray): uint64 values lower than 2⁶¹-1
+        b(np.ndarray): uint64 values lower than 2⁶¹-1
+
+    Returns:
+        np.ndarray: (a + b) mod 2⁶¹-1
+    """
+    s = a + b
+    return np.where(s >= _P, s - _P, s)
+
+
+def mulmod(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """
+    Modular multiplication for values already reduced modulo 2⁶¹-1, without overflow
+
+    The operands are split in 32 bits halves so that each partial product fits in 64 bits,
+    then 2⁶¹ ≡ 1 is used to fold the high bits back.
+
+    Args:
+        a(np.ndarray): uint64 values lower than 2⁶¹-1
+        b(np.ndarray): uint64 values lower than 2⁶¹-1
+
+    Returns:
+        np.ndarray: (a * b) mod 2⁶¹-1
+    """
+    a = np.asarray(a, dtype=np.uint64)
+    b = np.asarray(b, dtype=np.uint64)
+    a_hi, a_lo = a >> np.uint64(32), a & _MASK_32
+    b_hi, b_lo = b >> np.uint64(32), b & _MASK_32
+
+    # 2⁶⁴ ≡ 2³
+    high = (a_hi * b_hi) << np.uint64(3)
+    # mid * 2³² = mid_hi * 2⁶¹ + mid_lo * 2³² ≡ mid_hi + mid_lo * 2³²
+    mid = a_hi * b_lo + a_lo * b_hi
+    mid = (mid >> np.uint64(29)) + ((mid & _MASK_29) << np.uint64(32))
+    low = a_lo * b_lo
+    low = (low & _P) + (low >> np.uint64(61))
+    return _fold(high + mid + low)
+
+
+def _burau_constants(t_values: Sequence[int]) -> tuple[np.ndarray, ...]:
+    """
+    Precompute t, 1-t, t⁻¹ and 1-t⁻¹ modulo 2⁶¹-1
+
+    Args:
+        t_values(Sequence[int]): evaluation points
+
+    Returns:
+        tuple[np.ndarray, ...]: four uint64 arrays of shape (K,)
+    """
+    p = MERSENNE_PRIME_61
+    t = [v % p for v in t_values]
+    if any(v == 0 for v in t):
+        raise ValueError("Evaluation points should not be zero modulo 2⁶¹-1")
+    t_inv = [pow(v, p - 2, p) for v in t]
+    return tuple(
+        np.array(values, dtype=np.uint64)
+        for values in (
+            t,
+            [(1 - v) % p for v in t],
+            t_inv,
+            [(1 - v) % p for v in t_inv],
+        )
+    )
+
+
+def batch_burau_matrices_mod_p(
+    words: np.ndarray,
+    n_strands: StrictlyPositiveInt,
+    t_values: Sequence[int] = FINGERPRINT_T_VALUES,
+) -> np.ndarray:
+    """
+    Evaluate the (unreduced) Burau matrices of several braid words modulo 2⁶¹-1
+
+    All words are processed in lockstep: at step j the j-th generator of every word is applied at once.
+    Shorter words must be padded with 0 (neutral element).
+    The convention is the one of Braid.to_matrix, the matrix of σᵢ acting on columns i and i+1.
+
+    Args:
+        words(np.ndarray): array of shape (B, L) of signed Artin generators
+        n_strands(StrictlyPositiveInt): number of strands shared by all words
+        t_values(Optional(Sequence[int])): evaluation points. Default to FINGERPRINT_T_VALUES
+
+    Returns:
+        np.ndarray: uint64 array of shape (B, K, n_strands, n_strands)
+    """
+    words = np.atleast_2d(np.asarray(words, dtype=np.int64))
+    n_words, length = words.shape
+    t, one_minus_t, t_inv, one_minus_t_inv = _burau_constants(t_values)
+    k = len(t)
+
+    matrices = np.zeros((n_words, k, n_strands, n_strands), dtype=np.uint64)
+    matrices[..., np.arange(n_strands), np.arange(n_strands)] = 1
+
+    # Shape (1, K, 1) to broadcast against gathered columns of shape (B, K, n)
+    t, one_minus_t, t_inv, one_minus_t_inv = (
+        c.reshape(1, k, 1) for c in (t, one_minus_t, t_inv, one_minus_t_inv)
+    )
+    rows = np.arange(n_words)
+    for j in range(length):
+        gens = words[:, j]
+
+        # σᵢ: columns (cᵢ, cᵢ₊₁) become ((1-t)cᵢ + cᵢ₊₁, t.cᵢ)
+        idx = rows[gens > 0]
+        if idx.size:
+            i = gens[idx] - 1
+            col, col_next = matrices[idx, :, :, i], matrices[idx, :, :, i + 1]
+            matrices[idx, :, :, i] = addmod(mulmod(col, one_minus_t), col_next)
+            matrices[idx, :, :, i + 1] = mulmod(col, t)
+
+        # σᵢ⁻¹: columns (cᵢ, cᵢ₊₁) become (t⁻¹cᵢ₊₁, cᵢ + (1-t⁻¹)cᵢ₊₁)
+        idx = rows[gens < 0]
+        if idx.size:
+            i = -gens[idx] - 1
+            col, col_next = matrices[idx, :, :, i], matrices[idx, :, :, i + 1]
+            matrices[idx, :, :, i] = mulmod(col_next, t_inv)
+            matrices[idx, :, :, i + 1] = addmod(col, mulmod(col_next, one_minus_t_inv))
+    return matrices
+
+
+def burau_matrices_mod_p(
+    generators: Sequence[int],
+    n_strands: StrictlyPositiveInt,
+    t_values: Sequence[int] = FINGERPRINT_T_VALUES,
+) -> np.ndarray:
+    """
+    Evaluate the (unreduced) Burau matrix of a braid word modulo 2⁶¹-1 at several values of t
+
+    Args:
+        generators(Sequence[int]): signed Artin generators
+        n_strands(StrictlyPositiveInt): number of strands
+        t_values(Optional(Sequence[int])): evaluation points. Default to FINGERPRINT_T_VALUES
+
+    Returns:
+        np.ndarray: uint64 array of shape (K, n_strands, n_strands)
+    """
+    words = np.asarray(generators, dtype=np.int64).reshape(1, -1)
+    return batch_burau_matrices_mod_p(words, n_strands, t_values)[0]
+
+
+def hash_matrices(matrices: np.ndarray, n_strands: StrictlyPositiveInt) -> int:
+    """
+    Hash evaluated Burau matrices into a 64 bits fingerprint
+
+    Args:
+        matrices(np.ndarray): uint64 array of shape (K, n_strands, n_strands)
+        n_strands(StrictlyPositiveInt): number of strands, so that identities of different sizes differ
+
+    Returns:
+        int: the fingerprint
+    """
+    h = hashlib.blake2b(digest_size=8)
+    h.update(int(n_strands).to_bytes(4, "little"))
+    h.update(np.ascontiguousarray(matrices, dtype="<u8").tobytes())
+    return int.from_bytes(h.digest(), "little")
+
+
+def burau_fingerprint(
+    generators: Sequence[int],
+    n_strands: StrictlyPositiveInt,
+    t_values: Sequence[int] = FINGERPRINT_T_VALUES,
+) -> int:
+    """
+    Compute a fingerprint of a braid which is a braid invariant
+
+    Equivalent braids always get the same fingerprint, as the Burau matrix is a representation of the braid group.
+    Different braids may collide (Burau is not faithful for 5 strands or more, and evaluation is done at few points),
+    so equality still needs to be confirmed, but only inside a bucket.
+
+    Args:
+        generators(Sequence[int]): signed Artin generators
+        n_strands(StrictlyPositiveInt): number of strands
+        t_values(Optional(Sequence[int])): evaluation points. Default to FINGERPRINT_T_VALUES
+
+    Returns:
+        int: a 64 bits fingerprint
+    """
+    return hash_matrices(
+        burau_matrices_mod_p(generators, n_strands, t_values), n_strands
+    )
+
+
+def batch_burau_fingerprints(
+    words: np.ndarray,
+    n_strands: StrictlyPositiveInt,
+    t_values: Sequence[int] = FINGERPRINT_T_VALUES,
+    chunk_size: StrictlyPositiveInt = 65536,
+) -> np.ndarray:
+    """
+    Compute the fingerprints of many braid words at once
+
+    Args:
+        words(np.ndarray): array of shape (B, L) of signed Artin generators, padded with 0
+        n_strands(StrictlyPositiveInt): number of strands shared by all words
+        t_values(Optional(Sequence[int])): evaluation points. Default to FINGERPRINT_T_VALUES
+        chunk_size(Optional(StrictlyPositiveInt)): number of words processed together. Default to 65536
+
+    Returns:
+        np.ndarray: uint64 array of shape (B,) with the same values as burau_fingerprint
+    """
+    words = np.atleast_2d(np.asarray(words, dtype=np.int64))
+    fingerprints = np.empty(words.shape[0], dtype=np.uint64)
+    for start in range(0, words.shape[0], chunk_size):
+        chunk = words[start : start + chunk_size]
+        # Trailing padding columns do not need to be processed
+        used = np.flatnonzero(chunk.any(axis=0))
+        chunk = chunk[:, : used[-1] + 1] if used.size else chunk[:, :0]
+        matrices = batch_burau_matrices_mod_p(chunk, n_strands, t_values)
+        for k, m in enumerate(matrices):
+            fingerprints[start + k] = hash_matrices(m, n_strands)
+    return fingerprints
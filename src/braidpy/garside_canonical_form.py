@@ -12,8 +12,10 @@ License: Mozilla Public License 2.0
 """
 
 from dataclasses import dataclass
-from typing import Tuple
+from functools import cached_property, lru_cache
+from typing import Iterator, List, Sequence, Tuple
 
+import math_braid
 from math_braid.canonical_factor import CanonicalFactor
 
 from braidpy.utils import PositiveInt, StrictlyPositiveInt
@@ -27,8 +29,13 @@ class GarsideCanonicalFactors:
     Also known as Garside canonical form:
     https://webhomes.maths.ed.ac.uk/~v1ranick/papers/garside.pdf
 
+    The factors are computed by math_braid in the band generators presentation of Birman, Ko and Lee:
+    the Garside element is δ = σₙ₋₁...σ₂σ₁ (with δⁿ = Δ²) and simple elements are
+    products of descending cycles of non crossing partitions.
+    https://arxiv.org/abs/math/9712211
+
     Attributes:
-        n_half_twist (int): The exponent of the Garside element Δ (number of half-twists).
+        n_half_twist (int): The exponent of the Garside element δ.
         n_strands (int): The number of strands in the braid.
         Ai (Tuple[int]): The sequence of simple elements (as indices or identifiers). Also known as Garside generators
     """
@@ -37,23 +44,84 @@ class GarsideCanonicalFactors:
     n_strands: StrictlyPositiveInt
     Ai: Tuple[CanonicalFactor | None]
 
-    @property
+    @cached_property
+    def inf(self) -> int:
+        """
+        Returns the infimum of the braid, the largest p such that δ⁻ᵖβ is positive
+
+        Returns:
+            int: the exponent of δ in the normal form
+        """
+        return self.n_half_twist
+
+    @cached_property
+    def sup(self) -> int:
+        """
+        Returns the supremum of the braid, the smallest q such that β⁻¹δ^q is positive
+
+        Returns:
+            int: inf plus the number of simple elements
+        """
+        return self.n_half_twist + len(self.Ai)
+
+    @cached_property
+    def canonical_length(self) -> PositiveInt:
+        """
+        Returns the canonical length of the braid, sup - inf
+
+        Returns:
+            int: the number of simple elements
+        """
+        return PositiveInt(len(self.Ai))
+
+    def to_generators(self) -> List[int]:
+        """
+        Convert the normal form back to a word of Artin generators
+
+        δ is written σₙ₋₁...σ₁ and each band generator aₜₛ (t > s) is written σₜ₋₁...σₛ₊₁σₛσₛ₊₁⁻¹...σₜ₋₁⁻¹.
+
+        Returns:
+            List[int]: signed Artin generators
+        """
+        gens = delta_generators(self.n_strands, self.n_half_twist)
+        for a in self.Ai:
+            gens += simple_generators(a)
+        return gens
+
+    @cached_property
     def dehornoy_floor(self) -> int:
         """
         Computes the Dehornoy floor of the braid.
 
         It is the unique integer m such that:
-            Δ^{2m} < β < Δ^{2m+2}
-        An estimate is floor(n_half_twist / 2) or floor(n_half_twist / 2) + 1
-        depending on the position of the braid in Dehornoy order.
-
-        For now, we return the conservative lower bound:
-            floor(n_half_twist / 2)
+            Δ^{2m} <= β < Δ^{2m+2}
+        As Δ² = δⁿ and δᵖ <= β <= δᵖ⁺ᵏ, m lies between floor(p / n) and floor((p + k) / n).
+        Each candidate is tested with a COMPARE mode handle reduction of Δ^{-2m}β = δᵖ⁻ⁿᵐA₁...Aₖ,
+        which is only needed when the normal form spans more than one full twist.
 
         Returns:
             int: the Dehornoy floor
         """
-        return self.n_half_twist // 2
+        # Local import as handles_reduction depends on braid, which depends on this module
+        from braidpy.handles_reduction import HandleReductionMode, dehornoy_reduce_core
+
+        lo = self.inf // self.n_strands
+        hi = self.sup // self.n_strands
+        while lo < hi:
+            m = (lo + hi + 1) // 2
+            shifted = GarsideCanonicalFactors(
+                n_half_twist=self.n_half_twist - self.n_strands * m,
+                n_strands=self.n_strands,
+                Ai=self.Ai,
+            )
+            results = dehornoy_reduce_core(
+                shifted.to_generators(), mode=HandleReductionMode.COMPARE
+            )
+            if results.sign >= 0:
+                lo = m
+            else:
+                hi = m - 1
+        return lo
 
     @property
     def garside_length(self) -> PositiveInt:
@@ -65,3 +133,342 @@ class GarsideCanonicalFactors:
             int: the Garside length
         """
         return len(self.Ai)
+
+    @property
+    def key(self) -> tuple:
+        """
+        Hashable key describing the normal form.
+
+        As the normal form is unique, two braids are equivalent if and only if they have the same key.
+
+        Returns:
+            tuple: (n_strands, n_half_twist, permutations of the simple elements)
+        """
+        return (
+            int(self.n_strands),
+            int(self.n_half_twist),
+            tuple(tuple(a.array_form) for a in self.Ai),
+        )
+
+    def _with_factors(
+        self, n_half_twist: int, factors: Sequence[CanonicalFactor]
+    ) -> "GarsideCanonicalFactors":
+        """
+        Build the normal form of δ^n_half_twist * factors[0] * ... * factors[-1]
+
+        Args:
+            n_half_twist(int): exponent of δ
+            factors(Sequence[CanonicalFactor]): simple elements, not necessarily left weighted
+
+        Returns:
+            GarsideCanonicalFactors: the normal form
+        """
+        factors = [a for a in factors if a]
+        if not factors:
+            return GarsideCanonicalFactors(
+                n_half_twist=n_half_twist, n_strands=self.n_strands, Ai=()
+            )
+        b = math_braid.Braid(list(factors), self.n_strands, n_half_twist)
+        b.cleanUpFactors()
+        return GarsideCanonicalFactors(
+            n_half_twist=b.p, n_strands=self.n_strands, Ai=tuple(b.a)
+        )
+
+    def cycling(self) -> "GarsideCanonicalFactors":
+        """
+        Conjugate δᵖA₁...Aₖ by τ⁻ᵖ(A₁) to get δᵖA₂...Aₖτ⁻ᵖ(A₁), with τ(A) = δ⁻¹Aδ
+
+        Iterated cycling increases inf up to its maximum in the conjugacy class.
+
+        Returns:
+            GarsideCanonicalFactors: normal form of the cycled braid
+        """
+        if not self.Ai:
+            return self
+        return self._with_factors(
+            self.n_half_twist,
+            list(self.Ai[1:]) + [self.Ai[0].tau(-self.n_half_twist)],
+        )
+
+    def decycling(self) -> "GarsideCanonicalFactors":
+        """
+        Conjugate δᵖA₁...Aₖ by Aₖ⁻¹ to get δᵖτᵖ(Aₖ)A₁...Aₖ₋₁
+
+        Iterated decycling decreases sup down to its minimum in the conjugacy class.
+
+        Returns:
+            GarsideCanonicalFactors: normal form of the decycled braid
+        """
+        if not self.Ai:
+            return self
+        return self._with_factors(
+            self.n_half_twist,
+            [self.Ai[-1].tau(self.n_half_twist)] + list(self.Ai[:-1]),
+        )
+
+    def conjugate(self, simple: CanonicalFactor) -> "GarsideCanonicalFactors":
+        """
+        Conjugate by a simple element s, to get s⁻¹βs
+
+        Args:
+            simple(CanonicalFactor): the simple element
+
+        Returns:
+            GarsideCanonicalFactors: normal form of the conjugated braid
+        """
+        # s⁻¹ = (s⁻¹δ)δ⁻¹ = δ⁻¹τ⁻¹(s⁻¹δ), and s⁻¹δ is simple
+        complement = ~simple * math_braid.Braid.d(self.n_strands)
+        return self._with_factors(
+            self.n_half_twist - 1,
+            [complement.tau(self.n_half_twist - 1)] + list(self.Ai) + [simple],
+        )
+
+    def inverse(self) -> "GarsideCanonicalFactors":
+        """
+        Normal form of the inverse braid
+
+        With ∂A = A⁻¹δ, (δᵖA₁...Aₖ)⁻¹ = ∂Aₖτ(∂Aₖ₋₁)...τᵏ⁻¹(∂A₁)δ⁻ᵖ⁻ᵏ
+
+        Returns:
+            GarsideCanonicalFactors: normal form of β⁻¹
+        """
+        k = len(self.Ai)
+        q = -self.n_half_twist - k
+        delta = math_braid.Braid.d(self.n_strands)
+        return self._with_factors(
+            q,
+            [(~a * delta).tau(q + i) for i, a in enumerate(reversed(self.Ai))],
+        )
+
+    @cached_property
+    def right_normal_form(self) -> "GarsideRightCanonicalFactors":
+        """
+        Right normal form B₁...Bₘδ^q, deduced from the left normal form of the inverse
+
+        If β⁻¹ = δᵖC₁...Cₘ then β = ∂Cₘτ(∂Cₘ₋₁)...τᵐ⁻¹(∂C₁)δ⁻ᵖ⁻ᵐ, which is right weighted.
+
+        Returns:
+            GarsideRightCanonicalFactors: the right normal form
+        """
+        inv = self.inverse()
+        delta = math_braid.Braid.d(self.n_strands)
+        m = len(inv.Ai)
+        return GarsideRightCanonicalFactors(
+            n_half_twist=-inv.n_half_twist - m,
+            n_strands=self.n_strands,
+            Bi=tuple((~c * delta).tau(i) for i, c in enumerate(reversed(inv.Ai))),
+        )
+
+    @cached_property
+    def symmetric_normal_form(self) -> "SymmetricCanonicalFactors":
+        """
+        Symmetric normal form N⁻¹P, with N and P positive without common left divisor
+
+        If inf < 0 < sup, δᵖA₁...Aₖ = (δᵖA₁...A₋ₚ)(A₁₋ₚ...Aₖ): the denominator is the inverse of the first part
+        and the numerator the second part.
+
+        Returns:
+            SymmetricCanonicalFactors: the symmetric normal form
+        """
+        r = max(0, min(-self.n_half_twist, len(self.Ai)))
+        denominator = GarsideCanonicalFactors(
+            n_half_twist=min(self.n_half_twist, 0),
+            n_strands=self.n_strands,
+            Ai=tuple(self.Ai[:r]),
+        )
+        return SymmetricCanonicalFactors(
+            n_strands=self.n_strands,
+            denominator=denominator.inverse(),
+            numerator=GarsideCanonicalFactors(
+                n_half_twist=max(self.n_half_twist, 0),
+                n_strands=self.n_strands,
+                Ai=tuple(self.Ai[r:]),
+            ),
+        )
+
+
+@dataclass(frozen=True)
+class GarsideRightCanonicalFactors:
+    """
+    Represents the right normal form of a braid, β = B₁...Bₘδ^q with (Bᵢ, Bᵢ₊₁) right weighted
+
+    Attributes:
+        n_half_twist (int): The exponent of the Garside element δ, on the right.
+        n_strands (int): The number of strands in the braid.
+        Bi (Tuple[CanonicalFactor]): The sequence of simple elements.
+    """
+
+    n_half_twist: int
+    n_strands: StrictlyPositiveInt
+    Bi: Tuple[CanonicalFactor, ...]
+
+    @property
+    def key(self) -> tuple:
+        """
+        Hashable key describing the normal form.
+
+        Returns:
+            tuple: (n_strands, n_half_twist, permutations of the simple elements)
+        """
+        return (
+            int(self.n_strands),
+            int(self.n_half_twist),
+            tuple(tuple(b.array_form) for b in self.Bi),
+        )
+
+    def to_generators(self) -> List[int]:
+        """
+        Convert the normal form back to a word of Artin generators
+
+        Returns:
+            List[int]: signed Artin generators
+        """
+        gens = []
+        for b in self.Bi:
+            gens += simple_generators(b)
+        return gens + delta_generators(self.n_strands, self.n_half_twist)
+
+
+@dataclass(frozen=True)
+class SymmetricCanonicalFactors:
+    """
+    Represents the symmetric normal form of a braid, β = N⁻¹P with N and P positive and without common left divisor
+
+    Mixed sign braids get a word made of a negative part followed by a positive part,
+    often much shorter than the left normal form which has to start with a negative power of δ.
+
+    Attributes:
+        n_strands (int): The number of strands in the braid.
+        denominator (GarsideCanonicalFactors): left normal form of N
+        numerator (GarsideCanonicalFactors): left normal form of P
+    """
+
+    n_strands: StrictlyPositiveInt
+    denominator: GarsideCanonicalFactors
+    numerator: GarsideCanonicalFactors
+
+    @property
+    def key(self) -> tuple:
+        """
+        Hashable key describing the normal form.
+
+        Returns:
+            tuple: keys of the denominator and numerator
+        """
+        return (self.denominator.key, self.numerator.key)
+
+    def to_generators(self) -> List[int]:
+        """
+        Convert the normal form back to a word of Artin generators, N⁻¹ followed by P
+
+        Returns:
+            List[int]: signed Artin generators
+        """
+        return [
+            -g for g in reversed(self.denominator.to_generators())
+        ] + self.numerator.to_generators()
+
+
+def delta_generators(n_strands: StrictlyPositiveInt, power: int) -> List[int]:
+    """
+    Artin word of δ^power, with δ = σₙ₋₁...σ₁
+
+    Args:
+        n_strands(StrictlyPositiveInt): number of strands
+        power(int): exponent of δ
+
+    Returns:
+        List[int]: signed Artin generators
+    """
+    delta = list(range(n_strands - 1, 0, -1))
+    if power >= 0:
+        return delta * power
+    return [-g for g in reversed(delta)] * -power
+
+
+def simple_generators(a: CanonicalFactor) -> List[int]:
+    """
+    Artin word of a simple element, each band generator aₜₛ (t > s) being σₜ₋₁...σₛ₊₁σₛσₛ₊₁⁻¹...σₜ₋₁⁻¹
+
+    Args:
+        a(CanonicalFactor): the simple element
+
+    Returns:
+        List[int]: signed Artin generators
+    """
+    gens = []
+    for transposition in a.getTranspositions():
+        s, t = min(transposition), max(transposition)
+        conj = list(range(t - 1, s, -1))
+        gens += conj + [s] + [-g for g in reversed(conj)]
+    return gens
+
+
+def _non_crossing_partitions(lo: int, hi: int) -> Iterator[List[int]]:
+    """
+    Enumerate non crossing partitions of [lo, hi[ as the list of block maximum of each element
+
+    Args:
+        lo(int): first element
+        hi(int): element after the last one
+
+    Returns:
+        Iterator[List[int]]: for each partition, the maximum of the block of lo, lo+1...
+    """
+    if lo >= hi:
+        yield []
+        return
+    # Choose the block of lo, then fill the gaps between its elements independently
+    for rest in range(1 << (hi - lo - 1)):
+        block = [lo] + [lo + 1 + i for i in range(hi - lo - 1) if rest >> i & 1]
+        gaps = [(block[k] + 1, block[k + 1]) for k in range(len(block) - 1)]
+        gaps.append((block[-1] + 1, hi))
+        yield from _fill_gaps(block, gaps, [0] * (hi - lo), lo)
+
+
+def _fill_gaps(
+    block: List[int], gaps: List[Tuple[int, int]], maxima: List[int], lo: int
+) -> Iterator[List[int]]:
+    if not gaps:
+        result = list(maxima)
+        for e in block:
+            result[e - lo] = block[-1]
+        yield result
+        return
+    (g_lo, g_hi), others = gaps[0], gaps[1:]
+    for sub in _non_crossing_partitions(g_lo, g_hi):
+        maxima[g_lo - lo : g_hi - lo] = sub
+        yield from _fill_gaps(block, others, maxima, lo)
+
+
+def iter_simple_elements(n_strands: StrictlyPositiveInt) -> Iterator[CanonicalFactor]:
+    """
+    Enumerate the simple elements in the order of simple_elements, without keeping them
+
+    Useful for many strands, when only the first ones may be needed.
+
+    Args:
+        n_strands(StrictlyPositiveInt): number of strands
+
+    Returns:
+        Iterator[CanonicalFactor]: the simple elements
+    """
+    for maxima in _non_crossing_partitions(0, n_strands):
+        yield CanonicalFactor.createFromDcycle(maxima)
+
+
+@lru_cache(maxsize=None)
+def simple_elements(n_strands: StrictlyPositiveInt) -> Tuple[CanonicalFactor, ...]:
+    """
+    All the simple elements of the Birman-Ko-Lee Garside structure, from the identity to δ
+
+    There is one simple element per non crossing partition of the n strands, so Catalan(n) of them:
+    14 for 4 strands, 42 for 5, 132 for 6, 429 for 7.
+
+    Args:
+        n_strands(StrictlyPositiveInt): number of strands
+
+    Returns:
+        Tuple[CanonicalFactor, ...]: the simple elements
+    """
+    return tuple(iter_simple_elements(n_strands))
@@ -0,0 +1,275 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at https://mozilla.org/MPL/2.0/.
+
+"""
+Filename: kumihimo.py
+Description: Simulation of kumihimo disks (marudai, takadai) by crossings of slot pairs
+Authors: Baptiste Labat
+Created: 2026-10-19
+Repository: https://github.com/baptistelabat/braidpy
+License: Mozilla Public License 2.0
+"""
+
+from dataclasses import dataclass, field
+from functools import cached_property
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from braidpy.annulus_braid import AnnulusBraid
+from braidpy.braid import Braid
+from braidpy.utils import PositiveInt, StrictlyPositiveInt
+
+# Crossing of two slots (a, b, sign), sign being the exponent of the middle generator of its word
+SlotCrossing = Tuple[int, int, int]
+
+# Marker of an empty slot in occupancy arrays
+EMPTY_SLOT = -1
+
+
+def crossing_generators(a: int, b: int, sign: int) -> List[int]:
+    """
+    Artin word of the exchange of the strands of two slots, passing on the same side of the strands in between
+
+    For slots i < j, it is σᵢ⁻¹...σⱼ₋₂⁻¹σⱼ₋₁^sign σⱼ₋₂...σᵢ: "Aba" (sign 1) and "ABa" (sign -1) exchange slots 1 and 3.
+
+    Args:
+        a(int): first slot, numbered from 1
+        b(int): second slot
+        sign(int): 1 or -1, the direction of the crossing
+
+    Returns:
+        List[int]: signed Artin generators
+    """
+    i, j = min(a, b), max(a, b)
+    if i == j or sign not in (1, -1):
+        raise ValueError(f"Invalid crossing of slots {a} and {b} with sign {sign}")
+    conj = [-g for g in range(i, j - 1)]
+    return conj + [sign * (j - 1)] + [-g for g in reversed(conj)]
+
+
+@dataclass(frozen=True)
+class MoveProgram:
+    """
+    Moves of one round on a disk, repeated for every round
+
+    -n_slots: number of slots of the disk, numbered from 1 anticlockwise
+    -steps: crossings of each step, applied in the listed order
+    -rotation: number of slots the disk is turned at the end of the round, the strand of slot i + 1 going to slot i
+    """
+
+    n_slots: int
+    steps: Tuple[Tuple[SlotCrossing, ...], ...]
+    rotation: int = 0
+
+    def __post_init__(self):
+        steps = tuple(
+            tuple((int(a), int(b), int(s)) for a, b, s in step) for step in self.steps
+        )
+        for step in steps:
+            slots = [slot for a, b, _ in step for slot in (a, b)]
+            if any(not 1 <= slot <= self.n_slots for slot in slots):
+                raise ValueError(f"Slots should be between 1 and {self.n_slots}")
+            if len(set(slots)) != len(slots):
+                raise ValueError("Crossings of a step should use distinct slots")
+        object.__setattr__(self, "steps", steps)
+
+    @cached_property
+    def crossings(self) -> np.ndarray:
+        """Crossings of the round as an array of shape (K, 3), with slots numbered from 0"""
+        rows = [(a - 1, b - 1, s) for step in self.steps for a, b, s in step]
+        return np.array(rows, dtype=np.int64).reshape(-1, 3)
+
+    @cached_property
+    def permutation(self) -> np.ndarray:
+        """
+        Slot whose strand ends in each slot after one round, so that occupancy[..., permutation] is the next one
+        """
+        source = np.arange(self.n_slots)
+        for a, b, _ in self.crossings.tolist():
+            source[[a, b]] = source[[b, a]]
+        return np.roll(source, -self.rotation)
+
+    @cached_property
+    def generators(self) -> np.ndarray:
+        """Artin word of the crossings of one round, on one strand per slot"""
+        words = [
+            crossing_generators(a, b, s) for step in self.steps for a, b, s in step
+        ]
+        return np.array([g for w in words for g in w], dtype=np.int16)
+
+    def permutation_power(self, n_rounds: PositiveInt) -> np.ndarray:
+        """
+        Slot permutation after several rounds, by repeated squaring
+
+        Args:
+            n_rounds(PositiveInt): number of rounds
+
+        Returns:
+            np.ndarray: source slot of each slot, numbered from 0
+        """
+        result = np.arange(self.n_slots)
+        power = self.permutation
+        while n_rounds:
+            if n_rounds & 1:
+                result = result[power]
+            power = power[power]
+            n_rounds >>= 1
+        return result
+
+
+@dataclass
+class KumihimoDisk:
+    """
+    Strands in the slots of one or several disks, simulated together
+
+    -occupancy: array of shape (S,) or (B, S), strand in each slot or EMPTY_SLOT
+    -n_steps: number of crossings applied to each disk so far
+    """
+
+    occupancy: np.ndarray
+    n_steps: int = field(default=0)
+
+    def __post_init__(self):
+        self.occupancy = np.array(self.occupancy, dtype=np.int64)
+
+    @classmethod
+    def full(
+        cls, n_slots: StrictlyPositiveInt, n_disks: PositiveInt = 0
+    ) -> "KumihimoDisk":
+        """
+        Disks with strand k in slot k + 1
+
+        Args:
+            n_slots(StrictlyPositiveInt): number of slots
+            n_disks(Optional(PositiveInt)): number of disks, 0 for a single disk of shape (S,). Default to 0
+
+        Returns:
+            KumihimoDisk: the disks
+        """
+        occupancy = np.arange(n_slots)
+        if n_disks:
+            occupancy = np.tile(occupancy, (n_disks, 1))
+        return cls(occupancy)
+
+    @property
+    def n_slots(self) -> int:
+        return self.occupancy.shape[-1]
+
+    def apply_step(self, crossings: Sequence[SlotCrossing]) -> None:
+        """
+        Apply disjoint crossings to all the disks at once
+
+        Args:
+            crossings(Sequence[SlotCrossing]): crossings (a, b, sign), slots being numbered from 1
+        """
+        if not crossings:
+            return
+        a = np.array([c[0] for c in crossings]) - 1
+        b = np.array([c[1] for c in crossings]) - 1
+        self.occupancy[..., np.concatenate([a, b])] = self.occupancy[
+            ..., np.concatenate([b, a])
+        ]
+        self.n_steps += len(crossings)
+
+    def run(self, program: MoveProgram, n_rounds: PositiveInt = 1) -> np.ndarray:
+        """
+        Apply rounds of a program, in a time logarithmic in the number of rounds
+
+        Args:
+            program(MoveProgram): the moves of a round
+            n_rounds(Optional(PositiveInt)): number of rounds. Default to 1
+
+        Returns:
+            np.ndarray: the occupancy after the rounds
+        """
+        self._check_program(program)
+        self.occupancy = self.occupancy[..., program.permutation_power(n_rounds)]
+        self.n_steps += n_rounds * len(program.crossings)
+        return self.occupancy
+
+    def trajectory(self, program: MoveProgram, n_rounds: PositiveInt) -> np.ndarray:
+        """
+        Occupancy of the disks after each round, to follow where each strand goes
+
+        Args:
+            program(MoveProgram): the moves of a round
+            n_rounds(PositiveInt): number of rounds
+
+        Returns:
+            np.ndarray: array of shape (n_rounds + 1, ...) of the occupancy, starting with the current one
+        """
+        self._check_program(program)
+        history = np.empty((n_rounds + 1,) + self.occupancy.shape, dtype=np.int64)
+        history[0] = self.occupancy
+        for r in range(n_rounds):
+            history[r + 1] = history[r][..., program.permutation]
+        self.occupancy = history[-1].copy()
+        self.n_steps += n_rounds * len(program.crossings)
+        return history
+
+    def _check_program(self, program: MoveProgram) -> None:
+        if program.n_slots != self.n_slots:
+            raise ValueError(
+                f"Program for {program.n_slots} slots applied to a disk of {self.n_slots} slots"
+            )
+
+
+def program_annulus_braid(
+    program: MoveProgram, n_rounds: PositiveInt = 1
+) -> AnnulusBraid:
+    """
+    Braid made by rounds of a program, one strand per slot, the rotations of the disk being kept as τ
+
+    Args:
+        program(MoveProgram): the moves of a round
+        n_rounds(Optional(PositiveInt)): number of rounds. Default to 1
+
+    Returns:
+        AnnulusBraid: the braid, whose word is n_rounds times longer than the round
+    """
+    if program.n_slots < 2:
+        raise ValueError("A disk needs at least 2 slots")
+    return (
+        AnnulusBraid(program.generators, program.n_slots, program.rotation) ** n_rounds
+    )
+
+
+def program_braid(
+    program: MoveProgram,
+    n_rounds: PositiveInt = 1,
+    occupancy: Optional[np.ndarray] = None,
+) -> Braid:
+    """
+    Flat braid made by rounds of a program, whose disk is not turned
+
+    The word of a round does not depend on the strands, so the rounds are tiled. Strands of empty slots are
+    removed at the end, with Braid.forget_strand.
+
+    Args:
+        program(MoveProgram): the moves of a round, without rotation
+        n_rounds(Optional(PositiveInt)): number of rounds. Default to 1
+        occupancy(Optional(np.ndarray)): initial occupancy of shape (S,), to remove the empty slots.
+            Default to None, every slot being used
+
+    Returns:
+        Braid: the braid on the used slots
+    """
+    if program.rotation % program.n_slots:
+        raise ValueError(
+            "A turned disk gives an annulus braid, see program_annulus_braid"
+        )
+    generators = np.tile(program.generators, n_rounds).tolist()
+    # A full turn of the disk is the full twist
+    turns = program.rotation * n_rounds // program.n_slots
+    full_twist = list(range(1, program.n_slots)) * program.n_slots
+    if turns < 0:
+        full_twist = [-g for g in reversed(full_twist)]
+    braid = Braid(generators + full_twist * abs(turns), program.n_slots)
+    if occupancy is not None:
+        empty = np.flatnonzero(np.asarray(occupancy) == EMPTY_SLOT) + 1
+        # Highest slots first, so that the numbers of the others do not change
+        for slot in sorted(empty.tolist(), reverse=True):
+            braid = braid.forget_strand(slot)
+    return braid
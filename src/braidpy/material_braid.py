@@ -11,9 +11,11 @@ Repository: https://github.com/baptistelabat/braidpy
 License: Mozilla Public License 2.0
 """
 
-from typing import Callable
+from pathlib import Path
+from typing import Callable, Optional
 
 import numpy as np
+from braidpy.mesh_export import MeshFormat, braid_mesh, export_mesh
 from braidpy.parametric_strand import ParametricStrand
 from braidpy.utils import PositiveFloat, StrictlyPositiveFloat, StrictlyPositiveInt
 
@@ -43,6 +45,34 @@ class MaterialBraid:
         self.n_strands = len(strands)
         self._check_nonintersecting()
 
+    def export_mesh(
+        self,
+        path: str | Path,
+        mesh_format: Optional[MeshFormat | str] = None,
+        n_sample: StrictlyPositiveInt = 200,
+        n_sides: StrictlyPositiveInt = 12,
+        lod: int = 0,
+        tolerance: PositiveFloat = 0.0,
+    ) -> Path:
+        """
+        Write the braid as tube meshes of the physical radius of each strand (OBJ, STL or binary glTF)
+
+        Args:
+            path(str | Path): destination file
+            mesh_format(Optional(MeshFormat | str)): file format. Default to the file extension
+            n_sample(Optional(StrictlyPositiveInt)): number of samples per strand. Default to 200
+            n_sides(Optional(StrictlyPositiveInt)): number of vertices of the cross-section. Default to 12
+            lod(Optional(int)): level of detail, keep one sample out of 2**lod. Default to 0
+            tolerance(Optional(PositiveFloat)): remove samples closer than tolerance to a straight line. Default to 0
+
+        Returns:
+            Path: the written file
+        """
+        mesh = braid_mesh(
+            self.strands, n_sample, n_sides=n_sides, lod=lod, tolerance=tolerance
+        )
+        return export_mesh(mesh, path, mesh_format)
+
     def _check_nonintersecting(
         self, min_clearance: StrictlyPositiveFloat = 1e-3
     ) -> None:
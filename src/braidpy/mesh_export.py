@@ -0,0 +1,383 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at https://mozilla.org/MPL/2.0/.
+
+"""
+Filename: mesh_export.py
+Description: Export of braids as tube meshes (OBJ, STL, binary glTF) without display
+Authors: Baptiste Labat
+Created: 2026-10-19
+Repository: https://github.com/baptistelabat/braidpy
+License: Mozilla Public License 2.0
+"""
+
+import json
+import struct
+from dataclasses import dataclass
+from enum import Enum
+from pathlib import Path
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from braidpy.parametric_strand import ParametricStrand
+from braidpy.utils import PositiveFloat, PositiveInt, StrictlyPositiveInt
+
+
+class MeshFormat(str, Enum):
+    """
+    Supported mesh file formats
+        -obj: Wavefront OBJ (text), one object per strand
+        -stl: binary STL, a single triangle soup
+        -glb: binary glTF 2.0, one primitive per strand
+    """
+
+    OBJ = "OBJ"
+    STL = "STL"
+    GLB = "GLB"
+
+
+@dataclass(frozen=True)
+class TubeMesh:
+    """
+    Triangle mesh of the tubes around the strands
+
+    Attributes:
+        vertices (np.ndarray): float32 array of shape (V, 3)
+        faces (np.ndarray): uint32 array of shape (F, 3), counter clockwise seen from outside
+        groups (Tuple[Tuple[int, int], ...]): range of faces of each strand
+    """
+
+    vertices: np.ndarray
+    faces: np.ndarray
+    groups: Tuple[Tuple[int, int], ...]
+
+
+def decimate(
+    points: np.ndarray, lod: PositiveInt = 0, tolerance: PositiveFloat = 0.0
+) -> np.ndarray:
+    """
+    Reduce the number of points of a polyline, always keeping both ends
+
+    Args:
+        points(np.ndarray): array of shape (N, 3)
+        lod(Optional(PositiveInt)): level of detail, keep one point out of 2**lod. Default to 0
+        tolerance(Optional(PositiveFloat)): also remove points closer than tolerance to the chord
+            joining their neighbours (straight parts). Default to 0
+
+    Returns:
+        np.ndarray: the kept points
+    """
+    points = np.asarray(points, dtype=float)
+    if len(points) <= 2:
+        return points
+    keep = np.zeros(len(points), dtype=bool)
+    keep[:: 2**lod] = True
+    keep[-1] = True
+    points = points[keep]
+
+    if tolerance > 0:
+        while len(points) > 2:
+            prev, mid, nxt = points[:-2], points[1:-1], points[2:]
+            chord = nxt - prev
+            length = np.linalg.norm(chord, axis=1)
+            cross = np.linalg.norm(np.cross(mid - prev, chord), axis=1)
+            deviation = np.where(
+                length > 0, cross / np.where(length > 0, length, 1), 0.0
+            )
+            removable = deviation < tolerance
+            # Do not remove two neighbours at once, as the error would add up
+            removable[1::2] = False
+            if not removable.any():
+                break
+            keep = np.ones(len(points), dtype=bool)
+            keep[1:-1] = ~removable
+            points = points[keep]
+    return points
+
+
+def _frames(points: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Rotation minimizing frames along a polyline, by the double reflection method
+
+    https://www.microsoft.com/en-us/research/wp-content/uploads/2016/12/Computation-of-rotation-minimizing-frames.pdf
+
+    Args:
+        points(np.ndarray): array of shape (N, 3)
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: normals and binormals, arrays of shape (N, 3)
+    """
+    tangents = np.gradient(points, axis=0)
+    tangents /= np.linalg.norm(tangents, axis=1, keepdims=True)
+
+    # Any vector orthogonal to the first tangent
+    t0 = tangents[0]
+    helper = (
+        np.array([1.0, 0.0, 0.0]) if abs(t0[0]) < 0.9 else np.array([0.0, 1.0, 0.0])
+    )
+    normal = np.cross(t0, helper)
+    normal /= np.linalg.norm(normal)
+
+    normals = np.empty_like(points)
+    normals[0] = normal
+    for k in range(len(points) - 1):
+        v1 = points[k + 1] - points[k]
+        c1 = v1 @ v1
+        if c1 == 0:
+            normals[k + 1] = normals[k]
+            continue
+        r_l = normals[k] - (2 / c1) * (v1 @ normals[k]) * v1
+        t_l = tangents[k] - (2 / c1) * (v1 @ tangents[k]) * v1
+        v2 = tangents[k + 1] - t_l
+        c2 = v2 @ v2
+        normals[k + 1] = r_l if c2 == 0 else r_l - (2 / c2) * (v2 @ r_l) * v2
+    binormals = np.cross(tangents, normals)
+    return normals, binormals
+
+
+def tube_mesh(
+    points: np.ndarray,
+    radius: PositiveFloat,
+    n_sides: StrictlyPositiveInt = 12,
+    caps: bool = True,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Sweep a circular cross-section along a polyline
+
+    Args:
+        points(np.ndarray): array of shape (N, 3), N >= 2
+        radius(PositiveFloat): radius of the tube
+        n_sides(Optional(StrictlyPositiveInt)): number of vertices of the cross-section. Default to 12
+        caps(Optional(bool)): close both ends. Default to True
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: vertices of shape (N * n_sides (+2), 3) and faces of shape (F, 3)
+    """
+    points = np.asarray(points, dtype=float)
+    n = len(points)
+    normals, binormals = _frames(points)
+    angles = np.linspace(0, 2 * np.pi, n_sides, endpoint=False)
+    ring = (
+        np.cos(angles)[None, :, None] * normals[:, None, :]
+        + np.sin(angles)[None, :, None] * binormals[:, None, :]
+    )
+    vertices = (points[:, None, :] + radius * ring).reshape(-1, 3)
+
+    # Two triangles per quad between ring k and ring k+1
+    k, j = np.meshgrid(np.arange(n - 1), np.arange(n_sides), indexing="ij")
+    a = k * n_sides + j
+    b = k * n_sides + (j + 1) % n_sides
+    c = a + n_sides
+    d = b + n_sides
+    faces = np.concatenate(
+        [np.stack([a, b, d], axis=-1), np.stack([a, d, c], axis=-1)], axis=1
+    ).reshape(-1, 3)
+
+    if caps:
+        start, end = len(vertices), len(vertices) + 1
+        vertices = np.vstack([vertices, points[0], points[-1]])
+        j = np.arange(n_sides)
+        first = np.stack([np.full(n_sides, start), (j + 1) % n_sides, j], axis=-1)
+        last_ring = (n - 1) * n_sides
+        last = np.stack(
+            [np.full(n_sides, end), last_ring + j, last_ring + (j + 1) % n_sides],
+            axis=-1,
+        )
+        faces = np.vstack([faces, first, last])
+    return vertices, faces
+
+
+def braid_mesh(
+    strands: Sequence[ParametricStrand],
+    n_samples: StrictlyPositiveInt = 200,
+    radius: Optional[PositiveFloat] = None,
+    n_sides: StrictlyPositiveInt = 12,
+    lod: PositiveInt = 0,
+    tolerance: PositiveFloat = 0.0,
+) -> TubeMesh:
+    """
+    Build the tube meshes of all the strands
+
+    Args:
+        strands(Sequence[ParametricStrand]): the strands, MaterialStrand radius is used if available
+        n_samples(Optional(StrictlyPositiveInt)): number of samples per strand before decimation. Default to 200
+        radius(Optional(PositiveFloat)): radius of strands without their own radius. Default to 0.05
+        n_sides(Optional(StrictlyPositiveInt)): number of vertices of the cross-section. Default to 12
+        lod(Optional(PositiveInt)): level of detail, keep one sample out of 2**lod. Default to 0
+        tolerance(Optional(PositiveFloat)): remove samples closer than tolerance to a straight line. Default to 0
+
+    Returns:
+        TubeMesh: the merged mesh
+    """
+    vertices: List[np.ndarray] = []
+    faces: List[np.ndarray] = []
+    groups = []
+    n_vertices = n_faces = 0
+    for strand in strands:
+        points = decimate(
+            np.array(strand.sample(n_samples), dtype=float), lod, tolerance
+        )
+        r = getattr(strand, "radius", None)
+        r = r if r is not None else (radius if radius is not None else 0.05)
+        v, f = tube_mesh(points, r, n_sides)
+        vertices.append(v)
+        faces.append(f + n_vertices)
+        groups.append((n_faces, n_faces + len(f)))
+        n_vertices += len(v)
+        n_faces += len(f)
+    return TubeMesh(
+        vertices=np.vstack(vertices).astype(np.float32),
+        faces=np.vstack(faces).astype(np.uint32),
+        groups=tuple(groups),
+    )
+
+
+def face_normals(mesh: TubeMesh) -> np.ndarray:
+    """
+    Unit normal of each face
+
+    Args:
+        mesh(TubeMesh): the mesh
+
+    Returns:
+        np.ndarray: float32 array of shape (F, 3)
+    """
+    tri = mesh.vertices[mesh.faces].astype(float)
+    n = np.cross(tri[:, 1] - tri[:, 0], tri[:, 2] - tri[:, 0])
+    norm = np.linalg.norm(n, axis=1, keepdims=True)
+    return (n / np.where(norm > 0, norm, 1)).astype(np.float32)
+
+
+def write_obj(mesh: TubeMesh, path: str | Path) -> None:
+    """
+    Write the mesh as a Wavefront OBJ file, each strand being a separate object
+
+    Args:
+        mesh(TubeMesh): the mesh
+        path(str | Path): destination file
+    """
+    with open(path, "w") as f:
+        f.write("# braidpy tube mesh\n")
+        np.savetxt(f, mesh.vertices, fmt="v %.7g %.7g %.7g")
+        for k, (start, stop) in enumerate(mesh.groups):
+            f.write(f"o strand_{k}\n")
+            np.savetxt(f, mesh.faces[start:stop].astype(np.int64) + 1, fmt="f %d %d %d")
+
+
+def write_stl(mesh: TubeMesh, path: str | Path) -> None:
+    """
+    Write the mesh as a binary STL file
+
+    Args:
+        mesh(TubeMesh): the mesh
+        path(str | Path): destination file
+    """
+    record = np.dtype(
+        [("normal", "<f4", (3,)), ("vertices", "<f4", (3, 3)), ("attribute", "<u2")]
+    )
+    data = np.zeros(len(mesh.faces), dtype=record)
+    data["normal"] = face_normals(mesh)
+    data["vertices"] = mesh.vertices[mesh.faces]
+    with open(path, "wb") as f:
+        f.write(b"braidpy tube mesh".ljust(80, b" "))
+        f.write(struct.pack("<I", len(data)))
+        f.write(data.tobytes())
+
+
+def write_glb(mesh: TubeMesh, path: str | Path) -> None:
+    """
+    Write the mesh as a binary glTF 2.0 file, sharing the vertices and with one primitive per strand
+
+    Args:
+        mesh(TubeMesh): the mesh
+        path(str | Path): destination file
+    """
+    positions = np.ascontiguousarray(mesh.vertices, dtype="<f4").tobytes()
+    indices = np.ascontiguousarray(mesh.faces, dtype="<u4").tobytes()
+    gltf = {
+        "asset": {"version": "2.0", "generator": "braidpy"},
+        "scene": 0,
+        "scenes": [{"nodes": [0]}],
+        "nodes": [{"mesh": 0}],
+        "buffers": [{"byteLength": len(positions) + len(indices)}],
+        "bufferViews": [
+            {
+                "buffer": 0,
+                "byteOffset": 0,
+                "byteLength": len(positions),
+                "target": 34962,
+            },
+            {
+                "buffer": 0,
+                "byteOffset": len(positions),
+                "byteLength": len(indices),
+                "target": 34963,
+            },
+        ],
+        "accessors": [
+            {
+                "bufferView": 0,
+                "componentType": 5126,
+                "count": len(mesh.vertices),
+                "type": "VEC3",
+                "min": mesh.vertices.min(axis=0).tolist(),
+                "max": mesh.vertices.max(axis=0).tolist(),
+            }
+        ],
+        "meshes": [{"primitives": []}],
+    }
+    for start, stop in mesh.groups:
+        gltf["accessors"].append(
+            {
+                "bufferView": 1,
+                "byteOffset": start * 12,
+                "componentType": 5125,
+                "count": 3 * (stop - start),
+                "type": "SCALAR",
+            }
+        )
+        gltf["meshes"][0]["primitives"].append(
+            {"attributes": {"POSITION": 0}, "indices": len(gltf["accessors"]) - 1}
+        )
+
+    # Chunks are padded to 4 bytes, with spaces for JSON and zeros for binary
+    json_chunk = json.dumps(gltf, separators=(",", ":")).encode()
+    json_chunk += b" " * (-len(json_chunk) % 4)
+    bin_chunk = positions + indices
+    bin_chunk += b"\x00" * (-len(bin_chunk) % 4)
+    length = 12 + 8 + len(json_chunk) + 8 + len(bin_chunk)
+    with open(path, "wb") as f:
+        f.write(struct.pack("<4sII", b"glTF", 2, length))
+        f.write(struct.pack("<I4s", len(json_chunk), b"JSON"))
+        f.write(json_chunk)
+        f.write(struct.pack("<I4s", len(bin_chunk), b"BIN\x00"))
+        f.write(bin_chunk)
+
+
+def export_mesh(
+    mesh: TubeMesh, path: str | Path, mesh_format: Optional[MeshFormat | str] = None
+) -> Path:
+    """
+    Write the mesh to a file
+
+    Args:
+        mesh(TubeMesh): the mesh
+        path(str | Path): destination file
+        mesh_format(Optional(MeshFormat | str)): file format. Default to the file extension
+
+    Returns:
+        Path: the written file
+    """
+    path = Path(path)
+    if mesh_format is None:
+        mesh_format = path.suffix.lstrip(".")
+    mesh_format = MeshFormat(mesh_format.upper())
+    match mesh_format:
+        case MeshFormat.OBJ:
+            write_obj(mesh, path)
+        case MeshFormat.STL:
+            write_stl(mesh, path)
+        case MeshFormat.GLB:
+            write_glb(mesh, path)
+    return path
@@ -18,6 +18,8 @@ def conjugate(b: Braid, c: Braid) -> Braid:
     """
     Conjugate a braid by another braid.
 
+    To check if two braids are conjugate, see conjugacy.is_conjugate.
+
     Args:
         b: The braid to conjugate
         c: The conjugating braid
@@ -12,10 +12,14 @@ License: Mozilla Public License 2.0
 """
 
 from enum import Enum
-from typing import List, Tuple
+from pathlib import Path
+from typing import List, Optional, Tuple
 
 import matplotlib.pyplot as plt
+import numpy as np
+from mpl_toolkits.mplot3d.art3d import Line3DCollection
 
+from braidpy.mesh_export import MeshFormat, braid_mesh, export_mesh
 from braidpy.parametric_strand import ParametricStrand
 from braidpy.utils import StrictlyPositiveInt, PositiveFloat, terminal_colors
 
@@ -44,26 +48,108 @@ class ParametricBraid:
         """
         return [strand.evaluate(t) for strand in self.strands]
 
+    def export_mesh(
+        self,
+        path: str | Path,
+        mesh_format: Optional[MeshFormat | str] = None,
+        n_sample: StrictlyPositiveInt = 200,
+        radius: PositiveFloat = 0.05,
+        n_sides: StrictlyPositiveInt = 12,
+        lod: int = 0,
+        tolerance: PositiveFloat = 0.0,
+    ) -> Path:
+        """
+        Write the braid as tube meshes to an OBJ, STL or binary glTF file, without any display
+
+        Args:
+            path(str | Path): destination file
+            mesh_format(Optional(MeshFormat | str)): file format. Default to the file extension
+            n_sample(Optional(StrictlyPositiveInt)): number of samples per strand. Default to 200
+            radius(Optional(PositiveFloat)): radius of the tubes. Default to 0.05
+            n_sides(Optional(StrictlyPositiveInt)): number of vertices of the cross-section. Default to 12
+            lod(Optional(int)): level of detail, keep one sample out of 2**lod. Default to 0
+            tolerance(Optional(PositiveFloat)): remove samples closer than tolerance to a straight line. Default to 0
+
+        Returns:
+            Path: the written file
+        """
+        mesh = braid_mesh(self.strands, n_sample, radius, n_sides, lod, tolerance)
+        return export_mesh(mesh, path, mesh_format)
+
+    def sample_batched(
+        self,
+        tolerance: Optional[PositiveFloat] = 1e-3,
+        n_sample: StrictlyPositiveInt = 200,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Sample all the strands in a single array, strands being separated by a row of NaN
+
+        Args:
+            tolerance(Optional(PositiveFloat)): tolerance of adaptive sampling.
+                Default to 1e-3, None for uniform sampling with n_sample points
+            n_sample(Optional(StrictlyPositiveInt)): number of samples per strand for uniform sampling. Default to 200
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: points of shape (N, 3) and index of the strand of each point, of shape (N,)
+        """
+        paths = [
+            strand.sample_adaptive(tolerance)
+            if tolerance is not None
+            else np.array(strand.sample(n_sample), dtype=float)
+            for strand in self.strands
+        ]
+        separator = np.full((1, 3), np.nan)
+        points = np.concatenate(
+            [part for path in paths for part in (path, separator)][:-1]
+        )
+        strand_index = np.concatenate(
+            [
+                np.full(len(path) + (k < len(paths) - 1), k)
+                for k, path in enumerate(paths)
+            ]
+        )
+        return points, strand_index
+
     def plot(
-        self, n_sample: StrictlyPositiveInt = 200, plotter: Plotter = Plotter.PLOTLY
+        self,
+        n_sample: StrictlyPositiveInt = 200,
+        plotter: Plotter = Plotter.PLOTLY,
+        tolerance: Optional[PositiveFloat] = 1e-3,
     ) -> "ParametricBraid":
         """
         Plot the braid in 3D
 
+        Strands are sampled adaptively (straight parts only need their ends) and drawn as a single batch,
+        so that braids with thousands of crossings stay interactive.
+
         Args:
-            n_sample:
+            n_sample(Optional(StrictlyPositiveInt)): number of samples per strand if tolerance is None. Default to 200
+            plotter(Optional(Plotter)): plotting library. Default to plotly
+            tolerance(Optional(PositiveFloat)): tolerance of adaptive sampling. Default to 1e-3
 
         Returns:
             ParametricBraid: the braid itself
         """
+        points, strand_index = self.sample_batched(tolerance, n_sample)
+        colors = [
+            terminal_colors[k % len(terminal_colors)] for k in range(self.n_strands)
+        ]
         if plotter == Plotter.MATPLOTLIB:
             fig = plt.figure()
             ax = fig.add_subplot(111, projection="3d")
-            for i, strand in enumerate(self.strands):
-                path = strand.sample(n_sample)
-                x, y, z = zip(*path)
-                color = terminal_colors[i % len(terminal_colors)]
-                ax.plot(x, y, z, linewidth=10, color=color)
+            # Segments between consecutive samples of the same strand
+            valid = ~np.isnan(points[:-1, 0]) & ~np.isnan(points[1:, 0])
+            segments = np.stack([points[:-1], points[1:]], axis=1)[valid]
+            ax.add_collection3d(
+                Line3DCollection(
+                    segments,
+                    colors=[colors[k] for k in strand_index[:-1][valid]],
+                    linewidths=10,
+                )
+            )
+            ax.set_xlim(np.nanmin(points[:, 0]), np.nanmax(points[:, 0]))
+            ax.set_ylim(np.nanmin(points[:, 1]), np.nanmax(points[:, 1]))
+            ax.set_zlim(np.nanmin(points[:, 2]), np.nanmax(points[:, 2]))
             ax.set_xlabel("X")
             ax.set_ylabel("Y")
             ax.set_zlabel("Z (time)")
@@ -72,34 +158,31 @@ class ParametricBraid:
             plt.show()
         elif plotter == Plotter.PLOTLY:
             fig = go.Figure()
-
-            # First pass to compute global z-range
-            all_paths = []
-            z_min, z_max = float("inf"), float("-inf")
-
-            for strand in self.strands:
-                path = strand.sample(n_sample)
-                z_vals = [pt[2] for pt in path]
-                z_min = min(z_min, min(z_vals))
-                z_max = max(z_max, max(z_vals))
-                all_paths.append(path)
-
-            for i, path in enumerate(all_paths):
-                x, y, z = zip(*path)
-
-                color = terminal_colors[i % len(terminal_colors)]
-
-                fig.add_trace(
-                    go.Scatter3d(
-                        x=x,
-                        y=y,
-                        z=z,
-                        mode="lines",
-                        line=dict(width=10, color=color),
-                        name=f"Strand {i}",
-                        hoverinfo="name",
-                    )
+            z_min, z_max = np.nanmin(points[:, 2]), np.nanmax(points[:, 2])
+
+            # A single trace, with a discrete colorscale mapping strand index to its color
+            n = self.n_strands
+            colorscale = [
+                [bound, colors[k]] for k in range(n) for bound in (k / n, (k + 1) / n)
+            ]
+            fig.add_trace(
+                go.Scatter3d(
+                    x=points[:, 0],
+                    y=points[:, 1],
+                    z=points[:, 2],
+                    mode="lines",
+                    line=dict(
+                        width=10,
+                        color=strand_index,
+                        colorscale=colorscale,
+                        cmin=-0.5,
+                        cmax=n - 0.5,
+                    ),
+                    hovertext=[f"Strand {k}" for k in strand_index],
+                    hoverinfo="text",
+                    name="Strands",
                 )
+            )
 
             fig.update_layout(
                 scene=dict(
@@ -110,7 +193,7 @@ class ParametricBraid:
                     aspectmode="data",
                 ),
                 margin=dict(l=0, r=0, b=0, t=0),
-                showlegend=True,
+                showlegend=False,
             )
 
             fig.show()
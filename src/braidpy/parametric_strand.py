@@ -1,5 +1,7 @@
 import math
-from typing import Callable, List, Tuple
+from typing import Callable, List, Optional, Tuple
+
+import numpy as np
 
 from braidpy.utils import StrictlyPositiveInt
 
@@ -7,6 +9,9 @@ from braidpy.utils import StrictlyPositiveInt
 # Type alias for an arc of a strand: a time interval and a 3D path function over that interval
 Arc = Tuple[float, float, Callable[[float], Tuple[float, float, float]]]
 
+# Number of uniform segments a strand without declared arcs is cut into before adaptive sampling
+ADAPTIVE_MIN_SEGMENTS = 16
+
 
 def make_arc(
     x_start: float, x_end: float, t_start: float, t_end: float, amplitude: float
@@ -76,13 +81,17 @@ def combine_arcs(arcs: List[Arc]) -> Callable[[float], Tuple[float, float, float
 
 
 class ParametricStrand:
-    def __init__(self, func: Callable[[float], tuple]) -> None:
+    def __init__(
+        self, func: Callable[[float], tuple], arcs: Optional[List[Arc]] = None
+    ) -> None:
         """
 
         Args:
             func(Callable[[float], tuple]): a function γ(t) : [0,1] → ℝ³
+            arcs(Optional(List[Arc])): the arcs func is made of, if known. Used for adaptive sampling. Default to None
         """
         self.func = func
+        self.arcs = arcs
 
     def evaluate(self, t: float) -> tuple[float, float, float]:
         """
@@ -108,3 +117,75 @@ class ParametricStrand:
             List[tuple]: list of 3D coordinates
         """
         return [self.evaluate(i / (n - 1)) for i in range(n)]
+
+    def sample_adaptive(
+        self, tolerance: float = 1e-3, max_depth: StrictlyPositiveInt = 12
+    ) -> np.ndarray:
+        """
+        Sample the strand with more points where it is curved
+
+        Each declared arc is first checked at its quarter points: a straight arc (idle strand) gives only its two ends.
+        Without declared arcs, nothing is known of the shape of the strand, so it is first cut into
+        ADAPTIVE_MIN_SEGMENTS uniform segments. Segments are then split at their middle until the middle point is
+        within tolerance of the middle of the chord.
+
+        Args:
+            tolerance(Optional(float)): maximum distance between the curve and the polyline. Default to 1e-3
+            max_depth(Optional(StrictlyPositiveInt)): maximum number of successive splits of an arc. Default to 12
+
+        Returns:
+            np.ndarray: array of shape (N, 3) of 3D coordinates
+        """
+        declared = self.arcs is not None
+        arcs = self.arcs if declared else [(0.0, 1.0, self.func)]
+        n_segments = 4 if declared else ADAPTIVE_MIN_SEGMENTS
+        start_depth = n_segments.bit_length() - 1
+        points = [tuple(arcs[0][2](arcs[0][0]))]
+        for t0, t1, arc in arcs:
+            ts = [t0 + (t1 - t0) * k / n_segments for k in range(n_segments + 1)]
+            ps = [points[-1]] + [tuple(arc(t)) for t in ts[1:]]
+            if declared and all(
+                _distance_to_segment(p, ps[0], ps[-1]) < tolerance for p in ps[1:-1]
+            ):
+                points.append(ps[-1])
+                continue
+
+            # Depth first refinement of the initial segments, in order
+            stack = [
+                (ts[k], ps[k], ts[k + 1], ps[k + 1], start_depth)
+                for k in range(n_segments - 1, -1, -1)
+            ]
+            while stack:
+                ta, pa, tb, pb, depth = stack.pop()
+                tm = (ta + tb) / 2
+                pm = tuple(arc(tm))
+                middle = [(a + b) / 2 for a, b in zip(pa, pb)]
+                if depth >= max_depth or math.dist(pm, middle) < tolerance:
+                    points.append(pb)
+                else:
+                    stack.append((tm, pm, tb, pb, depth + 1))
+                    stack.append((ta, pa, tm, pm, depth + 1))
+        return np.array(points, dtype=float)
+
+
+def _distance_to_segment(p: tuple, a: tuple, b: tuple) -> float:
+    """
+    Distance from point p to segment [a, b]
+
+    Args:
+        p(tuple): 3D point
+        a(tuple): first end of the segment
+        b(tuple): second end of the segment
+
+    Returns:
+        float: the distance
+    """
+    ab = [y - x for x, y in zip(a, b)]
+    ap = [y - x for x, y in zip(a, p)]
+    length2 = sum(c * c for c in ab)
+    u = (
+        0.0
+        if length2 == 0
+        else min(1.0, max(0.0, sum(x * y for x, y in zip(ab, ap)) / length2))
+    )
+    return math.dist(p, [x + u * c for x, c in zip(a, ab)])
@@ -0,0 +1,239 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at https://mozilla.org/MPL/2.0/.
+
+"""
+Filename: pattern_index.py
+Description: Identification of the catalog step repeated by a braid
+Authors: Baptiste Labat
+Created: 2026-10-19
+Repository: https://github.com/baptistelabat/braidpy
+License: Mozilla Public License 2.0
+"""
+
+from collections import defaultdict
+from dataclasses import dataclass
+from math import gcd
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from braidpy.braid import Braid
+from braidpy.fingerprint import MERSENNE_PRIME_61
+from braidpy.utils import PositiveInt, StrictlyPositiveInt
+
+# Fixed base of the polynomial rolling hash, modulo 2⁶¹-1
+ROLLING_HASH_BASE = 1_000_003
+
+
+def rolling_hash(generators: Sequence[int], n_strands: StrictlyPositiveInt) -> int:
+    """
+    Polynomial hash of a word, Σ cᵢ.Bˡ⁻¹⁻ⁱ modulo 2⁶¹-1 with cᵢ = gᵢ + n_strands > 0
+
+    Args:
+        generators(Sequence[int]): signed Artin generators, without zeros
+        n_strands(StrictlyPositiveInt): number of strands
+
+    Returns:
+        int: the hash
+    """
+    h = 0
+    for g in generators:
+        h = (h * ROLLING_HASH_BASE + g + n_strands) % MERSENNE_PRIME_61
+    return h
+
+
+def repeated_hash(h: int, length: PositiveInt, n_repetitions: PositiveInt) -> int:
+    """
+    Rolling hash of a word repeated n times, from the hash of the word
+
+    hash(wⁿ) = hash(w).(1 + Bˡ + B²ˡ + ... + B⁽ⁿ⁻¹⁾ˡ), the geometric sum being computed in O(log n).
+
+    Args:
+        h(int): hash of the word
+        length(PositiveInt): length of the word
+        n_repetitions(PositiveInt): number of repetitions
+
+    Returns:
+        int: the hash of the repeated word
+    """
+    p = MERSENNE_PRIME_61
+    ratio = pow(ROLLING_HASH_BASE, length, p)
+    if ratio == 1:
+        return h * n_repetitions % p
+    geometric = (pow(ratio, n_repetitions, p) - 1) * pow(ratio - 1, p - 2, p) % p
+    return h * geometric % p
+
+
+def _cycle_type(perm: Sequence[int]) -> Tuple[int, ...]:
+    """Sorted cycle lengths of a permutation of 1..n"""
+    seen = [False] * len(perm)
+    lengths = []
+    for start in range(len(perm)):
+        length = 0
+        i = start
+        while not seen[i]:
+            seen[i] = True
+            i = perm[i] - 1
+            length += 1
+        if length:
+            lengths.append(length)
+    return tuple(sorted(lengths))
+
+
+def _power_cycle_type(cycle_type: Tuple[int, ...], k: int) -> Tuple[int, ...]:
+    """Cycle type of the k-th power: a cycle of length c splits in gcd(c, k) cycles of length c / gcd(c, k)"""
+    lengths = []
+    for c in cycle_type:
+        d = gcd(c, k)
+        lengths += [c // d] * d
+    return tuple(sorted(lengths))
+
+
+@dataclass(frozen=True)
+class PatternMatch:
+    """
+    -name: name of the matching step
+    -step: the step braid
+    -n_repetitions: the query is equivalent to step**n_repetitions
+    -same_word: True if the query word is literally the repeated step word, False if only equivalent as braids
+    """
+
+    name: str
+    step: Braid
+    n_repetitions: StrictlyPositiveInt
+    same_word: bool
+
+
+class PatternIndex:
+    def __init__(self, max_repetitions: StrictlyPositiveInt = 64) -> None:
+        """
+        Index of braid steps, to find which step a braid repeats
+
+        Two layers are used:
+        - words: steps are keyed by their length and rolling hash, so that the prefix of the query selects the
+          candidates, and the hash of the whole query is compared to the hash of the repeated step,
+        - braids: steps powers up to max_repetitions are keyed by cheap invariants (number of strands, writhe and
+          cycle type of the permutation), candidates being confirmed with the fingerprint and then ==.
+
+        A query costs a linear pass on the query word, plus the verification of the few candidates,
+        independently of the number of steps indexed.
+
+        Args:
+            max_repetitions(Optional(StrictlyPositiveInt)): highest power searched by the braid layer. Default to 64
+        """
+        self.max_repetitions = StrictlyPositiveInt(max_repetitions)
+        self.steps: Dict[str, Braid] = {}
+        # (n_strands, length, hash) -> names
+        self._by_word: Dict[Tuple[int, int, int], List[str]] = defaultdict(list)
+        # n_strands -> lengths of the steps
+        self._lengths: Dict[int, set] = defaultdict(set)
+        # (n_strands, writhe, cycle type) -> (name, n_repetitions)
+        self._by_invariants: Dict[Tuple, List[Tuple[str, int]]] = defaultdict(list)
+
+    def __len__(self) -> int:
+        return len(self.steps)
+
+    def add(self, name: str, step: Braid) -> None:
+        """
+        Index a step
+
+        Args:
+            name(str): name of the step, must be unique
+            step(Braid): the step
+        """
+        if name in self.steps:
+            raise ValueError(f"Step {name} is already indexed")
+        step = step.no_zero()
+        if not step.generators:
+            raise ValueError("Neutral braid cannot be indexed as a step")
+        self.steps[name] = step
+        n = step.n_strands
+        gens = step.generators
+        self._by_word[(n, len(gens), rolling_hash(gens, n))].append(name)
+        self._lengths[n].add(len(gens))
+
+        writhe = int(step.writhe())
+        cycle_type = _cycle_type(step.perm())
+        for k in range(1, self.max_repetitions + 1):
+            key = (n, k * writhe, _power_cycle_type(cycle_type, k))
+            self._by_invariants[key].append((name, k))
+
+    @classmethod
+    def from_catalog(cls, max_repetitions: StrictlyPositiveInt = 64) -> "PatternIndex":
+        """
+        Index all the braids of the catalog which are not parametrized
+
+        Args:
+            max_repetitions(Optional(StrictlyPositiveInt)): highest power searched by the braid layer. Default to 64
+
+        Returns:
+            PatternIndex: the index
+        """
+        from braidpy.braid_catalog import catalog_braid, catalog_entries
+
+        index = cls(max_repetitions)
+        for entry in catalog_entries():
+            if not entry.parametrized:
+                index.add(entry.name, catalog_braid(entry.name))
+        return index
+
+    def _query_word(self, gens: List[int], n: int) -> Optional[PatternMatch]:
+        lengths = sorted(self._lengths.get(n, ()))
+        if not lengths:
+            return None
+        full_hash = rolling_hash(gens, n)
+        # Prefix hashes are collected along a single pass
+        h = 0
+        wanted = iter(lengths)
+        length = next(wanted)
+        for i, g in enumerate(gens):
+            h = (h * ROLLING_HASH_BASE + g + n) % MERSENNE_PRIME_61
+            if i + 1 < length:
+                continue
+            k, r = divmod(len(gens), length)
+            if r == 0 and repeated_hash(h, length, k) == full_hash:
+                for name in self._by_word.get((n, length, h), ()):
+                    step = self.steps[name]
+                    if step.generators * k == gens:
+                        return PatternMatch(name, step, k, True)
+            length = next(wanted, None)
+            if length is None:
+                break
+        return None
+
+    def _query_braid(self, braid: Braid) -> Optional[PatternMatch]:
+        key = (braid.n_strands, int(braid.writhe()), _cycle_type(braid.perm()))
+        candidates = self._by_invariants.get(key, ())
+        if not candidates:
+            return None
+        fingerprint = braid.fingerprint()
+        # Most likely powers first: those whose word length is closest to the query one
+        length = len(braid.generators)
+        candidates = sorted(
+            candidates,
+            key=lambda c: abs(c[1] * len(self.steps[c[0]].generators) - length),
+        )
+        for name, k in candidates:
+            power = self.steps[name] ** k
+            if power.fingerprint() == fingerprint and power == braid:
+                return PatternMatch(name, self.steps[name], k, False)
+        return None
+
+    def query(self, braid: Braid) -> Optional[PatternMatch]:
+        """
+        Find a step whose repetition is the braid
+
+        The word layer is tried first, then the braid layer which detects repetitions written differently.
+
+        Args:
+            braid(Braid): the braid to identify
+
+        Returns:
+            Optional[PatternMatch]: the match, None if the braid is not a repetition of an indexed step
+        """
+        braid = braid.no_zero()
+        if not braid.generators:
+            return None
+        match = self._query_word(braid.generators, braid.n_strands)
+        if match is None:
+            match = self._query_braid(braid)
+        return match
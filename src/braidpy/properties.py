@@ -12,8 +12,9 @@ License: Mozilla Public License 2.0
 """
 
 from typing import List
-from sympy import Poly, symbols, simplify
+from sympy import Expr, Poly, sqrt, symbols, simplify
 from .braid import Braid
+from .temperley_lieb import jones_polynomial as temperley_lieb_jones_polynomial
 
 t = symbols("t")
 
@@ -33,10 +34,30 @@ def alexander_polynomial(braid: Braid) -> Poly:
     return poly
 
 
+def jones_polynomial(braid: Braid) -> Expr:
+    """
+    Compute the Jones polynomial of the closure of a braid, see temperley_lieb.jones_polynomial
+
+    Exponents are half integers for links with an even number of components.
+
+    Args:
+        braid(Braid): the braid
+
+    Returns:
+        Expr: Laurent polynomial in t
+    """
+    return temperley_lieb_jones_polynomial(braid.generators, braid.n_strands).to_sympy(
+        sqrt(t)
+    )
+
+
 def conjugacy_class(braid: Braid, conjugators: List[Braid] = None) -> List[Braid]:
     """
     Generate conjugates of a braid by a list of other braids.
 
+    Only one step is explored and equivalent words are kept as separate entries.
+    See conjugacy.ConjugacyExplorer for a deduplicated breadth first exploration.
+
     Args:
         braid: The Braid object to conjugate
         conjugators: A list of Braid objects to use as conjugators
@@ -9,9 +9,612 @@ Authors: Baptiste Labat
 Created: 2025-05-30
 Repository: https://github.com/baptistelabat/braidpy
 License: Mozilla Public License 2.0
-"""
 
+Pure braids form the coloured braid group since each strand can be assigned a distinct colour in a way
+compatible with composition
 """
-coloured braid group since each strand can be assigned a distinct colour in a way compatible
-with composition
-"""
+
+import hashlib
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Dict, List, Sequence, Tuple
+
+import numpy as np
+
+from braidpy.braid import Braid
+from braidpy.braid_collection import BraidCollection
+from braidpy.equality import braids_equal
+from braidpy.fingerprint import MERSENNE_PRIME_61, addmod, hash_matrices, mulmod
+from braidpy.random import concatenate_tokens, pure_generator_words
+from braidpy.utils import FunctionalException, StrictlyPositiveInt
+
+# Number of evaluation points of the Gassner representation used by fingerprints
+GASSNER_N_POINTS = 3
+
+
+def pure_generator_index(i: int, j: int) -> int:
+    """
+    Index of Aᵢⱼ among the generators of the pure braid group, in the order of random.pure_generator_words
+
+    Generators are numbered from 1, so that the letter -k is the inverse of the letter k.
+    The generators A₁ⱼ...Aⱼ₋₁ⱼ of the free factor Uⱼ have consecutive indices.
+
+    Args:
+        i(int): first strand, 1 ≤ i < j
+        j(int): second strand
+
+    Returns:
+        int: the index
+    """
+    if not 1 <= i < j:
+        raise ValueError(f"Invalid pure braid generator A({i}, {j})")
+    return (j - 1) * (j - 2) // 2 + i
+
+
+def _free_reduce(letters: Sequence[int]) -> List[int]:
+    """Cancel adjacent inverse letters of a free group word"""
+    stack: List[int] = []
+    for x in letters:
+        if stack and stack[-1] == -x:
+            stack.pop()
+        else:
+            stack.append(x)
+    return stack
+
+
+def _inverse_word(letters: Sequence[int]) -> List[int]:
+    return [-x for x in reversed(letters)]
+
+
+@lru_cache(maxsize=None)
+def _sigma_conjugation_table(
+    n_strands: StrictlyPositiveInt,
+) -> Dict[Tuple[int, int], Tuple[int, ...]]:
+    """
+    Words of σₖᵉAᵢⱼσₖ⁻ᵉ in the generators of the pure braid group
+
+    Returns:
+        Dict: the word of each (signed Artin generator, generator index)
+    """
+    table = {}
+    for j in range(2, n_strands + 1):
+        for i in range(1, j):
+            for k in range(1, n_strands):
+                for e in (1, -1):
+                    if k == i - 1:
+                        word = (
+                            [(k, i, 1), (k, j, 1), (k, i, -1)] if e > 0 else [(k, j, 1)]
+                        )
+                    elif k == i and k + 1 < j:
+                        word = (
+                            [(i + 1, j, 1)]
+                            if e > 0
+                            else [(i, i + 1, -1), (i + 1, j, 1), (i, i + 1, 1)]
+                        )
+                    elif k == j - 1 and k > i:
+                        word = (
+                            [(i, j, -1), (i, j - 1, 1), (i, j, 1)]
+                            if e > 0
+                            else [(i, j - 1, 1)]
+                        )
+                    elif k == j:
+                        word = (
+                            [(i, j + 1, 1)]
+                            if e > 0
+                            else [(i, j, 1), (i, j + 1, 1), (i, j, -1)]
+                        )
+                    else:
+                        word = [(i, j, 1)]
+                    letters = [pure_generator_index(a, b) * s for a, b, s in word]
+                    table[(k * e, pure_generator_index(i, j))] = tuple(letters)
+                    table[(k * e, -pure_generator_index(i, j))] = tuple(
+                        _inverse_word(letters)
+                    )
+    return table
+
+
+def _positive_permutation_word(strands: Sequence[int]) -> List[int]:
+    """
+    Artin word of the positive permutation braid, where each pair of strands crosses at most once
+
+    Args:
+        strands(Sequence[int]): strand at each position at the end of the braid, strands being numbered by their
+            starting position
+
+    Returns:
+        List[int]: positive Artin generators
+    """
+    arrangement = list(strands)
+    swaps = []
+    # Sorting the arrangement back with adjacent transpositions, the braid is made of them in reverse order
+    for end in range(len(arrangement) - 1, 0, -1):
+        for p in range(end):
+            if arrangement[p] > arrangement[p + 1]:
+                arrangement[p], arrangement[p + 1] = arrangement[p + 1], arrangement[p]
+                swaps.append(p + 1)
+    return swaps[::-1]
+
+
+@lru_cache(maxsize=65536)
+def _transversal_conjugate(
+    strands: Tuple[int, ...], k: int, n_strands: StrictlyPositiveInt
+) -> Tuple[int, ...]:
+    """
+    Word of c.Aₖₖ₊₁.c⁻¹ in the generators of the pure braid group, c being the positive permutation braid of strands
+    """
+    table = _sigma_conjugation_table(n_strands)
+    word = [pure_generator_index(k, k + 1)]
+    for g in reversed(_positive_permutation_word(strands)):
+        word = _free_reduce([y for x in word for y in table[(g, x)]])
+    return tuple(word)
+
+
+def _artin_to_pure_letters(
+    generators: Sequence[int], n_strands: StrictlyPositiveInt
+) -> List[int]:
+    """
+    Rewrite the Artin word of a pure braid with the generators Aᵢⱼ, in a single pass
+
+    The prefix of the word is kept as P.c, c being the positive permutation braid of the prefix permutation and
+    P a pure braid. Appending σₖ^±1 to c gives c'.Aₖₖ₊₁^m, with m in {-1, 0, 1} depending on whether the two
+    strands already crossed, so that P becomes P.c'.Aₖₖ₊₁^m.c'⁻¹. These conjugates are cached.
+    """
+    strands = list(range(n_strands))
+    letters: List[int] = []
+    for g in generators:
+        if g == 0:
+            continue
+        k = abs(g)
+        crossed = strands[k - 1] > strands[k]
+        strands[k - 1], strands[k] = strands[k], strands[k - 1]
+        if crossed == (g > 0):
+            conjugate = _transversal_conjugate(tuple(strands), k, n_strands)
+            if g < 0:
+                conjugate = _inverse_word(conjugate)
+            for x in conjugate:
+                if letters and letters[-1] == -x:
+                    letters.pop()
+                else:
+                    letters.append(x)
+    if strands != list(range(n_strands)):
+        raise ValueError("The braid is not pure")
+    return letters
+
+
+def expand_pure_words(
+    letters: np.ndarray,
+    letters_per_word: np.ndarray,
+    n_strands: StrictlyPositiveInt,
+) -> BraidCollection:
+    """
+    Expand words in the generators Aᵢⱼ into Artin words, without Python loop on the letters
+
+    Args:
+        letters(np.ndarray): concatenated signed generator indices of all the words, see pure_generator_index
+        letters_per_word(np.ndarray): number of letters of each word
+        n_strands(StrictlyPositiveInt): number of strands
+
+    Returns:
+        BraidCollection: the Artin words
+    """
+    _, words = pure_generator_words(n_strands)
+    inverses = [tuple(-g for g in reversed(w)) for w in words]
+    letters = np.asarray(letters, dtype=np.int64)
+    if letters.size and (letters.min() < -len(words) or letters.max() > len(words)):
+        raise ValueError(f"Generator index out of bounds for {n_strands} strands")
+    # Aᵢⱼ⁻¹ follow the Aᵢⱼ in the table
+    tokens = np.where(letters > 0, letters - 1, len(words) - letters - 1)
+    return concatenate_tokens(
+        list(words) + inverses, tokens, np.asarray(letters_per_word), n_strands
+    )
+
+
+def gassner_points(
+    n_points: StrictlyPositiveInt, n_strands: StrictlyPositiveInt, seed: int = 0
+) -> np.ndarray:
+    """
+    Pseudo random evaluation points (t₁, ..., tₙ) of the Gassner representation modulo 2⁶¹-1
+
+    They are derived from a hash so that they never change, otherwise stored fingerprints become meaningless.
+
+    Args:
+        n_points(StrictlyPositiveInt): number of points
+        n_strands(StrictlyPositiveInt): number of strands, one variable per strand
+        seed(Optional(int)): seed of the points. Default to 0
+
+    Returns:
+        np.ndarray: uint64 array of shape (n_points, n_strands), with non zero values
+    """
+    points = np.empty((n_points, n_strands), dtype=np.uint64)
+    for k in range(n_points):
+        for s in range(n_strands):
+            digest = hashlib.blake2b(f"gassner:{seed}:{k}:{s}".encode(), digest_size=8)
+            points[k, s] = (
+                int.from_bytes(digest.digest(), "little") % (MERSENNE_PRIME_61 - 1) + 1
+            )
+    return points
+
+
+def batch_gassner_matrices_mod_p(
+    words: np.ndarray,
+    n_strands: StrictlyPositiveInt,
+    points: np.ndarray,
+) -> np.ndarray:
+    """
+    Evaluate the (unreduced) Gassner matrices of several pure braid words modulo 2⁶¹-1 at many points
+
+    The Gassner representation is the coloured Burau representation: each crossing is the Burau matrix of
+    batch_burau_matrices_mod_p, evaluated at the variable of the strand coming from position i + 1 for σᵢ, and from
+    position i for σᵢ⁻¹, so that the product only depends on the braid. Strands are tracked for all the words at once,
+    and all the points are evaluated together, one NumPy update per generator position.
+    For braids which are not pure the product still depends only on the braid, but it is not a representation.
+
+    Args:
+        words(np.ndarray): array of shape (B, L) of signed Artin generators, padded with 0
+        n_strands(StrictlyPositiveInt): number of strands shared by all words
+        points(np.ndarray): values of (t₁, ..., tₙ) of shape (K, n_strands), non zero modulo 2⁶¹-1
+
+    Returns:
+        np.ndarray: uint64 array of shape (B, K, n_strands, n_strands)
+    """
+    words = np.atleast_2d(np.asarray(words, dtype=np.int64))
+    n_words, length = words.shape
+    p = MERSENNE_PRIME_61
+    values = [[int(v) % p for v in row] for row in np.asarray(points).tolist()]
+    if any(v == 0 for row in values for v in row):
+        raise ValueError("Evaluation points should not be zero modulo 2⁶¹-1")
+    k = len(values)
+    inverses = [[pow(v, p - 2, p) for v in row] for row in values]
+    # Constants of shape (n_strands, K), gathered by strand
+    t, one_minus_t, t_inv, one_minus_t_inv = (
+        np.array(c, dtype=np.uint64).T
+        for c in (
+            values,
+            [[(1 - v) % p for v in row] for row in values],
+            inverses,
+            [[(1 - v) % p for v in row] for row in inverses],
+        )
+    )
+
+    matrices = np.zeros((n_words, k, n_strands, n_strands), dtype=np.uint64)
+    matrices[..., np.arange(n_strands), np.arange(n_strands)] = 1
+    strands = np.broadcast_to(np.arange(n_strands), (n_words, n_strands)).copy()
+    rows = np.arange(n_words)
+    for j in range(length):
+        gens = words[:, j]
+
+        # σᵢ: variable of the strand at position i + 1
+        idx = rows[gens > 0]
+        if idx.size:
+            i = gens[idx] - 1
+            strand = strands[idx, i + 1]
+            col, col_next = matrices[idx, :, :, i], matrices[idx, :, :, i + 1]
+            matrices[idx, :, :, i] = addmod(
+                mulmod(col, one_minus_t[strand][:, :, None]), col_next
+            )
+            matrices[idx, :, :, i + 1] = mulmod(col, t[strand][:, :, None])
+            strands[idx, i + 1], strands[idx, i] = strands[idx, i], strand
+
+        # σᵢ⁻¹: variable of the strand at position i
+        idx = rows[gens < 0]
+        if idx.size:
+            i = -gens[idx] - 1
+            strand = strands[idx, i]
+            col, col_next = matrices[idx, :, :, i], matrices[idx, :, :, i + 1]
+            matrices[idx, :, :, i] = mulmod(col_next, t_inv[strand][:, :, None])
+            matrices[idx, :, :, i + 1] = addmod(
+                col, mulmod(col_next, one_minus_t_inv[strand][:, :, None])
+            )
+            strands[idx, i], strands[idx, i + 1] = strands[idx, i + 1], strand
+    return matrices
+
+
+def gassner_fingerprint(
+    generators: Sequence[int],
+    n_strands: StrictlyPositiveInt,
+    n_points: StrictlyPositiveInt = GASSNER_N_POINTS,
+) -> int:
+    """
+    Compute a fingerprint of a pure braid which is a braid invariant, from its Gassner matrices
+
+    Gassner is faithful on 3 strands, and is not known to be unfaithful otherwise. As for burau_fingerprint,
+    equality of fingerprints still needs to be confirmed.
+
+    Args:
+        generators(Sequence[int]): signed Artin generators
+        n_strands(StrictlyPositiveInt): number of strands
+        n_points(Optional(StrictlyPositiveInt)): number of evaluation points. Default to GASSNER_N_POINTS
+
+    Returns:
+        int: a 64 bits fingerprint
+    """
+    words = np.asarray(generators, dtype=np.int64).reshape(1, -1)
+    matrices = batch_gassner_matrices_mod_p(
+        words, n_strands, gassner_points(n_points, n_strands)
+    )
+    return hash_matrices(matrices[0], n_strands)
+
+
+def batch_gassner_fingerprints(
+    words: np.ndarray,
+    n_strands: StrictlyPositiveInt,
+    n_points: StrictlyPositiveInt = GASSNER_N_POINTS,
+    chunk_size: StrictlyPositiveInt = 65536,
+) -> np.ndarray:
+    """
+    Compute the Gassner fingerprints of many pure braid words at once
+
+    Args:
+        words(np.ndarray): array of shape (B, L) of signed Artin generators, padded with 0
+        n_strands(StrictlyPositiveInt): number of strands shared by all words
+        n_points(Optional(StrictlyPositiveInt)): number of evaluation points. Default to GASSNER_N_POINTS
+        chunk_size(Optional(StrictlyPositiveInt)): number of words processed together. Default to 65536
+
+    Returns:
+        np.ndarray: uint64 array of shape (B,) with the same values as gassner_fingerprint
+    """
+    words = np.atleast_2d(np.asarray(words, dtype=np.int64))
+    points = gassner_points(n_points, n_strands)
+    fingerprints = np.empty(words.shape[0], dtype=np.uint64)
+    for start in range(0, words.shape[0], chunk_size):
+        chunk = words[start : start + chunk_size]
+        # Trailing padding columns do not need to be processed
+        used = np.flatnonzero(chunk.any(axis=0))
+        chunk = chunk[:, : used[-1] + 1] if used.size else chunk[:, :0]
+        matrices = batch_gassner_matrices_mod_p(chunk, n_strands, points)
+        for k, m in enumerate(matrices):
+            fingerprints[start + k] = hash_matrices(m, n_strands)
+    return fingerprints
+
+
+class CombingTooLong(FunctionalException):
+    """
+    Exception to be raised if a factor of a combed pure braid exceeds the allowed length
+    """
+
+    pass
+
+
+@lru_cache(maxsize=None)
+def _combing_table(r: int, s: int, e: int, j: int) -> np.ndarray:
+    """
+    Words of c.Aᵢⱼ^±1.c⁻¹ in the free factor Uⱼ, for c = Aᵣₛᵉ with r < s < j
+
+    Letter ±i stands for Aᵢⱼ^±1. Row i + j - 1 holds the word of letter i, padded with 0.
+    """
+    rows = np.zeros((2 * j - 1, 9), dtype=np.int64)
+    for i in range(1, j):
+        if i == r:
+            word = [-s, r, s] if e > 0 else [r, s, r, -s, -r]
+        elif i == s:
+            word = [-s, -r, s, r, s] if e > 0 else [r, s, -r]
+        elif r < i < s:
+            x = [-s, -r, s, r] if e > 0 else [r, s, -r, -s]
+            word = x + [i] + _inverse_word(x)
+        else:
+            word = [i]
+        rows[i + j - 1, : len(word)] = word
+        rows[-i + j - 1, : len(word)] = _inverse_word(word)
+    return rows
+
+
+@dataclass(eq=False)
+class CombedPureBraid:
+    """
+    Normal form of a pure braid in the semidirect product Pₙ = Uₙ ⋊ Pₙ₋₁, β = β₂β₃...βₙ
+
+    Uⱼ is the free group generated by A₁ⱼ, ..., Aⱼ₋₁ⱼ. Its elements have a unique freely reduced word,
+    so that two pure braids are equal if and only if their combed forms are equal.
+
+    -n_strands: number of strands
+    -factors: freely reduced word of each βⱼ, for j from 2 to n, letter ±i standing for Aᵢⱼ^±1
+    """
+
+    n_strands: int
+    factors: List[np.ndarray] = field(default_factory=list)
+
+    def __eq__(self, other) -> bool:
+        return (
+            isinstance(other, CombedPureBraid)
+            and self.n_strands == other.n_strands
+            and all(np.array_equal(a, b) for a, b in zip(self.factors, other.factors))
+        )
+
+    def to_pure_braid(self) -> "PureBraid":
+        """
+        Convert back to a word in the generators Aᵢⱼ
+
+        Returns:
+            PureBraid: the product β₂β₃...βₙ
+        """
+        letters = []
+        for j, factor in enumerate(self.factors, start=2):
+            letters.extend(
+                int(np.sign(x)) * pure_generator_index(abs(int(x)), j) for x in factor
+            )
+        return PureBraid(letters, self.n_strands)
+
+
+@dataclass(frozen=True)
+class PureBraid:
+    """
+    Pure braid, as a word in the generators Aᵢⱼ = σⱼ₋₁...σᵢ₊₁σᵢ²σᵢ₊₁⁻¹...σⱼ₋₁⁻¹ of the pure braid group
+
+    Args:
+        letters(Tuple[int, ...]): signed generator indices, see pure_generator_index
+        n_strands(int): number of strands
+    """
+
+    letters: Tuple[int, ...]
+    n_strands: int
+
+    def __post_init__(self):
+        letters = tuple(int(x) for x in self.letters)
+        n_generators = self.n_strands * (self.n_strands - 1) // 2
+        if any(x == 0 or abs(x) > n_generators for x in letters):
+            raise ValueError(
+                f"Generator index out of bounds for {self.n_strands} strands"
+            )
+        object.__setattr__(self, "letters", letters)
+
+    @classmethod
+    def from_pairs(
+        cls, pairs: Sequence[Tuple[int, int, int]], n_strands: StrictlyPositiveInt
+    ) -> "PureBraid":
+        """
+        Build a pure braid from a product of generators
+
+        Args:
+            pairs(Sequence[Tuple[int, int, int]]): factors (i, j, e) standing for Aᵢⱼᵉ, e being 1 or -1
+            n_strands(StrictlyPositiveInt): number of strands
+
+        Returns:
+            PureBraid: the product
+        """
+        if any(e not in (1, -1) for _, _, e in pairs):
+            raise ValueError("Exponents should be 1 or -1")
+        return cls([e * pure_generator_index(i, j) for i, j, e in pairs], n_strands)
+
+    @classmethod
+    def from_braid(cls, braid: Braid) -> "PureBraid":
+        """
+        Rewrite a pure braid with the generators Aᵢⱼ, in a single pass over its Artin word
+
+        Args:
+            braid(Braid): the braid, which should be pure
+
+        Returns:
+            PureBraid: the braid, as a freely reduced word
+        """
+        return cls(
+            _artin_to_pure_letters(braid.no_zero().generators, braid.n_strands),
+            braid.n_strands,
+        )
+
+    def __repr__(self) -> str:
+        return f"PureBraid({list(self.letters)}, n_strands={self.n_strands})"
+
+    def __len__(self) -> int:
+        return len(self.letters)
+
+    @property
+    def pairs(self) -> List[Tuple[int, int, int]]:
+        """Factors (i, j, e) of the word, standing for Aᵢⱼᵉ"""
+        generator_pairs, _ = pure_generator_words(self.n_strands)
+        return [
+            (*generator_pairs[abs(x) - 1], 1 if x > 0 else -1) for x in self.letters
+        ]
+
+    def __mul__(self, other: "PureBraid") -> "PureBraid":
+        if self.n_strands != other.n_strands:
+            raise ValueError("Braids must have the same number of strands")
+        return PureBraid(self.letters + other.letters, self.n_strands)
+
+    def __pow__(self, n) -> "PureBraid":
+        if n >= 0:
+            return PureBraid(self.letters * n, self.n_strands)
+        return self.inverse() ** (-n)
+
+    def inverse(self) -> "PureBraid":
+        return PureBraid(_inverse_word(self.letters), self.n_strands)
+
+    def to_braid(self) -> Braid:
+        """
+        Expand into an Artin word
+
+        Returns:
+            Braid: the braid
+        """
+        collection = expand_pure_words(
+            np.array(self.letters, dtype=np.int64),
+            np.array([len(self)]),
+            self.n_strands,
+        )
+        return collection[0]
+
+    def __eq__(self, other) -> bool:
+        """
+        Check if two pure braids are equivalent, comparing their Artin words, see Braid.__eq__
+
+        Args:
+            other(PureBraid): the braid to compare with
+
+        Returns:
+            bool: True if the braid are topologically equivalent
+        """
+        if not isinstance(other, PureBraid) or self.n_strands != other.n_strands:
+            return False
+        return braids_equal(
+            self.to_braid().generators, other.to_braid().generators, self.n_strands
+        )
+
+    def __hash__(self):
+        # The fingerprint is an invariant, consistently with __eq__
+        return self.gassner_fingerprint()
+
+    def gassner_matrices(self, points: np.ndarray) -> np.ndarray:
+        """
+        Evaluate the Gassner matrix modulo 2⁶¹-1, see batch_gassner_matrices_mod_p
+
+        Args:
+            points(np.ndarray): values of (t₁, ..., tₙ) of shape (K, n_strands)
+
+        Returns:
+            np.ndarray: uint64 array of shape (K, n_strands, n_strands)
+        """
+        words = np.array([self.to_braid().generators], dtype=np.int64)
+        return batch_gassner_matrices_mod_p(words, self.n_strands, points)[0]
+
+    def gassner_fingerprint(
+        self, n_points: StrictlyPositiveInt = GASSNER_N_POINTS
+    ) -> int:
+        return gassner_fingerprint(self.to_braid().generators, self.n_strands, n_points)
+
+    def comb(self, max_length: StrictlyPositiveInt = 10**6) -> CombedPureBraid:
+        """
+        Comb the braid into the normal form of the semidirect product decomposition Pₙ = Uₙ ⋊ Pₙ₋₁
+
+        The letters of Uₙ are moved to the right of the word: L.R.Aᵣₛᵉ = L.Aᵣₛᵉ.(Aᵣₛ⁻ᵉ.R.Aᵣₛᵉ), the conjugate of
+        the word R of Uₙ being computed with a lookup table on all its letters at once. The remaining word of
+        Pₙ₋₁ is then combed recursively.
+        Uₙ is exponentially distorted in Pₙ, so that the combed words may grow exponentially with the length of
+        the braid, as conjugation by Aᵣₛ^±1 can replace a letter by nine.
+
+        Args:
+            max_length(Optional(StrictlyPositiveInt)): highest length of the word of a factor. Default to 10⁶
+
+        Returns:
+            CombedPureBraid: the normal form
+
+        Raises:
+            CombingTooLong: if a factor gets longer than max_length
+        """
+        generator_pairs, _ = pure_generator_words(self.n_strands)
+        word = list(self.letters)
+        factors = []
+        for j in range(self.n_strands, 1, -1):
+            first = pure_generator_index(1, j)
+            left: List[int] = []
+            right: List[int] = []
+            for x in word:
+                sign = 1 if x > 0 else -1
+                if abs(x) >= first:
+                    letter = sign * (abs(x) - first + 1)
+                    if right and right[-1] == -letter:
+                        right.pop()
+                    else:
+                        right.append(letter)
+                    continue
+                left.append(x)
+                if right:
+                    r, s = generator_pairs[abs(x) - 1]
+                    table = _combing_table(r, s, -sign, j)
+                    expanded = table[np.array(right) + j - 1].ravel()
+                    right = _free_reduce(expanded[expanded != 0].tolist())
+                    if len(right) > max_length:
+                        raise CombingTooLong(
+                            f"Combed factor of A(., {j}) longer than {max_length}"
+                        )
+            factors.append(np.array(right, dtype=np.int64))
+            word = _free_reduce(left)
+        return CombedPureBraid(self.n_strands, factors[::-1])
@@ -0,0 +1,284 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at https://mozilla.org/MPL/2.0/.
+
+"""
+Filename: random.py
+Description: Vectorized sampling of random braids in a BraidCollection
+Authors: Baptiste Labat
+Created: 2026-10-19
+Repository: https://github.com/baptistelabat/braidpy
+License: Mozilla Public License 2.0
+"""
+
+from functools import lru_cache
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from braidpy.braid_collection import BraidCollection
+from braidpy.garside_canonical_form import (
+    GarsideCanonicalFactors,
+    delta_generators,
+    simple_elements,
+    simple_generators,
+)
+from braidpy.utils import PositiveInt, StrictlyPositiveInt
+
+Seed = Optional[int | np.random.Generator]
+Length = PositiveInt | Tuple[PositiveInt, PositiveInt]
+
+
+def _word_lengths(
+    n_words: PositiveInt, length: Length, rng: np.random.Generator
+) -> np.ndarray:
+    """Fixed length, or uniform in [min, max] if length is a tuple"""
+    if isinstance(length, tuple):
+        low, high = length
+        if not 0 <= low <= high:
+            raise ValueError("Length range should be 0 <= min <= max")
+        return rng.integers(low, high + 1, size=n_words, dtype=np.int64)
+    if length < 0:
+        raise ValueError("Length should be positive")
+    return np.full(n_words, length, dtype=np.int64)
+
+
+def _offsets(lengths: np.ndarray) -> np.ndarray:
+    offsets = np.zeros(lengths.size + 1, dtype=np.int64)
+    np.cumsum(lengths, out=offsets[1:])
+    return offsets
+
+
+def _check_strands(n_strands: StrictlyPositiveInt) -> None:
+    if n_strands < 2:
+        raise ValueError("At least 2 strands are needed to get crossings")
+
+
+def random_words(
+    n_words: PositiveInt,
+    length: Length,
+    n_strands: StrictlyPositiveInt,
+    seed: Seed = None,
+    positive: bool = False,
+) -> BraidCollection:
+    """
+    Sample words whose generators are independent and uniform among σ₁^±1, ..., σₙ₋₁^±1
+
+    Args:
+        n_words(PositiveInt): number of words
+        length(PositiveInt | Tuple[PositiveInt, PositiveInt]): length of the words, or (min, max) for uniform lengths
+        n_strands(StrictlyPositiveInt): number of strands
+        seed(Optional(int | np.random.Generator)): seed or generator, for reproducibility. Default to None
+        positive(Optional(bool)): only sample σ₁, ..., σₙ₋₁. Default to False
+
+    Returns:
+        BraidCollection: the words
+    """
+    _check_strands(n_strands)
+    rng = np.random.default_rng(seed)
+    offsets = _offsets(_word_lengths(n_words, length, rng))
+    size = int(offsets[-1])
+    if positive:
+        generators = rng.integers(1, n_strands, size=size, dtype=np.int16)
+    else:
+        # Draw in [0, 2(n-1)[ and map to -(n-1)...-1, 1...n-1
+        draws = rng.integers(0, 2 * (n_strands - 1), size=size, dtype=np.int16)
+        generators = draws - (n_strands - 1)
+        generators += generators >= 0
+    return BraidCollection(generators, offsets, n_strands)
+
+
+def random_positive_words(
+    n_words: PositiveInt,
+    length: Length,
+    n_strands: StrictlyPositiveInt,
+    seed: Seed = None,
+) -> BraidCollection:
+    """
+    Sample positive words, whose generators are independent and uniform among σ₁, ..., σₙ₋₁
+
+    Args:
+        n_words(PositiveInt): number of words
+        length(PositiveInt | Tuple[PositiveInt, PositiveInt]): length of the words, or (min, max) for uniform lengths
+        n_strands(StrictlyPositiveInt): number of strands
+        seed(Optional(int | np.random.Generator)): seed or generator, for reproducibility. Default to None
+
+    Returns:
+        BraidCollection: the words
+    """
+    return random_words(n_words, length, n_strands, seed=seed, positive=True)
+
+
+def concatenate_tokens(
+    table: Sequence[Sequence[int]],
+    tokens: np.ndarray,
+    tokens_per_word: np.ndarray,
+    n_strands: StrictlyPositiveInt,
+) -> BraidCollection:
+    """
+    Replace each token by its word in the table, and concatenate them in words, without Python loop on the tokens
+
+    Args:
+        table(Sequence[Sequence[int]]): Artin word of each token
+        tokens(np.ndarray): flat array of the tokens of all the words
+        tokens_per_word(np.ndarray): number of tokens of each word
+        n_strands(StrictlyPositiveInt): number of strands
+
+    Returns:
+        BraidCollection: the words
+    """
+    table_lengths = np.array([len(w) for w in table], dtype=np.int64)
+    table_starts = _offsets(table_lengths)[:-1]
+    table_flat = np.array([g for w in table for g in w], dtype=np.int16)
+
+    token_lengths = table_lengths[tokens]
+    token_offsets = _offsets(token_lengths)
+    # Position of each output generator in the table: start of its token word + rank inside it
+    rank = np.arange(token_offsets[-1], dtype=np.int64) - np.repeat(
+        token_offsets[:-1], token_lengths
+    )
+    source = np.repeat(table_starts[tokens], token_lengths) + rank
+    offsets = token_offsets[_offsets(tokens_per_word)]
+    return BraidCollection(table_flat[source], offsets, n_strands)
+
+
+@lru_cache(maxsize=None)
+def pure_generator_words(
+    n_strands: StrictlyPositiveInt,
+) -> Tuple[Tuple[Tuple[int, int], ...], Tuple[Tuple[int, ...], ...]]:
+    """
+    Artin words of the generators of the pure braid group, Aᵢⱼ = σⱼ₋₁...σᵢ₊₁σᵢ²σᵢ₊₁⁻¹...σⱼ₋₁⁻¹ for 1 ≤ i < j ≤ n
+
+    Args:
+        n_strands(StrictlyPositiveInt): number of strands
+
+    Returns:
+        Tuple: the pairs (i, j), and the words of Aᵢⱼ
+    """
+    pairs = []
+    words = []
+    for j in range(2, n_strands + 1):
+        for i in range(1, j):
+            conj = list(range(j - 1, i, -1))
+            pairs.append((i, j))
+            words.append(tuple(conj + [i, i] + [-g for g in reversed(conj)]))
+    return tuple(pairs), tuple(words)
+
+
+def random_pure_braids(
+    n_words: PositiveInt,
+    length: Length,
+    n_strands: StrictlyPositiveInt,
+    seed: Seed = None,
+) -> BraidCollection:
+    """
+    Sample pure braids as products of independent generators uniform among the Aᵢⱼ^±1
+
+    Args:
+        n_words(PositiveInt): number of braids
+        length(PositiveInt | Tuple[PositiveInt, PositiveInt]): number of Aᵢⱼ^±1 factors, or (min, max)
+        n_strands(StrictlyPositiveInt): number of strands
+        seed(Optional(int | np.random.Generator)): seed or generator, for reproducibility. Default to None
+
+    Returns:
+        BraidCollection: the braids, written with Artin generators
+    """
+    _check_strands(n_strands)
+    rng = np.random.default_rng(seed)
+    _, words = pure_generator_words(n_strands)
+    inverses = [tuple(-g for g in reversed(w)) for w in words]
+    lengths = _word_lengths(n_words, length, rng)
+    tokens = rng.integers(0, 2 * len(words), size=int(lengths.sum()))
+    return concatenate_tokens(list(words) + inverses, tokens, lengths, n_strands)
+
+
+@lru_cache(maxsize=None)
+def left_weighted_transitions(n_strands: StrictlyPositiveInt) -> np.ndarray:
+    """
+    Adjacency matrix of the left weighted pairs of proper simple elements (neither identity nor δ)
+
+    M[a, b] is True if AB is in left normal form, the indices being those of simple_elements(n_strands)[1:-1].
+    It is computed once per number of strands, in Catalan(n)² normal form computations.
+
+    Args:
+        n_strands(StrictlyPositiveInt): number of strands
+
+    Returns:
+        np.ndarray: boolean matrix
+    """
+    simples = simple_elements(n_strands)[1:-1]
+    identity = GarsideCanonicalFactors(0, n_strands, ())
+    forms = [tuple(a.array_form) for a in simples]
+    matrix = np.zeros((len(simples), len(simples)), dtype=bool)
+    for i, a in enumerate(simples):
+        for j, b in enumerate(simples):
+            key = identity._with_factors(0, [a, b]).key
+            matrix[i, j] = key == (n_strands, 0, (forms[i], forms[j]))
+    return matrix
+
+
+def _sample_rows(
+    weights: np.ndarray, states: np.ndarray, rng: np.random.Generator
+) -> np.ndarray:
+    """For each state s, sample an index with probability proportional to weights[s], grouping the states"""
+    u = rng.random(states.size)
+    result = np.empty(states.size, dtype=np.int64)
+    for s in np.unique(states):
+        cdf = np.cumsum(weights[s])
+        mask = states == s
+        result[mask] = np.searchsorted(cdf / cdf[-1], u[mask], side="right")
+    return np.minimum(result, weights.shape[1] - 1)
+
+
+def random_normal_forms(
+    n_words: PositiveInt,
+    canonical_length: PositiveInt,
+    n_strands: StrictlyPositiveInt,
+    inf: int | Tuple[int, int] = 0,
+    seed: Seed = None,
+) -> BraidCollection:
+    """
+    Sample braids uniformly among those of given infimum and canonical length
+
+    The left normal forms δᵖA₁...Aₖ are drawn with a Markov chain on the proper simple elements of the
+    Birman-Ko-Lee structure, weighted by the number of left weighted continuations so that all normal forms
+    are equally likely. The loops are on the canonical length and on the simple elements, not on the words.
+
+    Args:
+        n_words(PositiveInt): number of braids
+        canonical_length(PositiveInt): number k of simple factors
+        n_strands(StrictlyPositiveInt): number of strands
+        inf(Optional(int | Tuple[int, int])): exponent p of δ, or (min, max) for uniform exponents. Default to 0
+        seed(Optional(int | np.random.Generator)): seed or generator, for reproducibility. Default to None
+
+    Returns:
+        BraidCollection: the braids, written as δᵖ followed by the Artin words of the factors
+    """
+    _check_strands(n_strands)
+    rng = np.random.default_rng(seed)
+    low, high = inf if isinstance(inf, tuple) else (inf, inf)
+    powers = rng.integers(low, high + 1, size=n_words)
+
+    simples = simple_elements(n_strands)[1:-1]
+    table: List[Sequence[int]] = [simple_generators(a) for a in simples]
+    table += [delta_generators(n_strands, p) for p in range(low, high + 1)]
+
+    tokens = np.empty((n_words, canonical_length + 1), dtype=np.int64)
+    tokens[:, 0] = len(simples) + powers - low
+    if canonical_length > 0 and n_words > 0:
+        transitions = left_weighted_transitions(n_strands).astype(np.float64)
+        # continuations[m][a]: proportional to the number of normal forms of m + 1 factors starting with a
+        continuations = [np.ones(len(simples))]
+        for _ in range(canonical_length - 1):
+            c = transitions @ continuations[-1]
+            continuations.append(c / c.max())
+        first = continuations[-1][None, :]
+        state = _sample_rows(first, np.zeros(n_words, dtype=np.int64), rng)
+        tokens[:, 1] = state
+        for m in range(2, canonical_length + 1):
+            weights = transitions * continuations[canonical_length - m][None, :]
+            state = _sample_rows(weights, state, rng)
+            tokens[:, m] = state
+
+    tokens_per_word = np.full(n_words, canonical_length + 1, dtype=np.int64)
+    return concatenate_tokens(table, tokens.ravel(), tokens_per_word, n_strands)
@@ -0,0 +1,381 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at https://mozilla.org/MPL/2.0/.
+
+"""
+Filename: reducibility.py
+Description: Detection of reducible braids and of their tubes, from reduction curves in the super summit set
+Authors: Baptiste Labat
+Created: 2026-10-19
+Repository: https://github.com/baptistelabat/braidpy
+License: Mozilla Public License 2.0
+"""
+
+from bisect import bisect
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+from math_braid.canonical_factor import CanonicalFactor
+
+from braidpy.braid import Braid
+from braidpy.conjugacy import SummitSetTooLarge
+from braidpy.dynnikov import batch_lamination_action
+from braidpy.garside_canonical_form import (
+    GarsideCanonicalFactors,
+    iter_simple_elements,
+    simple_generators,
+)
+from braidpy.utils import StrictlyPositiveInt
+
+# Highest number of canonical forms whose reduction curves are kept in cache
+REDUCTION_CURVES_CACHE_SIZE = 65536
+
+# Positions of the punctures surrounded by each curve of a family
+Curves = Tuple[Tuple[int, ...], ...]
+
+# Reduction curves of each canonical form already checked, by normal form key
+_REDUCTION_CURVES: Dict[tuple, Optional[Curves]] = {}
+
+
+@dataclass
+class ReducibilityAnalysis:
+    """
+    Result of the reducibility detection, which is truthy if the braid is reducible
+
+    -reducible: True if the strands can be grouped in tubes, fewer tubes than strands. None if no reduction curve
+        was found, which does not prove that the braid is irreducible, and False only for fewer than 3 strands
+    -tubes: partition of the strands, numbered from 1 by their starting position as in Braid.perm, a strand outside
+        the tubes being alone. Tubes are sorted by their smallest strand
+    -conjugate: conjugate c⁻¹βc preserving the curves, None if no curve was found
+    -conjugator: braid c, so that the tubes are the strands ending inside the curves after c
+    -curves: positions of the punctures surrounded by each curve of the conjugate, the punctures being on a circle
+        as in the Birman-Ko-Lee structure and each curve surrounding their convex hull
+    -n_explored: number of canonical forms checked
+    """
+
+    reducible: Optional[bool]
+    tubes: List[Tuple[int, ...]]
+    conjugate: Optional[Braid]
+    conjugator: Optional[Braid]
+    curves: Curves
+    n_explored: int
+
+    def __bool__(self) -> bool:
+        return bool(self.reducible)
+
+
+def clear_reduction_curves_cache() -> None:
+    """Forget the reduction curves found for each canonical form"""
+    _REDUCTION_CURVES.clear()
+
+
+@lru_cache(maxsize=None)
+def _curve_coordinates(block: Tuple[int, ...], n_punctures: int) -> Tuple[int, ...]:
+    """
+    Dynnikov coordinates of the convex curve around punctures, ie on the line the curve around the punctures of
+    the block passing below the punctures in between
+
+    The curve crosses twice the vertical arc below each puncture it passes above, so aᵢ = 1 for them, and its ends
+    give bᵢ = -1 at the first puncture and 1 at the last one, for the puncture i + 1 of coordinates (aᵢ, bᵢ).
+    """
+    first, last = block[0], block[-1]
+    inside = set(block)
+    a = [int(first < p < last and p not in inside) for p in range(2, n_punctures)]
+    b = [int(p == last) - int(p == first) for p in range(2, n_punctures)]
+    return tuple(a + b)
+
+
+@lru_cache(maxsize=None)
+def _round_blocks(n: int) -> Curves:
+    """
+    Punctures surrounded by the round and almost round curves of Lee and Lee, with the punctures on a circle
+
+    A round curve surrounds consecutive punctures of the circle. An almost round curve surrounds consecutive
+    punctures but one, next to an end of the arc. There are O(n²) of them.
+    """
+    blocks = set()
+    for start in range(n):
+        for size in range(2, n):
+            arc = [(start + k) % n + 1 for k in range(size + 1)]
+            blocks.add(tuple(sorted(arc[:size])))
+            blocks.add(tuple(sorted(arc[:1] + arc[2:])))
+            blocks.add(tuple(sorted(arc[:-2] + arc[-1:])))
+    return tuple(sorted(b for b in blocks if len(b) < n))
+
+
+def _non_crossing(block: Tuple[int, ...], other: Tuple[int, ...]) -> bool:
+    """True if two disjoint blocks of punctures on a circle have disjoint convex hulls"""
+    return len({bisect(block, p) % len(block) for p in other}) == 1
+
+
+@lru_cache(maxsize=4096)
+def _candidate_orbits(final: Tuple[int, ...]) -> Tuple[Curves, ...]:
+    """
+    Families of disjoint convex curves which are the orbit of a round or almost round curve under a permutation
+
+    A family preserved by a braid is a union of orbits of curves, each orbit being preserved, so single orbits are
+    enough. Larger curves come first.
+
+    Args:
+        final(Tuple[int, ...]): strand at each final position, as Braid.perm
+
+    Returns:
+        Tuple[Curves, ...]: the orbits, as sorted tuples of positions of each curve
+    """
+    position = {strand: p for p, strand in enumerate(final, start=1)}
+    orbits = set()
+    for block in _round_blocks(len(final)):
+        orbit = [block]
+        while True:
+            image = tuple(sorted(position[s] for s in orbit[-1]))
+            if image == block:
+                break
+            orbit.append(image)
+        if len(set(p for b in orbit for p in b)) != len(block) * len(orbit):
+            continue
+        if all(_non_crossing(x, y) for k, x in enumerate(orbit) for y in orbit[:k]):
+            orbits.add(tuple(sorted(orbit)))
+    return tuple(sorted(orbits, key=lambda o: (-len(o[0]), o)))
+
+
+@lru_cache(maxsize=4096)
+def _candidate_curves(
+    final: Tuple[int, ...],
+) -> Tuple[Tuple[Curves, ...], Curves, np.ndarray, np.ndarray]:
+    """
+    Curves of the candidate orbits of a permutation, with their Dynnikov coordinates
+
+    Args:
+        final(Tuple[int, ...]): strand at each final position, as Braid.perm
+
+    Returns:
+        Tuple: the orbits of _candidate_orbits, their curves, the coordinates of the curves and the coordinates of
+            the curves around the images of their punctures, of shape (C, 2(n - 2))
+    """
+    n = len(final)
+    orbits = _candidate_orbits(final)
+    position = {strand: p for p, strand in enumerate(final, start=1)}
+    curves = tuple(sorted({block for orbit in orbits for block in orbit}))
+    coordinates = np.array(
+        [_curve_coordinates(block, n) for block in curves], dtype=np.int64
+    ).reshape(-1, 2 * (n - 2))
+    images = np.array(
+        [
+            _curve_coordinates(tuple(sorted(position[s] for s in block)), n)
+            for block in curves
+        ],
+        dtype=np.int64,
+    ).reshape(-1, 2 * (n - 2))
+    return orbits, curves, coordinates, images
+
+
+def _merge_orbits(orbits: Sequence[Curves]) -> Curves:
+    """Union of preserved orbits whose curves are disjoint, larger curves first"""
+    family: List[Tuple[int, ...]] = []
+    for orbit in orbits:
+        if all(
+            not set(x) & set(y) and _non_crossing(x, y) for x in orbit for y in family
+        ):
+            family += orbit
+    return tuple(sorted(family))
+
+
+def _reduction_curves(factors: GarsideCanonicalFactors) -> Optional[Curves]:
+    """
+    Find a family of convex curves preserved by a braid, with a cache by normal form
+
+    The candidate curves are acted on all at once with Dynnikov coordinates, which are exact, in a single pass
+    on the word. An orbit of curves is preserved if each curve is sent on the curve around the image of its
+    punctures. The preserved orbits are then merged.
+    """
+    key = factors.key
+    if key in _REDUCTION_CURVES:
+        return _REDUCTION_CURVES[key]
+    generators = factors.to_generators()
+    n = factors.n_strands
+    orbits, curves, coordinates, images = _candidate_curves(
+        tuple(Braid(generators, n).perm())
+    )
+    found = None
+    if orbits:
+        actions = batch_lamination_action(generators, n, coordinates)
+        kept = {
+            block
+            for block, same in zip(curves, (actions == images).all(axis=1))
+            if same
+        }
+        preserved = [orbit for orbit in orbits if kept.issuperset(orbit)]
+        found = _merge_orbits(preserved) if preserved else None
+    if len(_REDUCTION_CURVES) >= REDUCTION_CURVES_CACHE_SIZE:
+        _REDUCTION_CURVES.clear()
+    _REDUCTION_CURVES[key] = found
+    return found
+
+
+def _summit_representative(
+    factors: GarsideCanonicalFactors,
+) -> Tuple[GarsideCanonicalFactors, List[int]]:
+    """
+    Element of the super summit set, as conjugacy.summit_representative, with its conjugator
+
+    Returns:
+        Tuple: the normal form c⁻¹βc, and the Artin word of c
+    """
+    bound = factors.n_strands - 1
+    conjugator: List[int] = []
+    best, best_conjugator, tries = factors, conjugator, 0
+    while best.Ai and tries < bound:
+        # Cycling conjugates by τ⁻ᵖ(A₁)
+        conjugator = conjugator + simple_generators(
+            factors.Ai[0].tau(-factors.n_half_twist)
+        )
+        factors = factors.cycling()
+        tries += 1
+        if factors.inf > best.inf:
+            best, best_conjugator, tries = factors, conjugator, 0
+
+    factors, conjugator, tries = best, best_conjugator, 0
+    while best.Ai and tries < bound:
+        # Decycling conjugates by Aₖ⁻¹
+        conjugator = conjugator + [
+            -g for g in reversed(simple_generators(factors.Ai[-1]))
+        ]
+        factors = factors.decycling()
+        tries += 1
+        if factors.sup < best.sup:
+            best, best_conjugator, tries = factors, conjugator, 0
+    return best, best_conjugator
+
+
+def _proper_simples(
+    pending: Iterator[CanonicalFactor], seen: List[CanonicalFactor]
+) -> Iterator[CanonicalFactor]:
+    """
+    Simple elements other than the identity, already seen ones first, the next ones being only built when needed
+
+    There are Catalan(n) simple elements, far too many to build for tens of strands when max_size stops the
+    exploration early.
+    """
+    k = 0
+    while True:
+        if k == len(seen):
+            s = next(pending, None)
+            if s is None:
+                return
+            if not s:
+                continue
+            seen.append(s)
+        yield seen[k]
+        k += 1
+
+
+def _analysis(
+    braid: Braid,
+    conjugate: GarsideCanonicalFactors,
+    conjugator: List[int],
+    curves: Curves,
+    n_explored: int,
+) -> ReducibilityAnalysis:
+    n = braid.n_strands
+    conjugator = Braid(conjugator, n)
+    final = conjugator.perm()
+    inside = {p for block in curves for p in block}
+    tubes = [tuple(sorted(final[p - 1] for p in block)) for block in curves]
+    tubes += [(final[p - 1],) for p in range(1, n + 1) if p not in inside]
+    return ReducibilityAnalysis(
+        reducible=True,
+        tubes=sorted(tubes),
+        conjugate=Braid(conjugate.to_generators(), n),
+        conjugator=conjugator,
+        curves=curves,
+        n_explored=n_explored,
+    )
+
+
+def _n_tubes(n_strands: int, curves: Curves) -> int:
+    return n_strands - sum(len(block) - 1 for block in curves)
+
+
+def reducibility_analysis(
+    braid: Braid, max_size: StrictlyPositiveInt = 10_000, coarsest: bool = False
+) -> ReducibilityAnalysis:
+    """
+    Search the tubes of a braid from reduction curves in its super summit set
+
+    Lee and Lee show that a reducible braid has a conjugate in its super summit set for the Birman-Ko-Lee structure
+    with a round or almost round reduction curve, not always a round one. With the punctures on a circle, the orbits
+    of these O(n²) curves are checked at once for each element, with a single pass of Dynnikov coordinates on its
+    word. The set is explored by conjugation by simple elements from a summit representative, keeping track of the
+    conjugators, until an element with such curves is found. The curves of each canonical form are cached, so that
+    braids sharing their conjugacy class are fast to analyse once one of them was.
+
+    When no curve is found in the whole super summit set, reducible is None rather than False: the search is not
+    proven to find every reducible braid.
+
+    The first element found may only show some of the tubes, for example the inner tubes of a tube in a tube.
+    The coarsest partition needs to explore the whole super summit set.
+
+    E.-K. Lee and S. J. Lee, "A Garside-theoretic approach to the reducibility problem in braid groups",
+    Journal of Algebra 320 (2008), 783-820. https://arxiv.org/abs/math/0506188
+
+    Args:
+        braid(Braid): the braid
+        max_size(Optional(StrictlyPositiveInt)): highest number of elements of the super summit set explored.
+            Default to 10 000
+        coarsest(Optional(bool)): if True, explore the whole super summit set to return the partition with the
+            fewest tubes. Default to False, the first partition found
+
+    Returns:
+        ReducibilityAnalysis: the analysis, with the tube partition
+
+    Raises:
+        SummitSetTooLarge: if max_size elements were explored without finding reduction curves
+    """
+    n = braid.n_strands
+    if n < 3:
+        # There is no essential curve with fewer than 3 punctures
+        return ReducibilityAnalysis(
+            False, [(s,) for s in range(1, n + 1)], None, None, (), 0
+        )
+    representative, conjugator = _summit_representative(braid.get_canonical_factors())
+    best = None
+    found = _reduction_curves(representative)
+    if found:
+        best = (representative, conjugator, found)
+        if not coarsest:
+            return _analysis(braid, *best, 1)
+
+    inf, sup = representative.inf, representative.sup
+    pending, simples = iter_simple_elements(n), []
+    explored = {representative.key}
+    worklist = [(representative, conjugator)]
+    complete = True
+    while worklist and complete:
+        current, conjugator = worklist.pop()
+        for s in _proper_simples(pending, simples):
+            conj = current.conjugate(s)
+            if conj.inf != inf or conj.sup != sup or conj.key in explored:
+                continue
+            explored.add(conj.key)
+            word = conjugator + simple_generators(s)
+            found = _reduction_curves(conj)
+            if found and (best is None or _n_tubes(n, found) < _n_tubes(n, best[2])):
+                best = (conj, word, found)
+                if not coarsest:
+                    return _analysis(braid, *best, len(explored))
+            if len(explored) >= max_size:
+                complete = False
+                break
+            worklist.append((conj, word))
+
+    if best is not None:
+        return _analysis(braid, *best, len(explored))
+    if not complete:
+        raise SummitSetTooLarge(
+            f"No reduction curves in the first {max_size} elements of the super summit set"
+        )
+    return ReducibilityAnalysis(
+        None, [(s,) for s in range(1, n + 1)], None, None, (), len(explored)
+    )
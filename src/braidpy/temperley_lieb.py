@@ -0,0 +1,450 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at https://mozilla.org/MPL/2.0/.
+
+"""
+Filename: temperley_lieb.py
+Description: Kauffman bracket and Jones polynomial of braid closures with the Temperley-Lieb algebra
+Authors: Baptiste Labat
+Created: 2026-10-19
+Repository: https://github.com/baptistelabat/braidpy
+License: Mozilla Public License 2.0
+"""
+
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, List, Sequence, Tuple
+
+import numpy as np
+
+from braidpy.utils import StrictlyPositiveInt
+
+# Coefficients are kept in int64 while a step cannot overflow, and split in int64 limbs beyond
+TEMPERLEY_LIEB_INT64_BOUND = 1 << 62
+
+# Number of bits of each limb but the last one, which holds the sign
+TEMPERLEY_LIEB_LIMB_BITS = 32
+
+Diagram = Tuple[int, ...]
+
+
+@dataclass(frozen=True)
+class LaurentPolynomial:
+    """
+    Polynomial Σ cₖ.x^(min_degree + k)
+
+    -coefficients: integer coefficients of increasing degrees, without zeros at both ends
+    -min_degree: degree of the first coefficient
+    """
+
+    coefficients: Tuple[int, ...]
+    min_degree: int = 0
+
+    @classmethod
+    def from_array(
+        cls, coefficients: np.ndarray, min_degree: int
+    ) -> "LaurentPolynomial":
+        nonzero = np.flatnonzero(coefficients != 0)
+        if not nonzero.size:
+            return cls((), 0)
+        first, last = nonzero[0], nonzero[-1]
+        return cls(
+            tuple(int(c) for c in coefficients[first : last + 1]),
+            min_degree + int(first),
+        )
+
+    @property
+    def max_degree(self) -> int:
+        return self.min_degree + len(self.coefficients) - 1
+
+    def __call__(self, x: complex) -> complex:
+        return sum(
+            c * x ** (self.min_degree + k) for k, c in enumerate(self.coefficients)
+        )
+
+    def to_sympy(self, x):
+        """
+        Args:
+            x: sympy symbol or expression of the variable
+
+        Returns:
+            sympy expression of the polynomial
+        """
+        return sum(
+            c * x ** (self.min_degree + k) for k, c in enumerate(self.coefficients)
+        )
+
+
+@dataclass(frozen=True)
+class TemperleyLiebBasis:
+    """
+    Diagrams of the Temperley-Lieb algebra, with the right multiplication by the generators eᵢ
+
+    A diagram is a planar matching of the points 0...n-1 on top and n...2n-1 on the bottom, partner[p] being
+    the point matched with p. Right multiplications are sparse basis matrices with one non-zero per column:
+    D.eᵢ = d^loops[i - 1, D] times the diagram targets[i - 1, D].
+
+    -n_strands: number of strands
+    -diagrams: the Catalan(n) diagrams, the first one being the identity
+    -targets: index of D.eᵢ, array of shape (n - 1, Catalan(n))
+    -loops: number of loops (0 or 1) removed in D.eᵢ, array of the same shape
+    -closure_loops: number of loops of the closure of each diagram, for the Markov trace
+    """
+
+    n_strands: StrictlyPositiveInt
+    diagrams: Tuple[Diagram, ...]
+    targets: np.ndarray
+    loops: np.ndarray
+    closure_loops: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.diagrams)
+
+
+def _identity_diagram(n: int) -> Diagram:
+    return tuple(list(range(n, 2 * n)) + list(range(n)))
+
+
+def _generator_diagram(n: int, i: int) -> Diagram:
+    """eᵢ, joining the points i - 1 and i on top and on the bottom"""
+    partner = list(_identity_diagram(n))
+    partner[i - 1], partner[i] = i, i - 1
+    partner[n + i - 1], partner[n + i] = n + i, n + i - 1
+    return tuple(partner)
+
+
+def compose_diagrams(top: Diagram, bottom: Diagram) -> Tuple[Diagram, int]:
+    """
+    Stack two diagrams, the bottom points of the first being glued to the top points of the second
+
+    Args:
+        top(Diagram): first diagram
+        bottom(Diagram): second diagram
+
+    Returns:
+        Tuple[Diagram, int]: the product and the number of closed loops
+    """
+    n = len(top) // 2
+    partner = [0] * (2 * n)
+    middle_seen = [False] * n
+    for start in range(2 * n):
+        # Free points are the top of the first diagram and the bottom of the second one
+        in_top = start < n
+        p = top[start] if in_top else bottom[start]
+        while True:
+            if in_top and p >= n:
+                middle_seen[p - n] = True
+                in_top = False
+                p = bottom[p - n]
+            elif not in_top and p < n:
+                middle_seen[p] = True
+                in_top = True
+                p = top[p + n]
+            else:
+                break
+        partner[start] = p
+    # Middle points not reached from a free point are on closed loops
+    n_loops = 0
+    for k in range(n):
+        if middle_seen[k]:
+            continue
+        n_loops += 1
+        p = k
+        while not middle_seen[p]:
+            middle_seen[p] = True
+            q = bottom[p]
+            middle_seen[q] = True
+            p = top[q + n] - n
+    return tuple(partner), n_loops
+
+
+def closure_loop_count(diagram: Diagram) -> int:
+    """
+    Number of loops of the closure of a diagram, each top point k being joined to the bottom point n + k
+
+    Args:
+        diagram(Diagram): the diagram
+
+    Returns:
+        int: the number of loops
+    """
+    n = len(diagram) // 2
+    seen = [False] * (2 * n)
+    n_loops = 0
+    for start in range(2 * n):
+        if seen[start]:
+            continue
+        n_loops += 1
+        p = start
+        while not seen[p]:
+            seen[p] = True
+            q = diagram[p]
+            seen[q] = True
+            p = q + n if q < n else q - n
+    return n_loops
+
+
+@lru_cache(maxsize=None)
+def temperley_lieb_basis(n_strands: StrictlyPositiveInt) -> TemperleyLiebBasis:
+    """
+    Build the diagrams of the Temperley-Lieb algebra and the right multiplication tables
+
+    Diagrams are enumerated in a breadth first search from the identity, since the products of the eᵢ span
+    the algebra. It costs (n - 1).Catalan(n) compositions, about 150000 for 10 strands, and is done once.
+
+    Args:
+        n_strands(StrictlyPositiveInt): number of strands
+
+    Returns:
+        TemperleyLiebBasis: the basis
+    """
+    generators = [_generator_diagram(n_strands, i) for i in range(1, n_strands)]
+    identity = _identity_diagram(n_strands)
+    index: Dict[Diagram, int] = {identity: 0}
+    diagrams: List[Diagram] = [identity]
+    targets: List[List[int]] = [[] for _ in generators]
+    loops: List[List[int]] = [[] for _ in generators]
+    k = 0
+    while k < len(diagrams):
+        for i, e in enumerate(generators):
+            product, n_loops = compose_diagrams(diagrams[k], e)
+            if product not in index:
+                index[product] = len(diagrams)
+                diagrams.append(product)
+            targets[i].append(index[product])
+            loops[i].append(n_loops)
+        k += 1
+    shape = (len(generators), len(diagrams))
+    return TemperleyLiebBasis(
+        n_strands,
+        tuple(diagrams),
+        np.array(targets, dtype=np.int64).reshape(shape),
+        np.array(loops, dtype=np.int64).reshape(shape),
+        np.array([closure_loop_count(d) for d in diagrams], dtype=np.int64),
+    )
+
+
+@lru_cache(maxsize=None)
+def _scatter_plan(
+    n_strands: StrictlyPositiveInt, i: int, n_loops: int
+) -> Tuple[Tuple[Tuple[np.ndarray, np.ndarray], ...], np.ndarray, int]:
+    """
+    Sources D with n_loops loops in D.eᵢ, in layers: the k-th layer holds the k-th source of each target having
+    more than k sources, so that contributions are summed with one gather and a few scattered additions
+
+    Returns:
+        Tuple: layers (positions in the targets, sources), targets, largest number of sources per target
+    """
+    basis = temperley_lieb_basis(n_strands)
+    sources = np.flatnonzero(basis.loops[i - 1] == n_loops)
+    targets = basis.targets[i - 1, sources]
+    order = np.argsort(targets, kind="stable")
+    sources, targets = sources[order], targets[order]
+    if not sources.size:
+        return (), sources, 0
+    starts = np.flatnonzero(np.r_[True, targets[1:] != targets[:-1]])
+    counts = np.diff(np.r_[starts, sources.size])
+    layers = []
+    for k in range(int(counts.max())):
+        positions = np.flatnonzero(counts > k)
+        layers.append((positions, sources[starts[positions] + k]))
+    return tuple(layers), targets[starts], int(counts.max())
+
+
+def _times_e(state: np.ndarray, n_strands: int, i: int, n_loops: int):
+    """Sum of the rows of state over the sources with n_loops loops, and their targets"""
+    layers, targets, _ = _scatter_plan(n_strands, i, n_loops)
+    if not layers:
+        return state[:0], targets
+    result = state[layers[0][1]]
+    for positions, sources in layers[1:]:
+        result[positions] += state[sources]
+    return result, targets
+
+
+def _carry(buffer: np.ndarray, first: int, last: int) -> np.ndarray:
+    """
+    Propagate the carries of the columns first to last, so that all limbs but the last are in [0, 2^b[ and the
+    last one, which holds the sign, is below 2^(b + 1) in absolute value, b being TEMPERLEY_LIEB_LIMB_BITS.
+    A limb is added if needed.
+
+    Returns:
+        np.ndarray: the buffer, reallocated only if a limb was added
+    """
+    window = buffer[:, first : last + 1]
+    top = window[..., -1]
+    if max(top.max(), -top.min()) >> TEMPERLEY_LIEB_LIMB_BITS:
+        buffer = np.concatenate([buffer, np.zeros_like(buffer[..., :1])], axis=-1)
+        window = buffer[:, first : last + 1]
+    mask = (1 << TEMPERLEY_LIEB_LIMB_BITS) - 1
+    for j in range(buffer.shape[-1] - 1):
+        window[..., j + 1] += window[..., j] >> TEMPERLEY_LIEB_LIMB_BITS
+        window[..., j] &= mask
+    return buffer
+
+
+def _closure_degrees(generators: Sequence[int]) -> Tuple[List[int], int]:
+    generators = [int(g) for g in generators if g != 0]
+    return generators, sum(1 if g > 0 else -1 for g in generators)
+
+
+def kauffman_bracket(
+    generators: Sequence[int], n_strands: StrictlyPositiveInt
+) -> LaurentPolynomial:
+    """
+    Kauffman bracket of the closure of a braid, normalized so that the unknot is 1
+
+    The braid is mapped to the Temperley-Lieb algebra with σᵢ = A + A⁻¹eᵢ and σᵢ⁻¹ = A⁻¹ + Aeᵢ, d = -A² - A⁻².
+    The element is a matrix of Laurent coefficients with one row per diagram. All its exponents of A have the
+    parity of the number of generators applied, so columns are powers of u = A², an overall A⁻ᵏ factor being kept
+    aside. The matrix is allocated once and updated in place in a moving window of columns: a generator costs a
+    gather of the rows and three scattered additions, and the bracket is the Markov trace
+    Σ P_D.d^(loops(closure of D) - 1). Large coefficients are split in int64 limbs rather than Python integers.
+
+    Args:
+        generators(Sequence[int]): signed Artin generators
+        n_strands(StrictlyPositiveInt): number of strands
+
+    Returns:
+        LaurentPolynomial: the bracket, in the variable A
+    """
+    generators, _ = _closure_degrees(generators)
+    if any(abs(g) >= n_strands for g in generators):
+        raise ValueError(f"Generator index out of bounds for {n_strands} strands")
+    basis = temperley_lieb_basis(n_strands)
+    # A generator multiplies by u^-1, 1 or u (g > 0) or by 1, u or u² (g < 0): the degrees stay in a window of
+    # 2k + 1 columns, allocated once. buffer[D, j, l] is the limb l of the coefficient of A⁻ᵏ.u^(j - offset).D after
+    # k generators, the current state being in columns first to last
+    n_positive = sum(1 for g in generators if g > 0)
+    buffer = np.zeros((len(basis), 2 * len(generators) + 1, 1), dtype=np.int64)
+    first = last = offset = 2 * n_positive
+    buffer[0, first, 0] = 1
+    # Upper bound of the absolute values of the limbs, checked only when a step could overflow
+    bound = 1
+    for g in generators:
+        i = abs(g)
+        # An entry receives itself, the sources without loop and twice the sources with a loop
+        growth = (
+            1
+            + _scatter_plan(n_strands, i, 0)[2]
+            + 2 * _scatter_plan(n_strands, i, 1)[2]
+        )
+        if bound * growth >= TEMPERLEY_LIEB_INT64_BOUND:
+            state = buffer[:, first : last + 1]
+            bound = int(max(state.max(), -state.min()))
+            if bound * growth >= TEMPERLEY_LIEB_INT64_BOUND:
+                buffer = _carry(buffer, first, last)
+                state = buffer[:, first : last + 1]
+                bound = int(max(state.max(), -state.min()))
+        state = buffer[:, first : last + 1]
+        times_e, targets = _times_e(state, n_strands, i, 0)
+        times_e_loop, targets_loop = _times_e(state, n_strands, i, 1)
+        # Degree shifts relative to the state, the term A.x (g > 0) or A⁻¹.x (g < 0) staying in place
+        if g > 0:
+            # A.x = A⁻⁽ᵏ⁺¹⁾.u.x and A⁻¹.x.eᵢ = A⁻⁽ᵏ⁺¹⁾.x.eᵢ, with d = -(u + u⁻¹): u.x is x with offset - 1
+            offset -= 1
+            shifts = (-1, 0, -2)
+        else:
+            shifts = (1, 2, 0)
+        low, high = first + min(shifts), last + max(shifts)
+        buffer[targets, first + shifts[0] : last + shifts[0] + 1] += times_e
+        buffer[targets_loop, first + shifts[1] : last + shifts[1] + 1] -= times_e_loop
+        buffer[targets_loop, first + shifts[2] : last + shifts[2] + 1] -= times_e_loop
+        first, last = min(first, low), max(last, high)
+        bound *= growth
+        # Only the edge columns may have become zero
+        while first <= last and not buffer[:, first].any():
+            first += 1
+        while last > first and not buffer[:, last].any():
+            last -= 1
+        if first > last:
+            return LaurentPolynomial(())
+    # With limbs below 2^TEMPERLEY_LIEB_LIMB_BITS, sums over the diagrams cannot overflow
+    buffer = _carry(buffer, first, last)
+    state = buffer[:, first : last + 1]
+    low = first - offset
+
+    # Markov trace, d^m being expanded with binomial coefficients
+    width = state.shape[1] + 2 * n_strands
+    trace = np.zeros(width, dtype=object)
+    limbs = [1 << (TEMPERLEY_LIEB_LIMB_BITS * j) for j in range(state.shape[-1])]
+    for m in np.unique(basis.closure_loops):
+        rows = state[basis.closure_loops == m].sum(axis=0).astype(object) @ limbs
+        power = m - 1
+        # d^power = (-1)^power Σ C(power, j) u^(power - 2j)
+        binomial = 1
+        for j in range(power + 1):
+            shift = n_strands + power - 2 * j
+            trace[shift : shift + state.shape[1]] += (-1) ** power * binomial * rows
+            binomial = binomial * (power - j) // (j + 1)
+    # Column c has degree u^(low - n_strands + c) = A^(2(low - n_strands + c) - k)
+    coefficients = np.zeros(2 * width - 1, dtype=trace.dtype)
+    coefficients[::2] = trace
+    return LaurentPolynomial.from_array(
+        coefficients, 2 * (low - n_strands) - len(generators)
+    )
+
+
+def jones_polynomial(
+    generators: Sequence[int], n_strands: StrictlyPositiveInt
+) -> LaurentPolynomial:
+    """
+    Jones polynomial of the closure of a braid, V(t) = (-A³)^(-writhe).<closure> with A = t^(-1/4)
+
+    Exponents of t are half integers for links with an even number of components, so the polynomial is given in
+    the variable s = t^(1/2): the trefoil σ₁³ gives s² + s⁶ - s⁸, ie t + t³ - t⁴.
+
+    Args:
+        generators(Sequence[int]): signed Artin generators
+        n_strands(StrictlyPositiveInt): number of strands
+
+    Returns:
+        LaurentPolynomial: the polynomial, in the variable t^(1/2)
+    """
+    generators, writhe = _closure_degrees(generators)
+    bracket = kauffman_bracket(generators, n_strands)
+    if not bracket.coefficients:
+        return bracket
+    sign = -1 if writhe % 2 else 1
+    # A^e becomes A^(e - 3 writhe) = s^((3 writhe - e) / 2), exponents of A being even
+    coefficients = [sign * c for c in reversed(bracket.coefficients)]
+    return LaurentPolynomial(
+        tuple(coefficients[::2]), (3 * writhe - bracket.max_degree) // 2
+    )
+
+
+def evaluate_jones_polynomial(
+    generators: Sequence[int], n_strands: StrictlyPositiveInt, t: complex
+) -> complex:
+    """
+    Numerical value of the Jones polynomial at t, without computing its coefficients
+
+    The same sparse updates are applied to a single complex value per diagram, with A = t^(-1/4) on the
+    principal branch, consistent with t^(1/2) = A⁻² for the half integer exponents of jones_polynomial.
+
+    Args:
+        generators(Sequence[int]): signed Artin generators
+        n_strands(StrictlyPositiveInt): number of strands
+        t(complex): evaluation point, non zero
+
+    Returns:
+        complex: V(t)
+    """
+    generators, writhe = _closure_degrees(generators)
+    if any(abs(g) >= n_strands for g in generators):
+        raise ValueError(f"Generator index out of bounds for {n_strands} strands")
+    basis = temperley_lieb_basis(n_strands)
+    a = complex(t) ** -0.25
+    d = -(a**2) - a**-2
+    state = np.zeros(len(basis), dtype=complex)
+    state[0] = 1
+    for g in generators:
+        i = abs(g)
+        x, y = (a, 1 / a) if g > 0 else (1 / a, a)
+        new = x * state
+        for n_loops, factor in ((0, y), (1, y * d)):
+            times_e, targets = _times_e(state, n_strands, i, n_loops)
+            new[targets] += factor * times_e
+        state = new
+    bracket = np.sum(state * d ** (basis.closure_loops - 1.0))
+    return complex((-(a**3)) ** -writhe * bracket)
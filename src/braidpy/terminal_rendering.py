@@ -0,0 +1,146 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at https://mozilla.org/MPL/2.0/.
+
+"""
+Filename: terminal_rendering.py
+Description: Streaming rendering of braids in the terminal
+Authors: Baptiste Labat
+Created: 2026-10-19
+Repository: https://github.com/baptistelabat/braidpy
+License: Mozilla Public License 2.0
+"""
+
+import sys
+from functools import lru_cache
+from typing import Iterable, List, Optional, TextIO, Tuple
+
+from braidpy.utils import PositiveInt, StrictlyPositiveInt, colorize
+
+
+@lru_cache(maxsize=None)
+def strand_glyphs(
+    n_strands: StrictlyPositiveInt,
+) -> Tuple[Tuple[str, ...], Tuple[str, ...], Tuple[str, ...]]:
+    """
+    Colored glyphs of the strands and of the crossings, computed once per number of strands
+
+    Args:
+        n_strands(StrictlyPositiveInt): number of strands
+
+    Returns:
+        Tuple[Tuple[str, ...], Tuple[str, ...], Tuple[str, ...]]: strand labels, positive crossings (>) and
+        negative crossings (<), indexed by strand number minus one
+    """
+    labels = tuple(colorize(k) for k in range(1, n_strands + 1))
+    over = tuple(colorize(">", k) for k in range(n_strands))
+    under = tuple(colorize("<", k) for k in range(n_strands))
+    return labels, over, under
+
+
+class TerminalRenderer:
+    def __init__(
+        self,
+        n_strands: StrictlyPositiveInt,
+        stream: Optional[TextIO] = None,
+        chunk_lines: StrictlyPositiveInt = 4096,
+    ) -> None:
+        """
+        Render a braid in the terminal, one line per generator, the strands being colored by their number
+
+        Lines are written to the stream by chunks, and only the current positions of the strands are kept in memory,
+        so that huge braids can be rendered without building the whole permutation history.
+
+        Args:
+            n_strands(StrictlyPositiveInt): number of strands
+            stream(Optional(TextIO)): where to write. Default to sys.stdout at rendering time
+            chunk_lines(Optional(StrictlyPositiveInt)): number of lines written at once. Default to 4096
+        """
+        self.n_strands = StrictlyPositiveInt(n_strands)
+        self.stream = stream
+        self.chunk_lines = StrictlyPositiveInt(chunk_lines)
+        self.labels, self.over, self.under = strand_glyphs(self.n_strands)
+
+    def lines(
+        self,
+        generators: Iterable[int],
+        start: PositiveInt = 0,
+        stop: Optional[PositiveInt] = None,
+        step: StrictlyPositiveInt = 1,
+    ) -> Iterable[str]:
+        """
+        Generate the lines of the drawing
+
+        The first line shows the strands before generator start, and the last line after generator stop.
+        Generators before start are applied without being drawn, and with step > 1 only one generator out of step
+        is drawn (a decimated overview), but all of them are applied.
+
+        Args:
+            generators(Iterable[int]): signed Artin generators
+            start(Optional(PositiveInt)): index of the first generator drawn. Default to 0
+            stop(Optional(PositiveInt)): index after the last generator drawn. Default to None (until the end)
+            step(Optional(StrictlyPositiveInt)): draw one generator out of step. Default to 1
+
+        Returns:
+            Iterable[str]: the lines, without line feed
+        """
+        strands = list(range(self.n_strands))
+        glyphs = list(self.labels)
+        labels, over, under = self.labels, self.over, self.under
+
+        started = start == 0
+        if started:
+            yield " ".join(glyphs)
+        for k, gen in enumerate(generators):
+            if stop is not None and k >= stop:
+                break
+            if not started and k >= start:
+                started = True
+                yield " ".join(glyphs)
+            if started and (k - start) % step == 0:
+                if gen == 0:
+                    yield " ".join(glyphs)
+                else:
+                    i = abs(gen) - 1
+                    arrow = over[strands[i]] if gen > 0 else under[strands[i + 1]]
+                    yield " ".join(glyphs[: i + 1]) + arrow + " ".join(glyphs[i + 1 :])
+            if gen != 0:
+                i = abs(gen) - 1
+                strands[i], strands[i + 1] = strands[i + 1], strands[i]
+                glyphs[i], glyphs[i + 1] = labels[strands[i]], labels[strands[i + 1]]
+        if not started:
+            yield " ".join(glyphs)
+        yield " ".join(glyphs)
+
+    def render(
+        self,
+        generators: Iterable[int],
+        start: PositiveInt = 0,
+        stop: Optional[PositiveInt] = None,
+        step: StrictlyPositiveInt = 1,
+    ) -> PositiveInt:
+        """
+        Write the drawing to the stream
+
+        Args:
+            generators(Iterable[int]): signed Artin generators
+            start(Optional(PositiveInt)): index of the first generator drawn. Default to 0
+            stop(Optional(PositiveInt)): index after the last generator drawn. Default to None (until the end)
+            step(Optional(StrictlyPositiveInt)): draw one generator out of step. Default to 1
+
+        Returns:
+            PositiveInt: the number of lines written
+        """
+        stream = self.stream if self.stream is not None else sys.stdout
+        buffer: List[str] = []
+        n_lines = 0
+        for line in self.lines(generators, start, stop, step):
+            buffer.append(line)
+            if len(buffer) >= self.chunk_lines:
+                stream.write("\n".join(buffer) + "\n")
+                n_lines += len(buffer)
+                buffer.clear()
+        if buffer:
+            stream.write("\n".join(buffer) + "\n")
+            n_lines += len(buffer)
+        return PositiveInt(n_lines)
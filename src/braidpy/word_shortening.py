@@ -0,0 +1,377 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at https://mozilla.org/MPL/2.0/.
+
+"""
+Filename: word_shortening.py
+Description: Search for shorter words representing the same braid
+Authors: Baptiste Labat
+Created: 2026-10-19
+Repository: https://github.com/baptistelabat/braidpy
+License: Mozilla Public License 2.0
+"""
+
+import time
+from dataclasses import dataclass, field
+from enum import Enum
+from functools import lru_cache
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import math_braid
+
+from braidpy.braid import Braid, SignedCrossingIndex
+from braidpy.utils import PositiveInt, StrictlyPositiveInt
+
+Word = Tuple[SignedCrossingIndex, ...]
+
+
+class ShorteningStage(str, Enum):
+    """
+    Stages of the shortening pipeline
+        -free_reduction: cancel σᵢσᵢ⁻¹ and zeros
+        -relations: cancel across commuting generators, and apply braid relations creating a cancellation
+        -local_search: replace windows of the word by the shortest equivalent word of a precomputed table
+        -check: compare the result with the original braid, using the canonical form for short enough words
+    """
+
+    FREE_REDUCTION = "FREE_REDUCTION"
+    RELATIONS = "RELATIONS"
+    LOCAL_SEARCH = "LOCAL_SEARCH"
+    CHECK = "CHECK"
+
+
+@dataclass
+class ShorteningResults:
+    """
+    Outcome of the shortening pipeline
+
+    Attributes:
+        braid (Braid): the shortened braid, equivalent to the original one
+        original_length (int): length of the original word
+        stage_lengths (Dict[ShorteningStage, int]): length of the word after each stage
+        table_size (int): number of canonical forms in the table of shortest words
+        n_replacements (int): number of windows replaced during local search
+        timed_out (bool): True if the time budget stopped the search
+        verified (bool): True if the final check succeeded (otherwise the freely reduced word is returned)
+        exact_check (bool): True if the final check used the canonical form, False if it used the Burau fingerprint
+        elapsed (float): computation time in seconds
+    """
+
+    braid: Braid
+    original_length: PositiveInt
+    stage_lengths: Dict[ShorteningStage, int] = field(default_factory=dict)
+    table_size: int = 0
+    n_replacements: int = 0
+    timed_out: bool = False
+    verified: bool = False
+    exact_check: bool = False
+    elapsed: float = 0.0
+
+    @property
+    def saved(self) -> int:
+        """
+        Number of crossings saved
+
+        Returns:
+            int: original length minus final length
+        """
+        return self.original_length - len(self.braid)
+
+
+def _canonical_key(word: Sequence[SignedCrossingIndex], n_strands: int) -> tuple:
+    """
+    Key of the left normal form of a word, computed directly with math_braid
+
+    Args:
+        word(Sequence[SignedCrossingIndex]): signed Artin generators without zero
+        n_strands(int): number of strands
+
+    Returns:
+        tuple: (power of δ, permutations of the simple elements)
+    """
+    if not word:
+        return (0, ())
+    b = math_braid.Braid(list(word), n_strands)
+    b.cleanUpFactors()
+    return (b.p, tuple(tuple(a.array_form) for a in b.a))
+
+
+def _free_reduce(word: Sequence[SignedCrossingIndex]) -> List[SignedCrossingIndex]:
+    reduced: List[SignedCrossingIndex] = []
+    for g in word:
+        if g == 0:
+            continue
+        if reduced and reduced[-1] == -g:
+            reduced.pop()
+        else:
+            reduced.append(g)
+    return reduced
+
+
+def _commutation_reduce(
+    word: Sequence[SignedCrossingIndex], look_back: PositiveInt
+) -> List[SignedCrossingIndex]:
+    """
+    Cancel σᵢ^e with a previous σᵢ^-e when all generators between commute with σᵢ (|i - j| >= 2)
+
+    Args:
+        word(Sequence[SignedCrossingIndex]): signed Artin generators
+        look_back(PositiveInt): maximum number of commuting generators skipped
+
+    Returns:
+        List[SignedCrossingIndex]: the reduced word
+    """
+    reduced: List[SignedCrossingIndex] = []
+    for g in word:
+        if g == 0:
+            continue
+        cancelled = False
+        for k in range(len(reduced) - 1, max(len(reduced) - 1 - look_back, -1), -1):
+            h = reduced[k]
+            if h == -g:
+                del reduced[k]
+                cancelled = True
+                break
+            if abs(abs(h) - abs(g)) < 2:
+                break
+        if not cancelled:
+            reduced.append(g)
+    return reduced
+
+
+def _relation_alternative(
+    a: SignedCrossingIndex, b: SignedCrossingIndex, c: SignedCrossingIndex
+) -> Optional[Word]:
+    """
+    Other side of a braid relation of length 3, if a, b, c is one side of it
+
+    σᵢσⱼσᵢ = σⱼσᵢσⱼ, σᵢ⁻¹σⱼ⁻¹σᵢ⁻¹ = σⱼ⁻¹σᵢ⁻¹σⱼ⁻¹ and σᵢ^eσⱼ^fσᵢ^-e = σⱼ^-eσᵢ^fσⱼ^e for |i - j| = 1
+
+    Args:
+        a(SignedCrossingIndex): first generator
+        b(SignedCrossingIndex): second generator
+        c(SignedCrossingIndex): third generator
+
+    Returns:
+        Optional[Word]: the equivalent word of length 3, or None
+    """
+    if abs(abs(a) - abs(b)) != 1 or abs(a) != abs(c):
+        return None
+    if a == c and (a > 0) == (b > 0):
+        return (b, a, b)
+    if a == -c:
+        e = 1 if a > 0 else -1
+        f = 1 if b > 0 else -1
+        return (-e * abs(b), f * abs(a), e * abs(b))
+    return None
+
+
+def _relation_reduce(
+    word: List[SignedCrossingIndex], look_back: PositiveInt, deadline: float
+) -> List[SignedCrossingIndex]:
+    """
+    Apply braid relations when the rewritten side cancels with a neighbour, then cancel across commuting generators
+
+    Args:
+        word(List[SignedCrossingIndex]): freely reduced word
+        look_back(PositiveInt): maximum number of commuting generators skipped when cancelling
+        deadline(float): time.perf_counter() value after which the rewriting stops
+
+    Returns:
+        List[SignedCrossingIndex]: a word not longer than the input
+    """
+    word = _commutation_reduce(word, look_back)
+    changed = True
+    while changed and time.perf_counter() < deadline:
+        changed = False
+        i = 0
+        while i + 2 < len(word):
+            alt = _relation_alternative(word[i], word[i + 1], word[i + 2])
+            if alt is not None and (
+                (i > 0 and word[i - 1] == -alt[0])
+                or (i + 3 < len(word) and word[i + 3] == -alt[2])
+            ):
+                word[i : i + 3] = alt
+                word = _commutation_reduce(word, look_back)
+                changed = True
+                i = max(i - 3, 0)
+                continue
+            i += 1
+    return word
+
+
+def default_table_depth(
+    n_strands: StrictlyPositiveInt, max_table_words: StrictlyPositiveInt = 20_000
+) -> PositiveInt:
+    """
+    Largest length such that all words of this length can be enumerated within the budget
+
+    Args:
+        n_strands(StrictlyPositiveInt): number of strands
+        max_table_words(Optional(StrictlyPositiveInt)): maximum number of words of the last level. Default to 20 000
+
+    Returns:
+        PositiveInt: the depth of the table of shortest words
+    """
+    n_generators = 2 * (n_strands - 1)
+    if n_generators == 0:
+        return PositiveInt(0)
+    depth = 0
+    while n_generators ** (depth + 1) <= max_table_words:
+        depth += 1
+    return PositiveInt(depth)
+
+
+@lru_cache(maxsize=16)
+def shortest_words_table(
+    n_strands: StrictlyPositiveInt,
+    depth: PositiveInt,
+    max_size: StrictlyPositiveInt = 100_000,
+) -> Dict[tuple, Word]:
+    """
+    Shortest word of each braid of length at most depth, keyed by canonical form
+
+    Words are enumerated in breadth first order, so the first word found for a canonical form is a shortest one.
+    Only the words found first are extended at the next level. The table is cached per arguments.
+
+    Args:
+        n_strands(StrictlyPositiveInt): number of strands
+        depth(PositiveInt): maximum word length
+        max_size(Optional(StrictlyPositiveInt)): maximum number of entries. Default to 100 000
+
+    Returns:
+        Dict[tuple, Word]: the shortest words
+    """
+    generators = [g for i in range(1, n_strands) for g in (i, -i)]
+    table: Dict[tuple, Word] = {_canonical_key((), n_strands): ()}
+    level: List[Word] = [()]
+    for _ in range(depth):
+        next_level = []
+        for word in level:
+            for g in generators:
+                if word and word[-1] == -g:
+                    continue
+                candidate = word + (g,)
+                key = _canonical_key(candidate, n_strands)
+                if key in table:
+                    continue
+                table[key] = candidate
+                next_level.append(candidate)
+                if len(table) >= max_size:
+                    return table
+        level = next_level
+    return table
+
+
+def _local_search(
+    word: List[SignedCrossingIndex],
+    n_strands: int,
+    table: Dict[tuple, Word],
+    depth: PositiveInt,
+    window: PositiveInt,
+    look_back: PositiveInt,
+    memo: Dict[Word, Optional[Word]],
+    max_memo_size: int,
+    deadline: float,
+) -> Tuple[List[SignedCrossingIndex], int, bool]:
+    """
+    Replace windows longer than depth by a shorter word of the table when they have the same canonical form
+
+    Returns:
+        Tuple[List[SignedCrossingIndex], int, bool]: the word, the number of replacements, True if timed out
+    """
+    n_replacements = 0
+    improved = True
+    while improved:
+        improved = False
+        for size in range(depth + 1, depth + window + 1):
+            i = 0
+            while i + size <= len(word):
+                if time.perf_counter() > deadline:
+                    return word, n_replacements, True
+                segment = tuple(word[i : i + size])
+                if segment in memo:
+                    shorter = memo[segment]
+                else:
+                    shorter = table.get(_canonical_key(segment, n_strands))
+                    if len(memo) < max_memo_size:
+                        memo[segment] = shorter
+                if shorter is not None:
+                    word[i : i + size] = shorter
+                    word = _relation_reduce(word, look_back, deadline)
+                    n_replacements += 1
+                    improved = True
+                    i = max(i - size, 0)
+                    continue
+                i += 1
+    return word, n_replacements, False
+
+
+def shorten(
+    braid: Braid,
+    table_depth: Optional[PositiveInt] = None,
+    window: PositiveInt = 2,
+    look_back: PositiveInt = 32,
+    max_memo_size: StrictlyPositiveInt = 100_000,
+    time_out_s: float = 5.0,
+    max_exact_check_length: PositiveInt = 500,
+) -> ShorteningResults:
+    """
+    Search for a shorter word representing the same braid
+
+    The pipeline has four stages:
+        1. free reduction
+        2. braid relation rewriting (cancellation across commuting generators, and relations creating a cancellation)
+        3. bounded local search, replacing windows of the word by shortest words of the same canonical form
+        4. check of the result against the canonical form of the original braid
+
+    The cost of the local search is linear in the word length: each window needs one canonical form
+    of a short word, and windows already met are memoized.
+    Every rewriting is exact, so the final check is only a safeguard. As the canonical form of a long word
+    is costly (quadratic in length), longer words are checked with the Burau fingerprint instead.
+
+    Args:
+        braid(Braid): the braid to shorten
+        table_depth(Optional(PositiveInt)): length of the words in the table of shortest words.
+            Default to the largest depth enumerable within 20 000 words
+        window(Optional(PositiveInt)): windows of length table_depth+1 to table_depth+window are searched. Default to 2
+        look_back(Optional(PositiveInt)): maximum number of commuting generators skipped when cancelling. Default to 32
+        max_memo_size(Optional(StrictlyPositiveInt)): maximum number of entries of the table and of the window memo.
+            Default to 100 000
+        time_out_s(Optional(float)): time budget of stages 2 and 3, in seconds. Default to 5
+        max_exact_check_length(Optional(PositiveInt)): longest original word checked with the canonical form.
+            Default to 500
+
+    Returns:
+        ShorteningResults: the shortened braid with statistics
+    """
+    start = time.perf_counter()
+    deadline = start + time_out_s
+    n = braid.n_strands
+    results = ShorteningResults(braid=braid, original_length=len(braid))
+
+    reduced = _free_reduce(braid.generators)
+    results.stage_lengths[ShorteningStage.FREE_REDUCTION] = len(reduced)
+
+    word = _relation_reduce(list(reduced), look_back, deadline)
+    results.stage_lengths[ShorteningStage.RELATIONS] = len(word)
+
+    depth = default_table_depth(n) if table_depth is None else table_depth
+    table = shortest_words_table(n, depth, max_memo_size)
+    results.table_size = len(table)
+    word, results.n_replacements, results.timed_out = _local_search(
+        word, n, table, depth, window, look_back, {}, max_memo_size, deadline
+    )
+    results.timed_out = results.timed_out or time.perf_counter() > deadline
+    results.stage_lengths[ShorteningStage.LOCAL_SEARCH] = len(word)
+
+    shortened = Braid(word, n)
+    results.exact_check = len(reduced) <= max_exact_check_length
+    if results.exact_check:
+        results.verified = _canonical_key(word, n) == _canonical_key(reduced, n)
+    else:
+        results.verified = shortened.fingerprint() == braid.fingerprint()
+    results.braid = shortened if results.verified else Braid(reduced, n)
+    results.stage_lengths[ShorteningStage.CHECK] = len(results.braid)
+    results.elapsed = time.perf_counter() - start
+    return results
@@ -1,7 +1,7 @@
 from braidpy import Braid
 from braidpy.braid_catalog import square4
-from braidpy.braidword import braidword_alpha_to_numeric
 from braidpy.handles_reduction import dehornoy_reduce_core
+from braidpy.kumihimo import KumihimoDisk, MoveProgram, program_braid
 
 # We started from a kuhimino like braid
 # We have 4 strands
@@ -22,17 +22,13 @@ from braidpy.handles_reduction import dehornoy_reduce_core
 # kuhimino
 
 
-top_bottom_right = "Aba"
-left_right_right = "Bcb"
-top_bottom_left = "ABa"
-left_right_left = "BCb"
+# Crossings of slot pairs, sign 1 to the right ("Aba", "Bcb") and -1 to the left ("ABa", "BCb")
+program = MoveProgram(4, (((1, 3, 1),), ((2, 4, 1),), ((1, 3, -1),), ((2, 4, -1),)))
+b = program_braid(program)
 
-b_top_bottom_right = Braid(braidword_alpha_to_numeric(top_bottom_right), n_strands=4)
-b_left_right_right = Braid(braidword_alpha_to_numeric(left_right_right), n_strands=4)
-b_top_bottom_left = Braid(braidword_alpha_to_numeric(top_bottom_left), n_strands=4)
-b_left_right_left = Braid(braidword_alpha_to_numeric(left_right_left), n_strands=4)
-
-b = b_top_bottom_right * b_left_right_right * b_top_bottom_left * b_left_right_left
+# Where the strands are after many rounds
+disk = KumihimoDisk.full(4)
+print(disk.run(program, 1000))
 
 b.draw()
 b_reduced = Braid(dehornoy_reduce_core(b.generators).generators, n_strands=4)
@@ -0,0 +1,54 @@
+import pytest
+
+from braidpy import Braid
+from braidpy.annulus_braid import AnnulusBraid, deduplicate_rotations
+from braidpy.random import random_words
+
+
+def test_rotation_relations():
+    n = 4
+    # τσᵢτ⁻¹ = σᵢ₊₁, indices modulo n
+    assert AnnulusBraid.from_letters(["t", 2, "T"], n) == AnnulusBraid([3], n)
+    assert AnnulusBraid.from_letters(["t", 4, "T"], n) == AnnulusBraid([1], n)
+    # τⁿ is the full twist of the flat braid
+    tau_n = AnnulusBraid.from_letters(["t"] * n, n)
+    assert tau_n.to_braid() == Braid([1, 2, 3, 4] * 5, 5)
+    assert AnnulusBraid([1, 2], n) != AnnulusBraid([2, 1], n)
+    with pytest.raises(ValueError):
+        AnnulusBraid([5], n)
+
+
+def test_flat_conversion():
+    b = AnnulusBraid.from_letters([1, "t", -3, 4, "T", "T", 2], 4)
+    flat = b.to_braid()
+    assert flat.n_strands == 5
+    assert flat.perm()[0] == 1
+    assert AnnulusBraid.from_braid(flat) == b
+    assert [p - 1 for p in flat.perm()[1:]] == b.permutation()
+
+    for braid in random_words(100, (0, 12), 5, seed=2):
+        if braid.perm()[0] == 1:
+            assert AnnulusBraid.from_braid(braid).to_braid() == braid
+    with pytest.raises(ValueError):
+        AnnulusBraid.from_braid(Braid([1], 3))
+
+
+def test_products_and_powers():
+    a = AnnulusBraid.from_letters([1, "t", -2, 3], 3)
+    b = AnnulusBraid.from_letters(["T", 2, 2], 3)
+    assert (a * b).to_braid() == a.to_braid() * b.to_braid()
+    assert (a**3).to_braid() == a.to_braid() ** 3
+    assert (a * a.inverse()).to_braid() == Braid([], 4)
+    assert a.permutation(3) == (a**3).permutation()
+    assert a.permutation(-2) == (a**-2).permutation()
+
+
+def test_rotation_normal_form():
+    a = AnnulusBraid.from_letters([1, -2, 5, "t", 3], 5)
+    rotations = [a.rotate(s) for s in range(5)]
+    forms = {r.rotation_normal_form()[0].key() for r in rotations}
+    assert len(forms) == 1
+    normal, shift = a.rotation_normal_form()
+    assert normal.word_eq(a.rotate(shift))
+    assert deduplicate_rotations(rotations + [a * a]) == [a, a * a]
+    assert {r.invariants() for r in rotations} == {a.invariants()}
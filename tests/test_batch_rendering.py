@@ -0,0 +1,53 @@
+import matplotlib.image as mpimg
+
+from braidpy import Braid
+from braidpy.batch_rendering import (
+    RenderOptions,
+    contact_sheet,
+    render_batch,
+    render_hash,
+)
+
+
+def test_render_hash():
+    options = RenderOptions()
+    assert render_hash(Braid([1, 2], 3), options) == render_hash(
+        Braid([1, 2], 3), options
+    )
+    assert render_hash(Braid([1, 2], 3), options) != render_hash(
+        Braid([1, -2], 3), options
+    )
+    assert render_hash(Braid([1, 2], 3), options) != render_hash(
+        Braid([1, 2], 3), RenderOptions(style="comp")
+    )
+
+
+def test_render_batch_cache(tmp_path):
+    braids = [Braid([1, 2], 3), Braid([1, 0, -2], 3), Braid([1], 2)]
+    options = RenderOptions(dpi=20)
+    results = render_batch(braids, tmp_path, options=options, n_processes=2)
+    assert results.n_rendered == 3
+    assert all(path.exists() for path in results.paths)
+    assert results.paths[1].name == "braid_00001.png"
+
+    # Only the modified braid is rendered again
+    braids[1] = Braid([1, -2], 3)
+    results = render_batch(braids, tmp_path, options=options, n_processes=1)
+    assert results.n_rendered == 1
+    assert results.n_skipped == 2
+
+
+def test_contact_sheet(tmp_path):
+    braids = [Braid([1, 2], 3), Braid([-1], 2), Braid([2, 1], 3)]
+    results = render_batch(
+        braids,
+        tmp_path,
+        names=["a", "b", "c"],
+        options=RenderOptions(dpi=10),
+        n_processes=1,
+    )
+    sheet = contact_sheet(results.paths, tmp_path / "sheet.png", columns=2, padding=2)
+    image = mpimg.imread(str(sheet))
+    height, width = mpimg.imread(str(results.paths[0])).shape[:2]
+    assert image.shape[0] == 2 * height + 2
+    assert image.shape[1] == 2 * width + 2
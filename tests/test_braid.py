@@ -326,6 +326,23 @@ class TestBraid:
         assert Braid([1, 4, 4, 1], 7) == Braid([4, -5, 1, 1, 5, 4], 7)
         assert Braid([1, 4, 4, 1], 7) != Braid([4, -5, 1, 1, 6, 4], 7)
 
-    def test_brunnian_not_implemented(self):
-        with pytest.raises(NotImplementedError):
-            Braid([]).is_brunnian()
+    def test_forget_strand(self):
+        b = Braid([1, 2, -1], 3)
+        assert b.forget_strand(1).word_eq(Braid([-1], 2))
+        assert b.forget_strand(2).word_eq(Braid([1], 2))
+        assert b.forget_strand(3).word_eq(Braid([1], 2))
+        assert [f.generators for f in b.forget_each_strand()] == [[-1], [1], [1]]
+        assert Braid([], 4).forget_strand(2) == Braid([], 3)
+        with pytest.raises(ValueError):
+            b.forget_strand(4)
+
+    def test_is_brunnian(self):
+        # Borromean rings
+        assert (Braid([1, -2], 3) ** 3).is_brunnian()
+        # Commutator of A₁₂ and A₂₃
+        assert Braid([1, 1, 2, 2, -1, -1, -2, -2], 3).is_brunnian()
+        assert Braid([], 4).is_brunnian()
+        assert not Braid([1, 1], 3).is_brunnian()
+        assert not Braid([1, 2], 3).is_brunnian()
+        # Trivial after forgetting any strand, but not pure
+        assert not Braid([1], 2).is_brunnian()
@@ -13,7 +13,14 @@ from braidpy.braid_catalog import (
     double_flat3,
     abok_2974,
     weave3,
+    catalog_braid,
+    catalog_entries,
+    catalog_entry,
+    catalog_invariants,
+    invariants_table,
+    UnknownCatalogEntry,
 )
+import pytest
 
 
 def test_slide_strand():
@@ -152,3 +159,36 @@ def test_regular_flat_braid_6():
 
 def test_double_flat3():
     b, n = double_flat3()
+
+
+def test_catalog_registry():
+    entry = catalog_entry("flat3")
+    assert entry.n_strands == 3
+    assert entry.period == 3
+    assert not entry.parametrized
+    assert catalog_entry("full_twist").parametrized
+    assert all(e.pattern == "flat" for e in catalog_entries(pattern="flat"))
+    assert {e.name for e in catalog_entries(n_strands=4)} >= {"square4", "full_twist"}
+    with pytest.raises(UnknownCatalogEntry):
+        catalog_entry("unknown")
+
+
+def test_catalog_memoization():
+    assert catalog_braid("square4") is catalog_braid("square4")
+    assert full_twist_braid(4) is full_twist_braid(4)
+    assert full_twist_braid(4) is not full_twist_braid(5)
+    assert catalog_invariants("full_twist", 4) is catalog_invariants("full_twist", 4)
+
+
+def test_invariants_table():
+    table = invariants_table()
+    assert "full_twist" not in table
+    b = catalog_braid("square4")
+    invariants = table["square4"]
+    assert list(invariants.permutation) == b.perm()
+    assert invariants.writhe == b.writhe()
+    assert invariants.is_pure == b.is_pure()
+    assert invariants.normal_form == b.get_canonical_factors()
+    assert catalog_invariants("full_twist", 4).is_pure
+    # Band generator presentation: δⁿ = ∆²
+    assert catalog_invariants("full_twist", 4).normal_form.n_half_twist == 4
@@ -0,0 +1,52 @@
+from braidpy import Braid
+from braidpy.braid_enumeration import (
+    BraidEnumerator,
+    classical_normal_form,
+    permutation_braid_tables,
+)
+
+
+def test_classical_normal_form():
+    b = Braid([1, 2, -1, 3, -2], 4)
+    assert classical_normal_form(b * Braid([2, -2, -3, 3], 4)) == classical_normal_form(
+        b
+    )
+    # Braid relation
+    assert classical_normal_form(Braid([1, 2, 1], 3)) == classical_normal_form(
+        Braid([2, 1, 2], 3)
+    )
+    assert classical_normal_form(Braid([1, 2], 3)) != classical_normal_form(
+        Braid([2, 1], 3)
+    )
+
+    tables = permutation_braid_tables(4)
+    key = classical_normal_form(b)
+    assert tables.pack(*tables.unpack(key)) == key
+    assert tables.to_braid(key) == b
+
+
+def test_count():
+    # Growth series of B3 with Artin generators
+    assert BraidEnumerator(3, 6).count() == [1, 4, 12, 30, 68, 148, 314]
+    assert BraidEnumerator(4, 3).count() == [1, 6, 26, 98]
+
+
+def test_iter():
+    braids = list(BraidEnumerator(3, 3))
+    assert len(braids) == 1 + 4 + 12 + 30
+    keys = {b.get_canonical_factors().key for b in braids}
+    assert len(keys) == len(braids)
+
+
+def test_checkpoint(tmp_path):
+    path = tmp_path / "enumeration.pkl"
+    enumerator = BraidEnumerator(3, 6, checkpoint_path=path)
+    spheres = enumerator.spheres()
+    for length, _ in spheres:
+        if length == 3:
+            break
+    # Resumed after sphere 3
+    resumed = BraidEnumerator(3, 6, checkpoint_path=path)
+    assert resumed.state.length == 3
+    assert [length for length, _ in resumed.spheres()] == [4, 5, 6]
+    assert resumed.state.counts == [1, 4, 12, 30, 68, 148, 314]
@@ -0,0 +1,44 @@
+import numpy as np
+import pytest
+
+from braidpy import Braid
+from braidpy.braid_collection import BraidCollection
+from braidpy.braid_formatting import custom_table, notation_table
+
+
+def test_notation_table():
+    table = notation_table("alpha", 4)
+    assert table.format([1, -3, 0, 2]) == "aC#b"
+    assert table.format(np.array([1, -3, 0, 2], dtype=np.int16)) == "aC#b"
+    assert table.format([]) == "#"
+    assert notation_table("default", 4).format([]) == "<>"
+    assert notation_table("artin", 4).format([-2]) == "s_{2}^{-1.0}"
+    assert notation_table("alpha", 4) is notation_table("alpha", 4)
+    with pytest.raises(NotImplementedError):
+        notation_table("blabla", 4)
+
+
+def test_chunks():
+    b = Braid([1, -2, 0, 3, -1, 2, 2], 4)
+    for target in ["alpha", "artin", "default"]:
+        chunks = b.iter_format_to_notation(target, chunk_size=3)
+        assert "".join(chunks) == b.format_to_notation(target)
+    assert "".join(Braid([], 3).iter_format_to_notation("alpha")) == "#"
+
+
+def test_custom_table():
+    table = custom_table(["x", "y"], ["X", "Y"], "1", ".")
+    assert table.format([1, -2, 0]) == "x.Y.1"
+    with pytest.raises(IndexError):
+        table.format([-3])
+    with pytest.raises(IndexError):
+        table.format([3])
+
+
+def test_format_collection():
+    braids = [Braid([1, 2, -1], 3), Braid([], 3), Braid([-2, 0], 3)]
+    collection = BraidCollection.from_braids(braids)
+    for target in ["alpha", "artin", "default"]:
+        assert collection.format_to_notation(target) == [
+            b.format_to_notation(target) for b in braids
+        ]
@@ -0,0 +1,51 @@
+import numpy as np
+
+from braidpy import Braid
+from braidpy.closure import batch_closure_analysis
+from braidpy.random import random_words
+
+
+def test_hopf_link():
+    analysis = Braid([1, 1], 2).closure_analysis()
+    assert analysis.components == [(1,), (2,)]
+    assert np.array_equal(analysis.linking_matrix, [[0, 1], [1, 0]])
+    assert np.array_equal(analysis.crossing_counts, [2, 2])
+    negative = Braid([-1, -1], 2).closure_analysis()
+    assert np.array_equal(negative.linking_matrix, [[0, -1], [-1, 0]])
+
+
+def test_chain():
+    analysis = Braid([1, 1, 2, 2, 3, 3, 3, 3], 5).closure_analysis()
+    assert analysis.components == [(1,), (2,), (3,), (4,), (5,)]
+    assert analysis.linking_matrix[0, 1] == 1
+    assert analysis.linking_matrix[1, 2] == 1
+    assert analysis.linking_matrix[2, 3] == 2
+    assert analysis.linking_matrix[0, 2] == 0
+    assert np.array_equal(analysis.crossing_counts, [2, 4, 6, 4, 0])
+
+
+def test_knots():
+    trefoil = Braid([1, 1, 1], 2).closure_analysis()
+    assert trefoil.n_components == 1
+    assert np.array_equal(trefoil.self_writhe, [3])
+    mixed = Braid([1, 2, 2, 3, 3], 4).closure_analysis()
+    assert mixed.components == [(1, 2), (3,), (4,)]
+    assert np.array_equal(mixed.linking_matrix, [[0, 1, 0], [1, 0, 1], [0, 1, 0]])
+
+
+def test_batch_matches_single():
+    collection = random_words(200, (0, 25), 5, seed=2)
+    analyses = collection.closure_analysis(chunk_size=64)
+    assert len(analyses) == len(collection)
+    for braid, analysis in zip(collection, analyses):
+        single = braid.closure_analysis()
+        assert analysis.components == single.components
+        assert np.array_equal(analysis.linking_matrix, single.linking_matrix)
+        assert np.array_equal(analysis.self_writhe, single.self_writhe)
+        assert np.array_equal(analysis.crossing_counts, single.crossing_counts)
+        assert (
+            analysis.linking_matrix.sum() + analysis.self_writhe.sum() == braid.writhe()
+        )
+    padded = batch_closure_analysis(np.array([[1, 0, 1], [0, 0, 0]]), 3)
+    assert padded[0].components == [(1,), (2,), (3,)]
+    assert padded[1].linking_matrix.sum() == 0
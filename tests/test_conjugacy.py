@@ -0,0 +1,97 @@
+import pytest
+
+from braidpy import Braid
+from braidpy.conjugacy import (
+    ConjugacyExplorer,
+    SummitSetStatistics,
+    SummitSetTooLarge,
+    is_conjugate,
+    shortest_conjugate,
+    super_summit_set,
+)
+
+
+def test_free_reduce():
+    b = Braid([1, 2, -2, 0, -1, 2, 1, -1], 3)
+    assert b.free_reduce().word_eq(Braid([2], 3))
+    assert b.free_reduce() == b
+
+
+def test_explorer_dedup():
+    b = Braid([1, 2], 3)
+    conjugates = ConjugacyExplorer(b, max_depth=2).run()
+    assert conjugates[0].word_eq(b)
+    # No two conjugates are equivalent
+    for i, c1 in enumerate(conjugates):
+        for c2 in conjugates[i + 1 :]:
+            assert not c1 == c2
+
+    fingerprint_conjugates = ConjugacyExplorer(
+        b, max_depth=2, dedup="fingerprint"
+    ).run()
+    assert len(fingerprint_conjugates) == len(conjugates)
+
+
+def test_explorer_bounds():
+    b = Braid([1, 2, -3], 4)
+    explorer = ConjugacyExplorer(b, max_depth=5, max_size=7)
+    assert len(explorer.run()) == 7
+    assert not explorer.exhausted
+
+    explorer = ConjugacyExplorer(b, max_depth=0)
+    assert len(explorer.run()) == 1
+    assert explorer.depth_reached == 0
+
+    # Streaming: stop early without exploring everything
+    stream = iter(ConjugacyExplorer(b, max_depth=10))
+    assert next(stream).word_eq(b)
+    assert next(stream).n_strands == 4
+
+
+def test_shortest_conjugate():
+    c = Braid([2, 1, 2], 3)
+    b = c * Braid([1, 1, -2], 3) * c.inverse()
+    shortest = shortest_conjugate(b, max_depth=3)
+    assert len(shortest) == 3
+    assert len(b.free_reduce()) > 3
+
+
+def test_explorer_process_pool():
+    b = Braid([1, -2, 3], 4)
+    sequential = ConjugacyExplorer(b, max_depth=2).run()
+    parallel = ConjugacyExplorer(
+        b, max_depth=2, n_processes=2, min_parallel_level_size=1
+    ).run()
+    assert [c.generators for c in parallel] == [c.generators for c in sequential]
+
+
+def test_super_summit_set():
+    b = Braid([1, 1, -2, 3], 4)
+    c = Braid([2, 1, -3, 2], 4)
+    sss = super_summit_set(b)
+    assert sss.statistics.complete
+    assert len(sss) == sss.statistics.size == 44
+    assert (sss.inf, sss.sup) == (-1, 2)
+    # Same set for any conjugate
+    conjugated = super_summit_set(c * b * c.inverse())
+    assert {e.key for e in conjugated.elements} == {e.key for e in sss.elements}
+
+    partial = super_summit_set(b, max_size=10)
+    assert not partial.statistics.complete
+    assert len(partial) == 10
+
+
+def test_is_conjugate():
+    b = Braid([1, 1, -2, 3], 4)
+    c = Braid([2, 1, -3, 2], 4)
+    statistics = SummitSetStatistics()
+    assert is_conjugate(b, c * b * c.inverse(), statistics=statistics)
+    assert statistics.n_cycling > 0
+    assert is_conjugate(Braid([1, 2], 3), Braid([2, 1], 3))
+    assert is_conjugate(Braid([1, 1, 2], 3), Braid([1, 2, 2], 3))
+    assert not is_conjugate(Braid([1, 2], 3), Braid([1, -2], 3))
+    assert not is_conjugate(Braid([1, 1, -2, -2], 3), Braid([1, -2, 1, -2], 3))
+    assert not is_conjugate(b, Braid([1, 1, 2, -3], 4))
+
+    with pytest.raises(SummitSetTooLarge):
+        is_conjugate(Braid([1, -2], 4), Braid([-3, 2], 4).inverse(), max_size=2)
@@ -0,0 +1,95 @@
+import numpy as np
+import pytest
+
+from braidpy import Braid
+from braidpy.braid import EqualityBackend
+from braidpy.braid_catalog import full_twist_braid
+from braidpy.braid_collection import BraidCollection
+from braidpy.dynnikov import (
+    batch_dynnikov_action,
+    batch_lamination_action,
+    dynnikov_action,
+    dynnikov_coordinates,
+    initial_coordinates,
+)
+from braidpy.random import random_words
+
+
+def test_relations():
+    rng = np.random.default_rng(0)
+    n_punctures = 6
+    for _ in range(20):
+        coordinates = rng.integers(-5, 6, size=2 * (n_punctures - 2))
+        for i in range(1, n_punctures - 1):
+            assert np.array_equal(
+                dynnikov_action([i, i + 1, i], n_punctures, coordinates),
+                dynnikov_action([i + 1, i, i + 1], n_punctures, coordinates),
+            )
+        for i in range(1, n_punctures):
+            assert np.array_equal(
+                dynnikov_action([i, -i], n_punctures, coordinates), coordinates
+            )
+        assert np.array_equal(
+            dynnikov_action([1, 4], n_punctures, coordinates),
+            dynnikov_action([4, 1], n_punctures, coordinates),
+        )
+
+
+def test_faithful():
+    # The full twist is central but not trivial, which is seen thanks to the extra puncture
+    b = full_twist_braid(4)
+    assert not np.array_equal(b.dynnikov_coordinates(), initial_coordinates(5))
+    assert np.array_equal(Braid([], 4).dynnikov_coordinates(), initial_coordinates(5))
+
+    a = Braid([1, 2, 1, -3], 4)
+    assert a.equals(Braid([2, 1, 2, -3], 4), backend=EqualityBackend.DYNNIKOV)
+    assert not a.equals(Braid([1, 2, -3, 2], 4), backend="DYNNIKOV")
+
+    collection = random_words(100, 8, 4, seed=1)
+    for b in collection:
+        other = Braid(b.generators + [2, 3, -2, -3, -2, 3, 2, -3], 4)
+        assert b.equals(other, backend=EqualityBackend.DYNNIKOV) == (b == other)
+
+
+def test_overflow():
+    # Pseudo-Anosov braid, whose coordinates grow exponentially
+    gens = [1, -2] * 60
+    coordinates = dynnikov_coordinates(gens, 3)
+    assert coordinates.dtype == object
+    assert max(abs(x) for x in coordinates) > 2**63
+    batch = batch_dynnikov_action(np.array([gens, [1, 0] * 60]), 4)
+    assert batch.dtype == object
+    assert list(batch[0]) == list(coordinates)
+    assert list(batch[1]) == list(dynnikov_coordinates([1] * 60, 3))
+
+
+def test_lamination_action():
+    rng = np.random.default_rng(3)
+    for n_punctures in (3, 4, 7):
+        m = n_punctures - 2
+        generators = random_words(1, 40, n_punctures - 1, seed=n_punctures)[
+            0
+        ].generators
+        coordinates = rng.integers(-4, 5, size=(6, 2 * m))
+        result = batch_lamination_action(generators, n_punctures, coordinates)
+        for row, c in zip(result, coordinates):
+            assert list(row) == list(dynnikov_action(generators, n_punctures, c))
+    # Large coordinates continue with Python integers
+    gens = [1, -2] * 60
+    result = batch_lamination_action(gens, 4, initial_coordinates(4)[None, :])
+    assert result.dtype == object
+    assert list(result[0]) == list(dynnikov_coordinates(gens, 3))
+    with pytest.raises(ValueError):
+        batch_lamination_action([3], 3, initial_coordinates(3)[None, :])
+
+
+def test_braid_collection():
+    collection = random_words(50, (0, 12), 5, seed=2)
+    coordinates = collection.dynnikov_coordinates(chunk_size=16)
+    for k, b in enumerate(collection):
+        assert np.array_equal(coordinates[k], b.dynnikov_coordinates())
+
+    with pytest.raises(ValueError):
+        batch_dynnikov_action(np.array([[3]]), 3)
+
+    assert BraidCollection.from_braids([], 3).dynnikov_coordinates().shape == (0, 4)
@@ -0,0 +1,66 @@
+import numpy as np
+import pytest
+
+from braidpy import Braid
+from braidpy.braid_catalog import full_twist_braid
+from braidpy.dynnikov import batch_dynnikov_action
+from braidpy.entropy import (
+    ThurstonType,
+    collection_topological_entropy,
+    is_finite_order,
+    topological_entropy,
+)
+from braidpy.random import random_words
+
+GOLDEN_ENTROPY = np.log((3 + np.sqrt(5)) / 2)
+
+
+def test_float_action_is_homogeneous():
+    rng = np.random.default_rng(0)
+    coordinates = rng.integers(-5, 6, size=(3, 6))
+    words = np.array([[1, -2, 3, 4], [2, 2, -1, 0], [-4, 3, 0, 0]])
+    exact = batch_dynnikov_action(words, 5, coordinates)
+    scaled = batch_dynnikov_action(words, 5, coordinates * 0.5)
+    assert scaled.dtype == np.float64
+    assert np.allclose(scaled, exact * 0.5)
+
+
+def test_entropy_of_simplest_pseudo_anosov():
+    estimate = topological_entropy(Braid([1, -2], 3))
+    assert estimate.converged
+    assert estimate.entropy == pytest.approx(GOLDEN_ENTROPY, abs=1e-5)
+    # Adding a strand which is not braided does not change the entropy
+    assert Braid([1, -2], 5).topological_entropy() == pytest.approx(
+        GOLDEN_ENTROPY, abs=1e-5
+    )
+
+
+def test_entropy_of_periodic_braids():
+    for b in [Braid([1, 2], 3), Braid([1, 2, 3], 4), full_twist_braid(4)]:
+        assert b.topological_entropy() == pytest.approx(0, abs=1e-3)
+    assert Braid([1, 1, 1], 2).topological_entropy() == 0
+
+
+def test_is_finite_order():
+    assert is_finite_order(Braid([1, 2], 3))
+    assert is_finite_order(Braid([1, 2, 3, 1], 4))
+    assert is_finite_order(Braid([-1, -2, -3], 4) ** 3)
+    assert not is_finite_order(Braid([1, 1], 3))
+    assert not is_finite_order(Braid([1, -2], 3))
+
+
+def test_thurston_type():
+    assert Braid([1, 2], 3).thurston_type() == ThurstonType.FINITE_ORDER
+    assert Braid([1, 1], 3).thurston_type() == ThurstonType.REDUCIBLE
+    assert Braid([1, 2, 1, 1, 2, 1, 3, 3], 4).thurston_type() == ThurstonType.REDUCIBLE
+    assert Braid([1, -2], 3).thurston_type() == ThurstonType.PSEUDO_ANOSOV
+    assert Braid([1, -2, 3], 4).thurston_type() == ThurstonType.PSEUDO_ANOSOV
+
+
+def test_collection_entropy():
+    collection = random_words(40, (0, 12), 4, seed=3)
+    estimates = collection_topological_entropy(collection, chunk_size=16)
+    for braid, estimate in zip(collection, estimates):
+        assert estimate == topological_entropy(braid)
+    parallel = collection_topological_entropy(collection, chunk_size=16, n_processes=2)
+    assert parallel == estimates
@@ -0,0 +1,120 @@
+import numpy as np
+import pytest
+
+from braidpy import Braid
+from braidpy.equality import (
+    DEFAULT_EQUALITY_THRESHOLDS,
+    EqualityBackend,
+    EqualityThresholds,
+    UnknownEqualityBackend,
+    braids_equal,
+    calibrate_equality_thresholds,
+    choose_equality_backend,
+    equality_backends,
+    equality_timings,
+    get_equality_thresholds,
+    is_trivial_braid,
+    pin_equality_backend,
+    pinned_equality_backend,
+    register_equality_backend,
+    unregister_equality_backend,
+    reset_equality_timings,
+    set_equality_thresholds,
+)
+from braidpy.random import random_words
+
+EXACT = [
+    EqualityBackend.GARSIDE,
+    EqualityBackend.HANDLE_REDUCTION,
+    EqualityBackend.DYNNIKOV,
+]
+
+
+@pytest.mark.parametrize("backend", EXACT + [EqualityBackend.AUTO])
+def test_backends_agree(backend):
+    collection = random_words(30, (0, 8), 4, seed=0)
+    braids = list(collection)
+    for a in braids[:10]:
+        # Equivalent words
+        b = a * Braid([1, 2, 1, -2, -1, -2], 4)
+        assert a.equals(b, backend)
+        for other in braids[10:]:
+            assert a.equals(other, backend) == a.equals(other, EqualityBackend.DYNNIKOV)
+
+
+def test_triviality():
+    for backend in EXACT:
+        assert is_trivial_braid([], 3, backend)
+        assert is_trivial_braid([1, 2, 1, -2, -1, -2], 3, backend)
+        assert not is_trivial_braid([1, 2, -1, -2], 3, backend)
+
+
+def test_prefilters_cannot_decide():
+    assert len(equality_backends(exact=False)) == 2
+    with pytest.raises(ValueError):
+        braids_equal([1], [2], 3, EqualityBackend.FINGERPRINT)
+    with pytest.raises(UnknownEqualityBackend):
+        braids_equal([1], [2], 3, "UNKNOWN")
+
+
+def test_timings_and_pinning():
+    reset_equality_timings()
+    assert Braid([1, 2], 3) != Braid([2, 1], 3)
+    assert Braid([1, 2, 1], 3) == Braid([2, 1, 2], 3)
+    timings = equality_timings()
+    assert timings["INVARIANTS"].n_calls == 2
+    assert timings["DYNNIKOV"].n_calls == 1
+
+    reset_equality_timings()
+    with pinned_equality_backend(EqualityBackend.GARSIDE):
+        assert Braid([1, 2, 1], 3) == Braid([2, 1, 2], 3)
+    assert Braid([1, 2, 1], 3) == Braid([2, 1, 2], 3)
+    timings = equality_timings()
+    assert timings["GARSIDE"].n_calls == 1
+    assert timings["DYNNIKOV"].n_calls == 1
+    with pytest.raises(ValueError):
+        pin_equality_backend(EqualityBackend.INVARIANTS)
+
+
+def test_custom_backend():
+    calls = []
+
+    @register_equality_backend("test_backend")
+    def decide(a, b, n):
+        calls.append((a, b))
+        return braids_equal(a, b, n, EqualityBackend.DYNNIKOV)
+
+    try:
+        assert Braid([1, 3], 4).equals(Braid([3, 1], 4), "test_backend")
+        assert calls == [([1, 3], [3, 1])]
+        with pytest.raises(ValueError):
+            register_equality_backend("test_backend")(decide)
+        with pinned_equality_backend("test_backend"):
+            with pytest.raises(ValueError):
+                unregister_equality_backend("test_backend")
+    finally:
+        unregister_equality_backend("test_backend")
+    assert "test_backend" not in [b.name for b in equality_backends()]
+    assert "test_backend" not in equality_timings()
+    with pytest.raises(UnknownEqualityBackend):
+        unregister_equality_backend("test_backend")
+
+
+def test_thresholds():
+    assert choose_equality_backend(2, 12) == "HANDLE_REDUCTION"
+    assert choose_equality_backend(10**6, 100) == "DYNNIKOV"
+    thresholds = calibrate_equality_thresholds(
+        n_strands=(3,), lengths=(4, 8), n_samples=1, seed=0
+    )
+    assert isinstance(thresholds, EqualityThresholds)
+    assert np.shape(thresholds.backends) == (1, 2)
+    try:
+        set_equality_thresholds(
+            EqualityThresholds((3,), (4,), (("GARSIDE",),), prefilters=())
+        )
+        assert get_equality_thresholds().backends == (("GARSIDE",),)
+        assert choose_equality_backend(100, 10) == "GARSIDE"
+    finally:
+        set_equality_thresholds(DEFAULT_EQUALITY_THRESHOLDS)
+    with pytest.raises(ValueError):
+        set_equality_thresholds(EqualityThresholds((3,), (4, 8), (("GARSIDE",),)))
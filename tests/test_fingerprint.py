@@ -0,0 +1,70 @@
+import numpy as np
+
+from braidpy import Braid
+from braidpy.braid import t
+from braidpy.braid_collection import BraidCollection
+from braidpy.fingerprint import (
+    MERSENNE_PRIME_61,
+    FINGERPRINT_T_VALUES,
+    burau_matrices_mod_p,
+    mulmod,
+)
+
+
+def test_mulmod():
+    p = MERSENNE_PRIME_61
+    rng = np.random.default_rng(0)
+    a = rng.integers(0, p, size=1000, dtype=np.uint64)
+    b = rng.integers(0, p, size=1000, dtype=np.uint64)
+    expected = [int(x) * int(y) % p for x, y in zip(a, b)]
+    assert mulmod(a, b).tolist() == expected
+    assert mulmod(np.uint64(p - 1), np.uint64(p - 1)) == 1
+
+
+def test_burau_matrices_mod_p():
+    p = MERSENNE_PRIME_61
+    b = Braid([1, -2, 2, 2, -1], 3)
+    matrices = burau_matrices_mod_p(b.generators, b.n_strands)
+    t0 = FINGERPRINT_T_VALUES[0]
+    symbolic = b.to_matrix().subs(t, t0)
+    for i in range(3):
+        for j in range(3):
+            value = symbolic[i, j]
+            expected = int(value.p) * pow(int(value.q), p - 2, p) % p
+            assert int(matrices[0, i, j]) == expected
+
+
+def test_fingerprint():
+    assert Braid([1, 2, 1], 3).fingerprint() == Braid([2, 1, 2], 3).fingerprint()
+    assert Braid([1, 3], 4).fingerprint() == Braid([3, 1], 4).fingerprint()
+    assert Braid([1, -1, 0], 3).fingerprint() == Braid([], 3).fingerprint()
+    assert (
+        Braid([1, 4, 4, 1], 7).fingerprint()
+        == Braid([4, -5, 1, 1, 5, 4], 7).fingerprint()
+    )
+    assert (
+        Braid([1, 4, 4, 1], 7).fingerprint()
+        != Braid([4, -5, 1, 1, 6, 4], 7).fingerprint()
+    )
+    assert Braid([1, 2], 3).fingerprint() != Braid([2, 1], 3).fingerprint()
+    # Identities with different number of strands are not the same braid
+    assert Braid([], 3).fingerprint() != Braid([], 4).fingerprint()
+
+
+def test_braid_collection():
+    braids = [Braid([1, 2, 1], 3), Braid([], 3), Braid([2, 1, 2], 3), Braid([-1, 0], 3)]
+    collection = BraidCollection.from_braids(braids)
+    assert len(collection) == 4
+    assert collection.lengths.tolist() == [3, 0, 3, 2]
+    assert collection[0].word_eq(braids[0])
+    assert collection[-1].word_eq(braids[-1])
+    assert [b.generators for b in collection] == [b.generators for b in braids]
+    assert collection.padded().tolist() == [[1, 2, 1], [0, 0, 0], [2, 1, 2], [-1, 0, 0]]
+
+    padded = BraidCollection.from_padded(collection.padded(), 3)
+    # Trailing neutral elements are considered as padding
+    assert padded.lengths.tolist() == [3, 0, 3, 1]
+
+    assert collection.fingerprints().tolist() == [b.fingerprint() for b in braids]
+    buckets = collection.fingerprint_buckets()
+    assert sorted(buckets.values()) == [[0, 2], [1], [3]]
@@ -1,4 +1,9 @@
-from braidpy.garside_canonical_form import GarsideCanonicalFactors
+from braidpy import Braid
+from braidpy.garside_canonical_form import (
+    GarsideCanonicalFactors,
+    iter_simple_elements,
+    simple_elements,
+)
 
 
 def test_init():
@@ -8,10 +13,25 @@ def test_init():
 
 
 def test_floor():
+    full_twist = Braid([1, 2, 3] * 4, 4)
+    assert full_twist.get_canonical_factors().dehornoy_floor == 1
+    assert (full_twist**2).get_canonical_factors().dehornoy_floor == 2
+    assert (full_twist * Braid([-1], 4)).get_canonical_factors().dehornoy_floor == 0
+    assert (full_twist * Braid([2], 4)).get_canonical_factors().dehornoy_floor == 1
+    assert full_twist.inverse().get_canonical_factors().dehornoy_floor == -1
+    assert Braid([-3], 4).get_canonical_factors().dehornoy_floor == -1
+    assert Braid([], 4).get_canonical_factors().dehornoy_floor == 0
+    # inf and sup alone only say that the floor is between 0 and 2
     assert (
-        GarsideCanonicalFactors(n_half_twist=2, n_strands=5, Ai=[1, 2]).dehornoy_floor
-        == 1
-    )
+        Braid([1, 1, 2, 2, 3, 3, -1], 4) * full_twist
+    ).get_canonical_factors().dehornoy_floor == 1
+
+
+def test_inf_sup():
+    factors = Braid([1, -2, 3, 3], 4).get_canonical_factors()
+    assert factors.inf == factors.n_half_twist == -1
+    assert factors.sup - factors.inf == factors.canonical_length == 4
+    assert Braid(factors.to_generators(), 4) == Braid([1, -2, 3, 3], 4)
 
 
 def test_length():
@@ -19,3 +39,49 @@ def test_length():
         GarsideCanonicalFactors(n_half_twist=2, n_strands=5, Ai=[1, 2]).garside_length
         == 2
     )
+
+
+def test_simple_elements():
+    # Catalan numbers
+    assert [len(simple_elements(n)) for n in range(2, 8)] == [2, 5, 14, 42, 132, 429]
+    assert list(iter_simple_elements(5)) == list(simple_elements(5))
+    # The first ones come without building the Catalan(40) others, the identity first
+    assert not next(iter_simple_elements(40))
+
+
+def test_cycling():
+    # σ₁σ₂ is conjugate to δ = σ₂σ₁, cycling makes inf increase and decycling makes sup decrease
+    factors = Braid([1, 2], 3).get_canonical_factors()
+    assert (factors.n_half_twist, factors.garside_length) == (0, 2)
+    delta = Braid([2, 1], 3).get_canonical_factors()
+    assert factors.cycling().key == delta.key
+    assert factors.decycling().key == delta.key
+    assert delta.cycling() == delta
+
+    # Conjugating by the identity does nothing
+    assert factors.conjugate(simple_elements(3)[0]).key == factors.key
+
+
+def test_right_normal_form():
+    b = Braid([1, -2, 3, 3, -1, 2], 4)
+    factors = b.get_canonical_factors()
+    right = b.get_right_canonical_factors()
+    assert right.n_half_twist == factors.inf
+    assert len(right.Bi) == factors.canonical_length
+    assert Braid(right.to_generators(), 4) == b
+    assert factors.inverse().key == b.inverse().get_canonical_factors().key
+
+
+def test_symmetric_normal_form():
+    b = Braid([1, -2, 3, 3, -1, 2], 4)
+    symmetric = b.get_symmetric_canonical_factors()
+    assert symmetric.denominator.inf >= 0 and symmetric.numerator.inf >= 0
+    assert b.to_symmetric_normal_form() == b
+    # Cached per braid
+    assert b.get_symmetric_canonical_factors() is symmetric
+
+    positive = Braid([1, 2, 2], 3).get_symmetric_canonical_factors()
+    assert positive.denominator.key == Braid([], 3).get_canonical_factors().key
+    negative = Braid([-1, -2], 3).get_symmetric_canonical_factors()
+    assert negative.numerator.key == Braid([], 3).get_canonical_factors().key
+    assert Braid(negative.to_generators(), 3) == Braid([-1, -2], 3)
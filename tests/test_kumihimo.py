@@ -0,0 +1,70 @@
+import numpy as np
+import pytest
+
+from braidpy import Braid
+from braidpy.braidword import braidword_alpha_to_numeric
+from braidpy.kumihimo import (
+    EMPTY_SLOT,
+    KumihimoDisk,
+    MoveProgram,
+    crossing_generators,
+    program_annulus_braid,
+    program_braid,
+)
+
+# 1<->3 and 2<->4 crossing to the right, then to the left, as in demo_kumihimo.py
+FOUR_STRANDS = MoveProgram(
+    4, (((1, 3, 1),), ((2, 4, 1),), ((1, 3, -1),), ((2, 4, -1),))
+)
+
+
+def test_crossing_words():
+    assert crossing_generators(1, 3, 1) == braidword_alpha_to_numeric("Aba")
+    assert crossing_generators(4, 2, -1) == braidword_alpha_to_numeric("BCb")
+    assert crossing_generators(2, 3, -1) == [-2]
+    with pytest.raises(ValueError):
+        crossing_generators(2, 2, 1)
+    with pytest.raises(ValueError):
+        MoveProgram(4, (((1, 3, 1), (3, 4, 1)),))
+
+
+def test_braid_of_program():
+    demo = Braid(braidword_alpha_to_numeric("AbaBcbABaBCb"), 4)
+    assert program_braid(FOUR_STRANDS) == demo
+    assert program_braid(FOUR_STRANDS, 5) == demo**5
+    # Whole turns of the disk are full twists, and agree with the annulus braid
+    turned = MoveProgram(4, FOUR_STRANDS.steps, rotation=4)
+    assert program_braid(turned, 3) == (demo * Braid([1, 2, 3] * 4, 4)) ** 3
+    annulus = program_annulus_braid(turned, 3)
+    assert annulus.to_braid().forget_strand(1) == program_braid(turned, 3)
+    with pytest.raises(ValueError):
+        program_braid(MoveProgram(4, FOUR_STRANDS.steps, rotation=1))
+
+
+def test_empty_slots():
+    program = MoveProgram(6, (((1, 3, 1),), ((4, 6, -1),), ((2, 5, 1),)))
+    occupancy = np.array([0, EMPTY_SLOT, 1, 2, EMPTY_SLOT, 3])
+    braid = program_braid(program, 2, occupancy)
+    assert braid == Braid([1, -3, 1, -3], 4)
+    disk = KumihimoDisk(occupancy)
+    disk.run(program, 2)
+    assert disk.occupancy.tolist() == [0, EMPTY_SLOT, 1, 2, EMPTY_SLOT, 3]
+
+
+def test_simulation_of_disks():
+    program = MoveProgram(8, (((1, 5, 1), (3, 7, -1)), ((2, 6, 1),)), rotation=2)
+    disks = KumihimoDisk.full(8, 3)
+    history = disks.trajectory(program, 9)
+    assert history.shape == (10, 3, 8)
+    single = KumihimoDisk.full(8)
+    single.run(program, 9)
+    assert (history[-1] == single.occupancy).all()
+    assert single.occupancy.tolist() == [
+        p - 1 for p in program_annulus_braid(program, 9).permutation()
+    ]
+    assert single.n_steps == 27
+    stepped = KumihimoDisk.full(8)
+    for step in program.steps:
+        stepped.apply_step(step)
+    stepped.occupancy = np.roll(stepped.occupancy, -2)
+    assert stepped.occupancy.tolist() == history[1][0].tolist()
@@ -0,0 +1,74 @@
+import json
+import struct
+
+import numpy as np
+import pytest
+
+from braidpy import Braid
+from braidpy.material_braid import MaterialBraid, MaterialStrand
+from braidpy.mesh_export import braid_mesh, decimate, tube_mesh
+from braidpy.parametric_braid import ParametricBraid
+
+
+def test_tube_mesh():
+    points = np.array([[0, 0, 0], [0, 0, 0.5], [0, 0, 1.0]])
+    vertices, faces = tube_mesh(points, 0.1, n_sides=64)
+    assert vertices.shape == (3 * 64 + 2, 3)
+    # Closed and consistently oriented: every edge is used once in each direction
+    edges = np.concatenate([faces[:, [0, 1]], faces[:, [1, 2]], faces[:, [2, 0]]])
+    edge_set = set(map(tuple, edges.tolist()))
+    assert len(edge_set) == len(edges)
+    assert all((b, a) in edge_set for a, b in edge_set)
+    # Outward orientation gives a positive volume close to the cylinder one
+    tri = vertices[faces]
+    volume = np.einsum("ij,ij->i", tri[:, 0], np.cross(tri[:, 1], tri[:, 2])).sum() / 6
+    assert volume == pytest.approx(np.pi * 0.01, rel=1e-2)
+
+
+def test_decimate():
+    line = np.stack([np.zeros(9), np.zeros(9), np.linspace(0, 1, 9)], axis=1)
+    assert len(decimate(line, lod=1)) == 5
+    assert len(decimate(line, lod=3)) == 2
+    reduced = decimate(line, tolerance=1e-6)
+    assert len(reduced) < 9
+    assert reduced[0].tolist() == line[0].tolist()
+    assert reduced[-1].tolist() == line[-1].tolist()
+
+
+def test_material_radius():
+    s1 = MaterialStrand(lambda t: (0, 0, t), radius=0.05)
+    s2 = MaterialStrand(lambda t: (1, 0, t), radius=0.2)
+    mesh = braid_mesh((s1, s2), n_samples=10, n_sides=8)
+    assert len(mesh.groups) == 2
+    start, stop = mesh.groups[1]
+    used = np.unique(mesh.faces[start:stop])
+    distance = np.hypot(mesh.vertices[used, 0] - 1, mesh.vertices[used, 1])
+    assert distance.max() == pytest.approx(0.2, rel=1e-5)
+
+
+def test_export(tmp_path):
+    p = ParametricBraid(Braid([1, -2, 1], 3).to_parametric_strands())
+    mesh = braid_mesh(p.strands, n_samples=50)
+
+    obj = p.export_mesh(tmp_path / "braid.obj", n_sample=50)
+    lines = obj.read_text().splitlines()
+    assert sum(line.startswith("v ") for line in lines) == len(mesh.vertices)
+    assert sum(line.startswith("f ") for line in lines) == len(mesh.faces)
+    assert sum(line.startswith("o ") for line in lines) == 3
+
+    stl = p.export_mesh(tmp_path / "braid.stl", n_sample=50).read_bytes()
+    assert struct.unpack("<I", stl[80:84])[0] == len(mesh.faces)
+    assert len(stl) == 84 + 50 * len(mesh.faces)
+
+    glb = p.export_mesh(tmp_path / "braid.bin", mesh_format="glb", n_sample=50)
+    data = glb.read_bytes()
+    magic, version, length = struct.unpack("<4sII", data[:12])
+    assert (magic, version, length) == (b"glTF", 2, len(data))
+    json_length = struct.unpack("<I", data[12:16])[0]
+    gltf = json.loads(data[20 : 20 + json_length])
+    assert len(gltf["meshes"][0]["primitives"]) == 3
+    assert gltf["accessors"][0]["count"] == len(mesh.vertices)
+
+    s1 = MaterialStrand(lambda t: (0, 0, t), radius=0.05)
+    s2 = MaterialStrand(lambda t: (1, 0, t), radius=0.05)
+    assert MaterialBraid((s1, s2)).export_mesh(tmp_path / "m.stl", lod=2).exists()
@@ -1,9 +1,17 @@
 # Create braid σ₁ σ₂⁻¹ σ₁ on 3 strands
+import math
+
+import matplotlib.pyplot as plt
+import numpy as np
+import plotly.graph_objects as go
+import pytest
+
 from braidpy import Braid
 from braidpy.parametric_braid import (
     ParametricBraid,
+    Plotter,
 )
-from braidpy.parametric_strand import ParametricStrand
+from braidpy.parametric_strand import ADAPTIVE_MIN_SEGMENTS, ParametricStrand
 
 
 def test_conversion():
@@ -40,3 +48,56 @@ def test_braid_to_parametric_strands():
     p0 = strands[0].evaluate(0)
     assert isinstance(p0, tuple)
     assert len(p0) == 3
+
+
+def test_sample_adaptive():
+    strands = Braid((1, 0, 0, -2), n_strands=3).to_parametric_strands()
+    # Idle arcs are sampled by their two ends only
+    idle = Braid((1, 0, 0), n_strands=3).to_parametric_strands()[2]
+    assert len(idle.arcs) == 4
+    assert len(idle.sample_adaptive()) == 5
+    crossing = strands[0].sample_adaptive(tolerance=1e-3)
+    coarse = strands[0].sample_adaptive(tolerance=1e-2)
+    assert len(crossing) > len(coarse) > 5
+    assert tuple(crossing[0]) == strands[0].evaluate(0)
+    assert tuple(crossing[-1]) == strands[0].evaluate(1)
+    # Every sample lies on the strand
+    for t_point in crossing:
+        assert strands[0].evaluate(t_point[2]) == pytest.approx(tuple(t_point))
+
+    # Without known arcs, the strand is first cut into uniform segments
+    line = ParametricStrand(lambda t: (t, 0.0, t)).sample_adaptive()
+    assert len(line) == ADAPTIVE_MIN_SEGMENTS + 1
+
+
+def test_sample_adaptive_curved_without_arcs():
+    def func(t):
+        return math.sin(4 * math.pi * t), 0.0, t
+
+    points = ParametricStrand(func).sample_adaptive(tolerance=1e-3)
+    assert len(points) > ADAPTIVE_MIN_SEGMENTS + 1
+    # The polyline follows the curve between its samples
+    for a, b in zip(points[:-1], points[1:]):
+        middle = (a + b) / 2
+        assert math.dist(func(middle[2]), middle) < 1e-2
+
+
+def test_plot_batched(monkeypatch):
+    p = ParametricBraid(Braid((1, -2, 1), n_strands=3).to_parametric_strands())
+    points, strand_index = p.sample_batched()
+    assert np.isnan(points[:, 0]).sum() == 2
+    assert sorted(set(strand_index.tolist())) == [0, 1, 2]
+
+    traces = []
+    monkeypatch.setattr(
+        go.Figure, "show", lambda fig, *args, **kwargs: traces.extend(fig.data)
+    )
+    p.plot()
+    assert len(traces) == 1
+    assert len(traces[0].x) == len(points)
+    figures = []
+    monkeypatch.setattr(plt, "show", lambda *args, **kwargs: figures.append(plt.gcf()))
+    p.plot(plotter=Plotter.MATPLOTLIB, tolerance=None)
+    assert len(figures) == 1
+    assert len(figures[0].axes[0].collections) == 1
+    plt.close(figures[0])
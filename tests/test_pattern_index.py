@@ -0,0 +1,44 @@
+from braidpy import Braid
+from braidpy.braid_catalog import catalog_braid
+from braidpy.pattern_index import (
+    PatternIndex,
+    repeated_hash,
+    rolling_hash,
+)
+
+
+def test_repeated_hash():
+    word = [1, -2, 3, 3]
+    h = rolling_hash(word, 4)
+    assert repeated_hash(h, len(word), 1) == h
+    assert repeated_hash(h, len(word), 5) == rolling_hash(word * 5, 4)
+
+
+def test_query_word():
+    index = PatternIndex.from_catalog()
+    assert len(index) > 10
+    match = index.query(catalog_braid("square4") ** 7)
+    assert match.name == "square4"
+    assert match.n_repetitions == 7
+    assert match.same_word
+
+    # Zeros are ignored
+    match = index.query(Braid(catalog_braid("flat5").generators + [0], 5) ** 3)
+    assert match.name == "flat5"
+    assert match.n_repetitions == 3
+
+
+def test_query_braid():
+    index = PatternIndex(max_repetitions=8)
+    index.add("square4", catalog_braid("square4"))
+    index.add("weave", Braid([1, -2], 3))
+    # Same braid as the third power, written with an extra cancelling pair
+    gens = (catalog_braid("square4") ** 3).generators
+    b = Braid(gens[:4] + [3, -3] + gens[4:], 4)
+    match = index.query(b)
+    assert match.name == "square4"
+    assert match.n_repetitions == 3
+    assert not match.same_word
+
+    assert index.query(Braid([1, 2, 1], 3)) is None
+    assert index.query(Braid([], 3)) is None
@@ -0,0 +1,76 @@
+import numpy as np
+import pytest
+
+from braidpy import Braid
+from braidpy.pure_braid import (
+    CombedPureBraid,
+    CombingTooLong,
+    PureBraid,
+    batch_gassner_fingerprints,
+    gassner_fingerprint,
+    pure_generator_index,
+)
+from braidpy.random import pure_generator_words, random_pure_braids
+
+
+def test_generator_index_follows_generator_words():
+    pairs, _ = pure_generator_words(5)
+    assert [pure_generator_index(i, j) for i, j in pairs] == list(
+        range(1, len(pairs) + 1)
+    )
+    with pytest.raises(ValueError):
+        pure_generator_index(2, 2)
+
+
+def test_expansion_and_rewriting():
+    b = PureBraid.from_pairs([(1, 3, 1), (2, 4, -1)], 4)
+    assert b.pairs == [(1, 3, 1), (2, 4, -1)]
+    assert b.to_braid().word_eq(Braid([2, 1, 1, -2, 3, -2, -2, -3], 4))
+    assert PureBraid.from_braid(b.to_braid()).letters == b.letters
+    assert (b * b.inverse()).to_braid() == Braid([], 4)
+
+    for braid in random_pure_braids(20, (0, 15), 5, seed=4):
+        pure = braid.to_pure_braid()
+        assert pure.to_braid() == braid
+    with pytest.raises(ValueError):
+        Braid([1, 2], 3).to_pure_braid()
+
+
+def test_gassner_fingerprint_is_invariant():
+    braids = random_pure_braids(10, (1, 10), 4, seed=5)
+    words = braids.padded()
+    fingerprints = batch_gassner_fingerprints(words, 4)
+    for braid, fingerprint in zip(braids, fingerprints):
+        generators = braid.generators
+        # Insert trivial words: a braid relation and a commutation
+        k = len(generators) // 2
+        equivalent = (
+            generators[:k] + [1, 2, 1, -2, -1, -2] + generators[k:] + [3, 1, -3, -1]
+        )
+        assert gassner_fingerprint(generators, 4) == int(fingerprint)
+        assert gassner_fingerprint(equivalent, 4) == int(fingerprint)
+    assert gassner_fingerprint([1, 1], 3) != gassner_fingerprint([2, 2], 3)
+    assert hash(PureBraid([1, 2, 3], 3)) == hash(PureBraid([2, 3, 1], 3))
+
+
+def test_combing():
+    b = PureBraid.from_pairs([(1, 3, 1), (1, 2, 1)], 3)
+    combed = b.comb()
+    # A₁₃ is moved to the right of A₁₂, conjugated by A₁₂
+    assert [f.tolist() for f in combed.factors] == [[1], [1, 2, 1, -2, -1]]
+    assert combed.to_pure_braid() == b
+
+    for braid in random_pure_braids(20, (0, 12), 5, seed=6):
+        pure = braid.to_pure_braid()
+        combed = pure.comb()
+        assert len(combed.factors) == 4
+        assert combed.to_pure_braid().to_braid() == braid
+        assert combed.to_pure_braid().comb() == combed
+
+    assert PureBraid([], 4).comb() == CombedPureBraid(
+        4, [np.zeros(0, dtype=np.int64)] * 3
+    )
+    with pytest.raises(CombingTooLong):
+        (PureBraid.from_pairs([(1, 3, 1), (2, 3, 1), (1, 2, 1)], 3) ** 8).comb(
+            max_length=8
+        )
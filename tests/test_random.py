@@ -0,0 +1,51 @@
+from collections import Counter
+
+import numpy as np
+import pytest
+
+from braidpy.random import (
+    left_weighted_transitions,
+    random_normal_forms,
+    random_positive_words,
+    random_pure_braids,
+    random_words,
+)
+
+
+def test_random_words():
+    collection = random_words(100, 20, 4, seed=0)
+    assert len(collection) == 100
+    assert np.all(collection.lengths == 20)
+    assert set(np.unique(collection.generators)) == {-3, -2, -1, 1, 2, 3}
+
+    # Fixed seed gives the same words
+    again = random_words(100, 20, 4, seed=0)
+    assert np.array_equal(collection.generators, again.generators)
+
+    collection = random_positive_words(50, (0, 10), 3, seed=1)
+    assert collection.lengths.min() >= 0
+    assert collection.lengths.max() <= 10
+    assert np.all(collection.generators > 0)
+
+    with pytest.raises(ValueError):
+        random_words(10, 5, 1)
+
+
+def test_random_pure_braids():
+    collection = random_pure_braids(20, 6, 4, seed=2)
+    assert all(b.is_pure() for b in collection)
+
+
+def test_random_normal_forms():
+    collection = random_normal_forms(20, 3, 4, inf=(-2, 1), seed=3)
+    for b in collection:
+        factors = b.get_canonical_factors()
+        assert -2 <= factors.n_half_twist <= 1
+        assert factors.canonical_length == 3
+
+    # Each of the 6 normal forms of canonical length 2 in B3 is equally likely
+    assert left_weighted_transitions(3).sum() == 6
+    collection = random_normal_forms(6000, 2, 3, seed=4)
+    counts = Counter(tuple(collection.word(k)) for k in range(len(collection)))
+    assert len(counts) == 6
+    assert min(counts.values()) > 800
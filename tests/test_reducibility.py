@@ -0,0 +1,119 @@
+import time
+
+import pytest
+
+from braidpy import Braid
+from braidpy.conjugacy import SummitSetTooLarge
+from braidpy.dynnikov import dynnikov_action
+from braidpy.equality import braids_equal
+from braidpy.random import random_pure_braids
+from braidpy.reducibility import (
+    _curve_coordinates,
+    _round_blocks,
+    clear_reduction_curves_cache,
+    reducibility_analysis,
+)
+
+
+def test_irreducible_braids():
+    assert not Braid([1, -2], 3).is_reducible()
+    assert not Braid([1, -2, 3], 4).is_reducible()
+    assert Braid([1], 2).is_reducible().reducible is False
+    analysis = Braid([1, 2, 3], 4).is_reducible()
+    # No curve found is not a proof of irreducibility
+    assert analysis.reducible is None
+    assert analysis.tubes == [(1,), (2,), (3,), (4,)]
+    assert analysis.conjugate is None
+
+
+def test_split_and_cabled_braids():
+    # Strands 1, 2 braided together and strands 3, 4 braided together
+    analysis = Braid([1, -3, -3, 1], 4).is_reducible()
+    assert analysis
+    assert analysis.tubes == [(1, 2), (3, 4)]
+    # Two cables of two strands exchanged
+    assert Braid([2, 1, 3, 2, 1, 1], 4).is_reducible().tubes == [(1, 2), (3, 4)]
+
+
+def test_tubes_of_conjugated_braid():
+    c = Braid([2, -3, 1, 4, -2], 5)
+    inner = Braid([1, -2, 1, -2, 4, 4, 4], 5)
+    braid = c * inner * c.inverse()
+    clear_reduction_curves_cache()
+    analysis = reducibility_analysis(braid, coarsest=True)
+    final = c.perm()
+    assert analysis.tubes == sorted(
+        [tuple(sorted(final[p - 1] for p in (1, 2, 3))), tuple(sorted(final[3:]))]
+    )
+    # The conjugated curves are preserved by the braid
+    for block in analysis.curves:
+        curve = dynnikov_action(
+            analysis.conjugator.inverse().generators, 5, _curve_coordinates(block, 5)
+        )
+        assert list(dynnikov_action(braid.generators, 5, curve)) == list(curve)
+
+
+def test_work_is_bounded():
+    with pytest.raises(SummitSetTooLarge):
+        reducibility_analysis(Braid([1, -2, 3, -4, 1, -2], 5), max_size=2)
+
+
+def test_round_and_almost_round_curves():
+    # Consecutive punctures on the circle, possibly leaving out the one next to an end
+    assert _round_blocks(4) == (
+        (1, 2),
+        (1, 2, 3),
+        (1, 2, 4),
+        (1, 3),
+        (1, 3, 4),
+        (1, 4),
+        (2, 3),
+        (2, 3, 4),
+        (2, 4),
+        (3, 4),
+    )
+    assert len(_round_blocks(64)) <= 3 * 64**2
+
+
+def test_pure_braid_on_many_strands():
+    # Every round curve is its own orbit for a pure braid, whose checks are done in one pass on its word
+    braid = random_pure_braids(1, 40, 10, seed=3)[0]
+    start = time.perf_counter()
+    with pytest.raises(SummitSetTooLarge):
+        reducibility_analysis(braid, max_size=20)
+    assert time.perf_counter() - start < 20
+    # Two pure braids on 8 strands side by side
+    left, right = random_pure_braids(2, 12, 8, seed=2)
+    shifted = [g + 8 if g > 0 else g - 8 for g in right.generators]
+    split = Braid(list(left.generators) + shifted, 16)
+    assert split.is_reducible().tubes == [tuple(range(1, 9)), tuple(range(9, 17))]
+
+
+def test_curves_that_are_not_round_in_the_summit_set():
+    # These braids commute with σ₁², but no element of their super summit set has a round reduction curve
+    for word in ([2, 1, 1, 2, 3, -4], [1, 2, 1, 1, 2, 3, -4]):
+        braid = Braid(word, 5)
+        assert braids_equal((braid * Braid([1, 1], 5)).generators, [1, 1] + word, 5)
+        analysis = braid.is_reducible()
+        assert analysis
+        assert analysis.tubes == [(1, 2), (3,), (4,), (5,)]
+    analysis = Braid([-3, 1, 4, 1, -2, -1, -1, -2, -1, 3, -3], 5).is_reducible()
+    assert analysis.tubes == [(1, 2), (3,), (4,), (5,)]
+
+
+def test_conjugated_curve_preserving_braids():
+    # Words in σ₁, σ₂σ₁²σ₂, σ₃ and σ₄, preserving the round curve around punctures 1 and 2, then conjugated
+    cases = [
+        ([-1, 4, 4, -1, -1, -3], [4, -2, -1, -1, -2, -3, 4, 1, -1]),
+        ([2, -4, -3, 1, -4, 3], [-3, 4, 3, 2, 1, 1, 2, 1, 4]),
+        ([3, -1, -1, -1, -1, 1], [4, 3, -2, -1, -1, -2, 1, 2, 1, 1, 2, 2, 1, 1, 2]),
+        ([-2, 1, -3, -4, 2, -3], [3, -4, 4, -4, 2, 1, 1, 2, -4]),
+    ]
+    for conjugator, word in cases:
+        c = Braid(conjugator, 5)
+        braid = c * Braid(word, 5) * c.inverse()
+        analysis = braid.is_reducible()
+        tube = tuple(sorted(c.perm()[p - 1] for p in (1, 2)))
+        assert analysis.tubes == sorted(
+            [tube] + [(s,) for s in range(1, 6) if s not in tube]
+        )
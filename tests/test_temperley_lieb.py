@@ -0,0 +1,74 @@
+import numpy as np
+import pytest
+from sympy import expand, symbols
+
+from braidpy import Braid
+from braidpy.properties import jones_polynomial
+from braidpy.temperley_lieb import (
+    LaurentPolynomial,
+    compose_diagrams,
+    evaluate_jones_polynomial,
+    kauffman_bracket,
+    temperley_lieb_basis,
+)
+from braidpy.temperley_lieb import jones_polynomial as jones_coefficients
+
+t = symbols("t")
+
+
+def test_basis():
+    for n, catalan in [(1, 1), (2, 2), (3, 5), (4, 14), (6, 132)]:
+        assert len(temperley_lieb_basis(n)) == catalan
+    basis = temperley_lieb_basis(4)
+    # eᵢ² = d.eᵢ
+    e1 = basis.diagrams[basis.targets[0, 0]]
+    assert compose_diagrams(e1, e1) == (e1, 1)
+    assert set(basis.loops.ravel()) == {0, 1}
+
+
+def test_jones_of_knots():
+    assert expand(jones_polynomial(Braid([1, 1, 1], 2)) - (t + t**3 - t**4)) == 0
+    assert (
+        expand(jones_polynomial(Braid([-1, -1, -1], 2)) - (t**-1 + t**-3 - t**-4)) == 0
+    )
+    figure_eight = jones_polynomial(Braid([1, -2, 1, -2], 3))
+    assert expand(figure_eight - (t**2 - t + 1 - t**-1 + t**-2)) == 0
+    # Markov moves do not change the polynomial
+    assert jones_coefficients([1, 1, 1, 2], 3) == jones_coefficients([1, 1, 1], 2)
+    assert jones_coefficients([2, 1, -2, 1, 2], 3) == jones_coefficients(
+        [2, 2, 1, -2, 1], 3
+    )
+
+
+def test_jones_of_links():
+    # Positive Hopf link: -t^(1/2) - t^(5/2), in the variable t^(1/2)
+    assert jones_coefficients([1, 1], 2) == LaurentPolynomial((-1, 0, 0, 0, -1), 1)
+    # Unlink of 2 components: -t^(-1/2) - t^(1/2)
+    assert jones_coefficients([], 2) == LaurentPolynomial((-1, 0, -1), -1)
+    assert jones_coefficients([], 1) == LaurentPolynomial((1,), 0)
+    assert kauffman_bracket([1, -1], 2) == kauffman_bracket([], 2)
+
+
+def test_numeric_evaluation():
+    rng = np.random.default_rng(0)
+    for n, length in [(3, 12), (5, 40), (7, 60)]:
+        word = (rng.integers(1, n, length) * rng.choice([-1, 1], length)).tolist()
+        polynomial = jones_coefficients(word, n)
+        for value in [1.3, 0.6 + 0.7j]:
+            expected = polynomial(complex(value) ** 0.5)
+            assert evaluate_jones_polynomial(word, n, value) == pytest.approx(
+                expected, rel=1e-9
+            )
+
+
+def test_limbs_fallback(monkeypatch):
+    word = [1, -2, 3, 3, -1, 2, 2, -3, 1]
+    expected = jones_coefficients(word, 4)
+    long_word = word * 6
+    long_expected = jones_coefficients(long_word, 4)
+    monkeypatch.setattr("braidpy.temperley_lieb.TEMPERLEY_LIEB_INT64_BOUND", 1)
+    assert jones_coefficients(word, 4) == expected
+    # Several limbs of a few bits
+    monkeypatch.setattr("braidpy.temperley_lieb.TEMPERLEY_LIEB_LIMB_BITS", 3)
+    assert jones_coefficients(word, 4) == expected
+    assert jones_coefficients(long_word, 4) == long_expected
@@ -0,0 +1,43 @@
+import io
+
+from braidpy import Braid
+from braidpy.terminal_rendering import TerminalRenderer, strand_glyphs
+from braidpy.utils import colorize
+
+
+def test_strand_glyphs():
+    labels, over, under = strand_glyphs(3)
+    assert labels == (colorize(1), colorize(2), colorize(3))
+    assert over[1] == colorize(">", 1)
+    assert strand_glyphs(3) is strand_glyphs(3)
+
+
+def test_render(capsys):
+    b = Braid([1, -2, 0], 3)
+    b.draw()
+    expected = capsys.readouterr().out
+    assert len(expected.splitlines()) == 5
+
+    stream = io.StringIO()
+    # Small chunks to check that they are concatenated properly
+    n_lines = TerminalRenderer(3, stream=stream, chunk_lines=2).render(b.generators)
+    assert n_lines == 5
+    assert stream.getvalue() == expected
+
+
+def test_render_window():
+    b = Braid([1, 2, -1, 2, 1, -2], 3)
+    lines = list(TerminalRenderer(3).lines(b.generators))
+    window = list(TerminalRenderer(3).lines(b.generators, start=2, stop=4))
+    # Strands before generator 2, generators 2 and 3, strands after generator 3
+    assert window[1:3] == lines[3:5]
+    assert window[0] == " ".join(colorize(k) for k in b.permutations()[2])
+    assert len(window) == 4
+
+    overview = list(TerminalRenderer(3).lines(b.generators, step=2))
+    assert overview[1:-1] == lines[1:-1:2]
+    assert overview[-1] == lines[-1]
+
+    stream = io.StringIO()
+    assert b.draw(start=2, stop=4, stream=stream) == b
+    assert stream.getvalue() == "\n".join(window) + "\n"
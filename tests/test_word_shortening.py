@@ -0,0 +1,48 @@
+import itertools
+
+from braidpy import Braid
+from braidpy.word_shortening import (
+    ShorteningStage,
+    _relation_alternative,
+    shorten,
+    shortest_words_table,
+)
+
+
+def test_relation_alternative():
+    for a, b, c in itertools.product([1, -1, 2, -2], repeat=3):
+        alt = _relation_alternative(a, b, c)
+        if alt is not None:
+            assert Braid(list(alt), 3) == Braid([a, b, c], 3)
+    assert _relation_alternative(1, 3, 1) is None
+
+
+def test_shortest_words_table():
+    table = shortest_words_table(3, 3)
+    # σ₁σ₂σ₁ and σ₂σ₁σ₂ are the same braid, only one is kept
+    words = set(table.values())
+    assert ((1, 2, 1) in words) != ((2, 1, 2) in words)
+    assert all(len(word) <= 3 for word in table.values())
+
+
+def test_shorten():
+    b = Braid([1, 0, 3, -1, 2, 1, 2, -1, -2, -1, 3, -3], 4)
+    results = shorten(b)
+    assert results.verified and results.exact_check
+    assert results.braid.word_eq(Braid([3], 4))
+    assert results.saved == len(b) - 1
+
+    # Only the local search can shorten this word
+    b = Braid([-1, -1, 3, -2, -2, 1, 2, -1], 4)
+    results = shorten(b)
+    assert results.stage_lengths[ShorteningStage.RELATIONS] == 8
+    assert results.stage_lengths[ShorteningStage.LOCAL_SEARCH] == 6
+    assert results.n_replacements > 0
+    assert results.braid == b
+
+    # Commuting generators do not prevent cancellation
+    assert shorten(Braid([1, 3, 4, -1], 5)).braid.word_eq(Braid([3, 4], 5))
+
+    # Long words are checked with the fingerprint
+    results = shorten(Braid([1, -2, 3] * 40, 4), max_exact_check_length=10)
+    assert results.verified and not results.exact_check